@@ -4,8 +4,9 @@ It implements blockchain data retrieval, transaction management, and native asse
 through Web3.py integration and optional block explorer support.
 """
 
+from collections.abc import Sequence
 from decimal import Decimal
-from typing import cast
+from typing import Any, cast
 
 from eth_account.datastructures import SignedTransaction
 from eth_typing import BlockIdentifier
@@ -16,6 +17,7 @@ from financepype.operations.transactions.models import (
 from financepype.operators.blockchains.identifier import BlockchainIdentifier
 from financepype.platforms.blockchain import BlockchainType
 from web3 import AsyncWeb3
+from web3.contract.async_contract import AsyncContractFunction
 from web3.types import BlockData
 
 from blockchainpype.blockchain import Blockchain
@@ -103,6 +105,16 @@ class EthereumBlockchain(Blockchain):
     def explorer(self) -> EtherscanExplorer | None:
         return self._explorer
 
+    async def close(self) -> None:
+        """
+        Close the HTTP session held by the blockchain's explorer.
+
+        The session belongs to the running event loop, so this should be awaited
+        before that loop is closed.
+        """
+        if self._explorer is not None:
+            await self._explorer.close()
+
     # === Blockchain ===
 
     async def fetch_block_data(self, block_number: BlockIdentifier) -> BlockData:
@@ -157,6 +169,22 @@ class EthereumBlockchain(Blockchain):
         """
         return await self.web3.eth.get_transaction_count(address.raw)
 
+    async def call_batch(self, functions: Sequence[AsyncContractFunction]) -> list[Any]:
+        """
+        Call several contract functions in a single JSON-RPC batch request.
+
+        Args:
+            functions (Sequence[AsyncContractFunction]): Contract function calls bound
+                to this blockchain's Web3 instance
+
+        Returns:
+            list[Any]: The decoded call results, in the order of the functions
+        """
+        async with self.web3.batch_requests() as batch:
+            for function in functions:
+                batch.add(function)
+            return list(await batch.async_execute())
+
     # === Native Asset ===
 
     async def fetch_native_asset_balance(
@@ -4,6 +4,7 @@ It supports both legacy and EIP-1559 gas fee models, with configurable speed mod
 retry mechanisms for reliable gas estimation.
 """
 
+import asyncio
 import math
 from enum import Enum
 from functools import reduce
@@ -138,25 +139,20 @@ class GasConfiguration(BaseModel):
                 if percentiles is None:
                     raise ValueError("Invalid speed")
 
-                if transaction_params is None:
-                    gas = self.default_gas
-                else:
-                    if "gas" in transaction_params:
-                        gas = int(transaction_params["gas"])
-                    else:
-                        gas = int(await w3.eth.estimate_gas(transaction_params))
-
-                base_fee = (await w3.eth.get_block("pending")).get(
-                    "baseFeePerGas", None
+                # The gas limit, pending block and fee history are independent
+                # round-trips, so they are requested concurrently
+                gas, pending_block, fee_history = await asyncio.gather(
+                    self._get_gas_limit(w3, transaction_params),
+                    w3.eth.get_block("pending"),
+                    w3.eth.fee_history(self.n_blocks, "pending", percentiles),
                 )
+
+                base_fee = pending_block.get("baseFeePerGas", None)
                 if base_fee is None:
                     raise ValueError("Failed to retrieve base fee")
 
                 next_base_fee = base_fee * 2
 
-                fee_history = await w3.eth.fee_history(
-                    self.n_blocks, "pending", percentiles
-                )
                 reward_history = fee_history["reward"]
                 rewards = reduce(lambda x, y: x + y, reward_history)
                 avg_reward = sum(rewards) // len(rewards)
@@ -166,6 +162,7 @@ class GasConfiguration(BaseModel):
                     "maxPriorityFeePerGas": avg_reward,
                     "maxFeePerGas": avg_reward + next_base_fee,
                 }
+                break
             except Exception as e:
                 retries += 1
                 if retries >= n_max_retries:
@@ -201,20 +198,37 @@ class GasConfiguration(BaseModel):
         if gas_price_multiplier is None:
             raise ValueError("Invalid speed")
 
-        gas_price = int(await w3.eth.gas_price)
-        if transaction_params is None:
-            gas = self.default_gas
-        else:
-            if "gas" in transaction_params:
-                gas = int(transaction_params["gas"])
-            else:
-                gas = int(await w3.eth.estimate_gas(transaction_params))
+        gas_price, gas = await asyncio.gather(
+            w3.eth.gas_price,
+            self._get_gas_limit(w3, transaction_params),
+        )
 
         return {
             "gas": int(math.ceil(gas * 1.3)),
             "gasPrice": int(math.ceil(gas_price * gas_price_multiplier)),
         }
 
+    async def _get_gas_limit(
+        self,
+        w3: AsyncWeb3[Any],
+        transaction_params: TxParams | None = None,
+    ) -> int:
+        """
+        Get the gas limit of a transaction before the safety margin is applied.
+
+        Args:
+            w3 (AsyncWeb3[Any]): Web3 instance for blockchain interaction
+            transaction_params (TxParams | None): Optional transaction parameters
+
+        Returns:
+            int: The explicit gas limit, the node estimate or the default gas
+        """
+        if transaction_params is None:
+            return self.default_gas
+        if "gas" in transaction_params:
+            return int(transaction_params["gas"])
+        return int(await w3.eth.estimate_gas(transaction_params))
+
     @staticmethod
     def max_gas_payable(gas_fees: dict[str, int]) -> int:
         """
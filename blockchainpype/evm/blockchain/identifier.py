@@ -4,7 +4,8 @@ including addresses, transaction hashes, and block hashes. These classes handle
 the validation, conversion, and string representation of Ethereum identifiers.
 """
 
-from typing import Any
+from typing import Any, Self, cast
+from weakref import WeakValueDictionary
 
 from eth_typing import ChecksumAddress
 from financepype.operators.blockchains.identifier import BlockchainIdentifier
@@ -12,6 +13,11 @@ from hexbytes import HexBytes
 from pydantic import Field
 from web3 import AsyncWeb3
 
+# Live addresses by (class, string), so repeated parsing skips the keccak checksum
+_interned_addresses: WeakValueDictionary[
+    tuple[type["EthereumAddress"], str], "EthereumAddress"
+] = WeakValueDictionary()
+
 
 class EthereumAddress(BlockchainIdentifier):
     """
@@ -28,6 +34,30 @@ class EthereumAddress(BlockchainIdentifier):
     raw: ChecksumAddress
     string: str
 
+    @classmethod
+    def from_string(cls, value: str) -> Self:
+        """
+        Create an address from its string representation.
+
+        Identifiers are immutable, so the same string resolves to the same
+        instance for as long as it is referenced, and is checksummed once.
+
+        Args:
+            value (str): The address string to convert
+
+        Returns:
+            Self: The address identifier
+
+        Raises:
+            ValueError: If the address string is invalid
+        """
+        key = (cls, value)
+        identifier = _interned_addresses.get(key)
+        if identifier is None:
+            identifier = super().from_string(value)
+            _interned_addresses[key] = identifier
+        return cast(Self, identifier)
+
     @classmethod
     def is_valid(cls, value: Any) -> bool:
         """
@@ -59,10 +89,10 @@ class EthereumAddress(BlockchainIdentifier):
         Raises:
             ValueError: If the address string is invalid
         """
-        if not cls.is_valid(value):
-            raise ValueError(f"Invalid wallet id: {value}")
-
-        return AsyncWeb3.to_checksum_address(value)
+        try:
+            return AsyncWeb3.to_checksum_address(value)
+        except ValueError as exc:
+            raise ValueError(f"Invalid wallet id: {value}") from exc
 
     @classmethod
     def id_to_string(cls, value: ChecksumAddress) -> str:
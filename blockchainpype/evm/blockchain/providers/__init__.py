@@ -1,4 +1,11 @@
+from .batching import BatchingHTTPProvider
+from .fast_json import FastJSONHTTPProvider
 from .limited import LimitedHTTPProvider
 from .multiple import MultipleHTTPProvider
 
-__all__ = ["LimitedHTTPProvider", "MultipleHTTPProvider"]
+__all__ = [
+    "BatchingHTTPProvider",
+    "FastJSONHTTPProvider",
+    "LimitedHTTPProvider",
+    "MultipleHTTPProvider",
+]
@@ -0,0 +1,96 @@
+import asyncio
+from typing import Any
+
+from web3 import AsyncHTTPProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+
+class BatchingHTTPProvider(AsyncJSONBaseProvider):
+    """Coalesce concurrent requests into JSON-RPC batches sent by an inner provider.
+
+    Requests are queued for up to ``batch_wait_seconds``, or until
+    ``batch_max_count`` of them are pending, and then sent as a single batch.
+    A request that is alone in its window is sent as a regular request.
+    """
+
+    def __init__(
+        self,
+        provider: AsyncHTTPProvider,
+        batch_max_count: int = 10,
+        batch_wait_seconds: float = 0.005,
+    ) -> None:
+        super().__init__()
+
+        self.provider = provider
+        self.batch_max_count = batch_max_count
+        self.batch_wait_seconds = batch_wait_seconds
+
+        self._pending: list[tuple[RPCEndpoint, Any, asyncio.Future[RPCResponse]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[RPCResponse] = loop.create_future()
+        self._pending.append((method, params, future))
+
+        if len(self._pending) >= self.batch_max_count:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_wait_seconds, self._flush)
+
+        return await future
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        # Explicit batches are already coalesced by the caller
+        return await self.provider.make_batch_request(requests)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        # Keep a reference to the running batch until it completes
+        batch = asyncio.ensure_future(self._send(pending))
+        self._batches.add(batch)
+        batch.add_done_callback(self._batches.discard)
+
+    async def _send(
+        self, pending: list[tuple[RPCEndpoint, Any, asyncio.Future[RPCResponse]]]
+    ) -> None:
+        futures = [future for _, _, future in pending]
+        try:
+            if len(pending) == 1:
+                method, params, _ = pending[0]
+                responses = [await self.provider.make_request(method, params)]
+            else:
+                batch_response = await self.provider.make_batch_request(
+                    [(method, params) for method, params, _ in pending]
+                )
+                # A failed batch is answered with a single error response
+                if isinstance(batch_response, list):
+                    responses = batch_response
+                else:
+                    responses = [batch_response] * len(pending)
+
+            if len(responses) != len(futures):
+                raise ValueError(
+                    f"Batch returned {len(responses)} responses for {len(futures)} requests"
+                )
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, response in zip(futures, responses, strict=True):
+            # Callers may have been cancelled while the batch was in flight
+            if not future.done():
+                future.set_result(response)
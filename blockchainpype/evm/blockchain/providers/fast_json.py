@@ -0,0 +1,29 @@
+import json
+from collections.abc import Callable
+from typing import Any, cast
+
+from web3 import AsyncHTTPProvider
+from web3.types import RPCResponse
+
+# orjson decodes RPC responses noticeably faster than the stdlib decoder
+try:
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+class FastJSONHTTPProvider(AsyncHTTPProvider):
+    """HTTP provider decoding JSON-RPC responses with orjson when it is installed.
+
+    Responses orjson cannot decode (e.g. integers wider than 64 bits) fall back to
+    the default web3 decoder, so the decoded values are always the same.
+    """
+
+    @staticmethod
+    def decode_rpc_response(raw_response: bytes) -> RPCResponse:
+        try:
+            return cast(RPCResponse, _json_loads(raw_response))
+        except ValueError:
+            return AsyncHTTPProvider.decode_rpc_response(raw_response)
@@ -1,9 +1,13 @@
-from typing import Any
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
 
 from web3 import AsyncHTTPProvider
 from web3.providers.async_base import AsyncJSONBaseProvider
 from web3.types import RPCEndpoint, RPCResponse
 
+T = TypeVar("T")
+
 
 class MultipleHTTPProvider(AsyncJSONBaseProvider):
     _logger = None
@@ -15,7 +19,10 @@ class MultipleHTTPProvider(AsyncJSONBaseProvider):
         retrieval_providers: list[AsyncHTTPProvider],
         execution_providers: list[AsyncHTTPProvider] | None = None,
         max_attempts: int = 3,
+        race_providers: bool = False,
     ) -> None:
+        super().__init__()
+
         self.retrieval_providers = retrieval_providers
         self.current_retrieval_provider = retrieval_providers[0]
 
@@ -25,6 +32,8 @@ class MultipleHTTPProvider(AsyncJSONBaseProvider):
         self.current_execution_provider = execution_providers[0]
 
         self.max_attempts = max_attempts
+        # Send read requests to every retrieval provider and keep the first answer
+        self.race_providers = race_providers
 
     def get_next_provider(self, method: RPCEndpoint) -> None:
         providers = (
@@ -51,13 +60,48 @@ class MultipleHTTPProvider(AsyncJSONBaseProvider):
 
         self.logger.info(f"Switched to provider {provider.endpoint_uri}")
 
+    def is_retrieval_method(self, method: RPCEndpoint) -> bool:
+        return method in self.public_methods or "get" in method
+
     def get_provider(self, method: RPCEndpoint) -> AsyncHTTPProvider:
-        if method in self.public_methods or "get" in method:
+        if self.is_retrieval_method(method):
             return self.current_retrieval_provider
         else:
             return self.current_execution_provider
 
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return await self._request_with_fallback(
+            method, lambda provider: provider.make_request(method, params)
+        )
+
+    async def make_batch_request(
+        self, requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        # Route the whole batch as its first state-changing call, if any
+        method = next(
+            (
+                request_method
+                for request_method, _ in requests
+                if self.get_provider(request_method) is self.current_execution_provider
+            ),
+            requests[0][0],
+        )
+        return await self._request_with_fallback(
+            method, lambda provider: provider.make_batch_request(requests)
+        )
+
+    async def _request_with_fallback(
+        self,
+        method: RPCEndpoint,
+        send: Callable[[AsyncHTTPProvider], Awaitable[T]],
+    ) -> T:
+        if (
+            self.race_providers
+            and len(self.retrieval_providers) > 1
+            and self.is_retrieval_method(method)
+        ):
+            return await self._race_providers(method, send)
+
         tried_providers = set()
         exception = None
         retry = True
@@ -79,7 +123,7 @@ class MultipleHTTPProvider(AsyncJSONBaseProvider):
                 self.logger.debug(
                     f"Trying provider {provider.endpoint_uri} for method {method}..."
                 )
-                response = await provider.make_request(method, params)
+                response = await send(provider)
                 retry = False
             except Exception as e:
                 self.logger.error(
@@ -98,3 +142,43 @@ class MultipleHTTPProvider(AsyncJSONBaseProvider):
         if response is None:
             raise RuntimeError("No response received from any provider")
         return response
+
+    async def _race_providers(
+        self,
+        method: RPCEndpoint,
+        send: Callable[[AsyncHTTPProvider], Awaitable[T]],
+    ) -> T:
+        tasks: dict[asyncio.Future[T], AsyncHTTPProvider] = {
+            asyncio.ensure_future(send(provider)): provider
+            for provider in self.retrieval_providers
+        }
+        exception: BaseException | None = None
+
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    provider = tasks[task]
+                    task_exception = task.exception()
+                    if task_exception is None:
+                        # Prefer the fastest provider if racing is turned off later
+                        self.current_retrieval_provider = provider
+                        return task.result()
+
+                    self.logger.error(
+                        f"Error making request to {provider.endpoint_uri} for method {method}: {type(task_exception)}"
+                    )
+                    exception = task_exception
+        finally:
+            for task in tasks:
+                task.cancel()
+            # Collect the losing requests so their errors are not reported as
+            # never retrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if exception is None:
+            raise RuntimeError("No response received from any provider")
+        raise exception
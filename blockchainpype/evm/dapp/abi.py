@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 from abc import abstractmethod
@@ -15,6 +16,31 @@ from blockchainpype.evm.blockchain.identifier import EthereumAddress
 from blockchainpype.evm.explorer.etherscan import EtherscanExplorer
 
 
+# ABI files are static, so each one is read and parsed at most once per process
+# and the parsed ABI is shared by every EthereumLocalFileABI pointing at it
+@functools.cache
+def _load_abi_file(file_path: str) -> list[Any] | dict[str, Any]:
+    with open(file_path) as file:
+        data: Any = json.load(file)
+
+    # Handle Hardhat artifact format
+    if isinstance(data, dict) and "abi" in data:
+        abi: list[Any] | dict[str, Any] = data["abi"]
+        return abi
+
+    # Handle direct ABI array format
+    if isinstance(data, list):
+        return data
+
+    # If it's a dict but not a Hardhat artifact, assume it's the ABI itself
+    if isinstance(data, dict):
+        return data
+
+    raise ValueError(
+        f"Invalid ABI format in file {file_path}. Expected list or object with 'abi' field."
+    )
+
+
 class EthereumABI(BaseModel):
     """
     Abstract base class for Ethereum ABI handling.
@@ -97,25 +123,7 @@ class EthereumLocalFileABI(EthereumABI):
             json.JSONDecodeError: If the file contains invalid JSON
             KeyError: If the file doesn't contain a valid ABI structure
         """
-        with open(self.file_path) as file:
-            data: Any = json.load(file)
-
-            # Handle Hardhat artifact format
-            if isinstance(data, dict) and "abi" in data:
-                abi: list[Any] | dict[str, Any] = data["abi"]
-                return abi
-
-            # Handle direct ABI array format
-            if isinstance(data, list):
-                return data
-
-            # If it's a dict but not a Hardhat artifact, assume it's the ABI itself
-            if isinstance(data, dict):
-                return data
-
-            raise ValueError(
-                f"Invalid ABI format in file {self.file_path}. Expected list or object with 'abi' field."
-            )
+        return _load_abi_file(os.path.abspath(self.file_path))
 
 
 class EthereumEtherscanABI(EthereumABI):
@@ -4,13 +4,15 @@ It implements contract configuration, initialization, and function calling capab
 through Web3.py's AsyncContract interface.
 """
 
-from typing import cast
+from typing import Any, cast
+from weakref import WeakKeyDictionary
 
 from financepype.operators.dapps.dapp import (
     DecentralizedApplication,
     DecentralizedApplicationConfiguration,
 )
 from pydantic import ConfigDict
+from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 from web3.contract.async_contract import AsyncContractFunctions
 
@@ -18,6 +20,27 @@ from blockchainpype.evm.blockchain.blockchain import EthereumBlockchain
 from blockchainpype.evm.blockchain.identifier import EthereumAddress
 from blockchainpype.evm.dapp.abi import EthereumABI
 
+MAX_CONTRACT_FACTORIES = 256
+
+# Contract factory classes per Web3 instance, keyed by ABI object. Local ABI files are
+# parsed once and shared, so contracts with the same ABI reuse one factory instead of
+# rebuilding its function classes on every initialization. The ABI is kept alongside
+# the factory so its id cannot be reused while the entry exists.
+_contract_factories: WeakKeyDictionary[
+    AsyncWeb3[Any], dict[int, tuple[Any, type[AsyncContract]]]
+] = WeakKeyDictionary()
+
+
+def _get_contract_factory(web3: AsyncWeb3[Any], abi: Any) -> type[AsyncContract]:
+    factories = _contract_factories.setdefault(web3, {})
+    entry = factories.get(id(abi))
+    if entry is None:
+        if len(factories) >= MAX_CONTRACT_FACTORIES:
+            del factories[next(iter(factories))]
+        entry = (abi, web3.eth.contract(abi=abi))
+        factories[id(abi)] = entry
+    return entry[1]
+
 
 class EthereumContractConfiguration(DecentralizedApplicationConfiguration):
     """
@@ -138,6 +161,5 @@ class EthereumSmartContract(DecentralizedApplication):
             return
 
         abi = await self.configuration.abi_configuration.get_abi()
-        self._contract = self.blockchain.web3.eth.contract(
-            address=self.address.raw, abi=abi
-        )
+        contract_factory = _get_contract_factory(self.blockchain.web3, abi)
+        self._contract = contract_factory(address=self.address.raw)
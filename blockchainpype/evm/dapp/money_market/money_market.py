@@ -3,8 +3,6 @@ EVM-specific implementation of money market protocols.
 Provides base classes for implementing money market protocols on EVM-compatible chains.
 """
 
-from typing import cast
-
 from blockchainpype.dapps.money_market import MoneyMarket, MoneyMarketConfiguration
 from blockchainpype.evm.blockchain.blockchain import EthereumBlockchain
 
@@ -18,14 +16,19 @@ class EVMMoneyMarketConfiguration(MoneyMarketConfiguration):
 class EVMMoneyMarket(MoneyMarket):
     """EVM-specific money market implementation."""
 
+    # Narrowed once here so the typed properties read the attributes set by the
+    # base classes directly, without going through super() and cast()
+    _configuration: EVMMoneyMarketConfiguration
+    _blockchain: EthereumBlockchain
+
     def __init__(self, configuration: EVMMoneyMarketConfiguration):
         super().__init__(configuration)
 
     @property
     def configuration(self) -> EVMMoneyMarketConfiguration:
-        return cast(EVMMoneyMarketConfiguration, super().configuration)
+        return self._configuration
 
     @property
     def blockchain(self) -> EthereumBlockchain:
         """Get the EVM blockchain instance."""
-        return cast(EthereumBlockchain, super().blockchain)
+        return self._blockchain
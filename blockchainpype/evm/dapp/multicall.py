@@ -0,0 +1,106 @@
+"""
+This module provides an interface to the Multicall aggregator contract, which executes
+several read-only contract calls in a single `eth_call`. The canonical Multicall3
+deployment shares its address across most EVM networks and is backwards compatible
+with the Multicall2 interface used here.
+"""
+
+from collections.abc import Sequence
+from typing import Any
+
+from eth_utils.abi import get_abi_output_types
+from pydantic import Field
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.async_contract import AsyncContractFunction
+
+from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.dapp.abi import EthereumABI, EthereumLocalFileABI
+from blockchainpype.evm.dapp.contract import (
+    EthereumContractConfiguration,
+    EthereumSmartContract,
+)
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+class MulticallConfiguration(EthereumContractConfiguration):
+    """
+    Configuration for the Multicall aggregator contract.
+
+    Attributes:
+        address (EthereumAddress): The aggregator address, defaults to Multicall3
+        abi_configuration (EthereumABI): ABI configuration, defaults to Multicall2 ABI
+    """
+
+    address: EthereumAddress = Field(
+        default_factory=lambda: EthereumAddress.from_string(MULTICALL3_ADDRESS)
+    )
+    abi_configuration: EthereumABI = Field(
+        default_factory=lambda: EthereumLocalFileABI(file_name="Multicall2.json")
+    )
+
+
+class Multicall(EthereumSmartContract):
+    """
+    Aggregates read-only contract calls into a single round-trip.
+
+    Calls are regular Web3 contract function calls (e.g.
+    `contract.functions.decimals()`); they are encoded locally, executed through
+    the aggregator and decoded with the same normalization as a direct `call()`.
+    """
+
+    async def try_aggregate(
+        self,
+        calls: Sequence[AsyncContractFunction],
+        require_success: bool = False,
+    ) -> list[Any]:
+        """
+        Execute the calls in a single `tryAggregate` request.
+
+        Args:
+            calls (Sequence[AsyncContractFunction]): The contract function calls
+            require_success (bool): Whether a single failing call reverts the batch
+
+        Returns:
+            list[Any]: The decoded results in call order, None for failed calls
+        """
+        if not calls:
+            return []
+
+        encoded_calls = [
+            (call.address, call._encode_transaction_data()) for call in calls
+        ]
+        results = await self.functions.tryAggregate(
+            require_success, encoded_calls
+        ).call()
+
+        return [
+            self.decode_result(call, success, return_data)
+            for call, (success, return_data) in zip(calls, results, strict=True)
+        ]
+
+    @staticmethod
+    def decode_result(
+        call: AsyncContractFunction, success: bool, return_data: bytes
+    ) -> Any:
+        """
+        Decode the return data of an aggregated call.
+
+        Args:
+            call (AsyncContractFunction): The contract function call
+            success (bool): Whether the call succeeded
+            return_data (bytes): The raw ABI-encoded return data
+
+        Returns:
+            Any: The decoded result, a tuple for multiple outputs, None on failure
+        """
+        if not success or not return_data:
+            return None
+
+        output_types = get_abi_output_types(call.abi)
+        decoded = call.w3.codec.decode(output_types, return_data)
+        normalized = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, decoded)
+        if len(normalized) == 1:
+            return normalized[0]
+        return tuple(normalized)
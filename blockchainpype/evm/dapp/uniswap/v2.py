@@ -1,13 +1,20 @@
+import time
+from collections.abc import Awaitable, Callable, Sequence
 from decimal import Decimal
-from typing import cast
+from typing import NamedTuple, cast
 
+from eth_abi.abi import encode
+from eth_hash.auto import keccak
 from financepype.assets.blockchain import BlockchainAsset
 from financepype.platforms.blockchain import BlockchainPlatform
-from web3.types import TxParams
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import TxParams, Wei
 
 from blockchainpype.dapps.router.dex import ProtocolImplementation
 from blockchainpype.dapps.router.models import SwapHop, SwapMode, SwapRoute
-from blockchainpype.evm.asset import EthereumAsset
+from blockchainpype.evm.asset import EthereumAsset, EthereumAssetData
 from blockchainpype.evm.blockchain.blockchain import (
     EthereumBlockchain,
     EthereumBlockchainType,
@@ -18,45 +25,116 @@ from blockchainpype.evm.dapp.contract import (
     EthereumContractConfiguration,
     EthereumSmartContract,
 )
+from blockchainpype.evm.dapp.erc20 import ERC20Token
+from blockchainpype.evm.dapp.multicall import Multicall
 from blockchainpype.evm.transaction import EthereumTransaction
 from blockchainpype.evm.wallet.wallet import EthereumWallet
 
+_DEFAULT_SLIPPAGE = Decimal("0.005")  # 0.5% default slippage
+_UNISWAP_V2_FEE = Decimal("0.003")  # 0.3% Uniswap V2 fee
+_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+UNISWAP_V2_PAIR_INIT_CODE_HASH = (
+    "0x96e8ac4277198ff8b6f785478aa9a39f403cb768dd02cbee326c3e7da348845f"
+)
+
+
+class _SwapModeStrategy(NamedTuple):
+    """Mode-specific pieces of quoting and encoding a Uniswap V2 swap."""
+
+    selector: bytes
+    amount_limits: Callable[[SwapHop, Decimal, int, int], tuple[int, int]]
+    quote: Callable[[Decimal, int, int, int, int], Awaitable[tuple[Decimal, Decimal]]]
+
 
 class UniswapV2(ProtocolImplementation):
     """Uniswap V2 protocol implementation for DEX routing."""
 
+    _FACTORY_ABI = EthereumLocalFileABI(file_name="UniswapV2Factory.json")
+    _ROUTER_ABI = EthereumLocalFileABI(file_name="UniswapV2Router02.json")
+    _PAIR_ABI = EthereumLocalFileABI(file_name="UniswapV2Pair.json")
+    _ETHEREUM_PLATFORM = BlockchainPlatform(
+        identifier="ethereum",
+        type=EthereumBlockchainType,
+        chain_id=1,
+    )
+
+    # Router swap functions share the same argument layout:
+    # (amount, amount limit, path, recipient, deadline)
+    _SWAP_ARGUMENT_TYPES = ("uint256", "uint256", "address[]", "address", "uint256")
+    _EXACT_INPUT_SELECTOR = keccak(
+        b"swapExactTokensForTokens(uint256,uint256,address[],address,uint256)"
+    )[:4]
+    _EXACT_OUTPUT_SELECTOR = keccak(
+        b"swapTokensForExactTokens(uint256,uint256,address[],address,uint256)"
+    )[:4]
+
     def __init__(
-        self, blockchain: EthereumBlockchain, factory_address: str, router_address: str
+        self,
+        blockchain: EthereumBlockchain,
+        factory_address: str,
+        router_address: str,
+        default_slippage: Decimal = _DEFAULT_SLIPPAGE,
+        fee: Decimal = _UNISWAP_V2_FEE,
+        pair_init_code_hash: str | None = None,
+        multicall: Multicall | None = None,
     ):
         self.blockchain = blockchain
         self.factory_address = factory_address
         self.router_address = router_address
-
-        # Load ABIs from common directory
-        factory_abi = EthereumLocalFileABI(file_name="UniswapV2Factory.json")
-        router_abi = EthereumLocalFileABI(file_name="UniswapV2Router02.json")
-
-        ethereum_platform = BlockchainPlatform(
-            identifier="ethereum",
-            type=EthereumBlockchainType,
-            chain_id=1,
+        self.default_slippage = default_slippage
+        self.fee = fee
+        self.multicall = multicall
+
+        # When the pair init code hash is known, pair addresses are derived
+        # locally via CREATE2 instead of querying the factory
+        self._factory_bytes = bytes(HexBytes(factory_address))
+        self._pair_init_code_hash = (
+            bytes(HexBytes(pair_init_code_hash))
+            if pair_init_code_hash is not None
+            else None
         )
 
-        self.factory_contract = EthereumSmartContract(
+        self.factory_contract = self._build_contract(factory_address, self._FACTORY_ABI)
+        self.router_contract = self._build_contract(router_address, self._ROUTER_ABI)
+        self._pair_contracts: dict[str, EthereumSmartContract] = {}
+        self._router_checksum_address = AsyncWeb3.to_checksum_address(router_address)
+
+        # Mode-specific quoting and swap encoding, resolved once per instance
+        self._mode_dispatch = {
+            SwapMode.EXACT_INPUT: _SwapModeStrategy(
+                selector=self._EXACT_INPUT_SELECTOR,
+                amount_limits=self._exact_input_limits,
+                quote=self._quote_exact_input,
+            ),
+            SwapMode.EXACT_OUTPUT: _SwapModeStrategy(
+                selector=self._EXACT_OUTPUT_SELECTOR,
+                amount_limits=self._exact_output_limits,
+                quote=self._quote_exact_output,
+            ),
+        }
+
+    @classmethod
+    def _build_contract(
+        cls, address: str, abi: EthereumLocalFileABI
+    ) -> EthereumSmartContract:
+        """Create a contract bound to the Uniswap V2 platform."""
+        return EthereumSmartContract(
             EthereumContractConfiguration(
-                address=EthereumAddress.from_string(factory_address),
-                abi_configuration=factory_abi,
-                platform=ethereum_platform,
+                address=EthereumAddress.from_string(address),
+                abi_configuration=abi,
+                platform=cls._ETHEREUM_PLATFORM,
             )
         )
 
-        self.router_contract = EthereumSmartContract(
-            EthereumContractConfiguration(
-                address=EthereumAddress.from_string(router_address),
-                abi_configuration=router_abi,
-                platform=ethereum_platform,
-            )
-        )
+    async def _get_pair_contract(self, pair_address: str) -> EthereumSmartContract:
+        """Get the initialized contract for a pair, creating it on first use."""
+        pair_contract = self._pair_contracts.get(pair_address)
+        if pair_contract is None:
+            pair_contract = self._build_contract(pair_address, self._PAIR_ABI)
+            await pair_contract.initialize()
+            self._pair_contracts[pair_address] = pair_contract
+        return pair_contract
 
     async def _ensure_contracts_initialized(self) -> None:
         """Ensure factory and router contracts are initialized."""
@@ -73,54 +151,29 @@ class UniswapV2(ProtocolImplementation):
         mode: SwapMode = SwapMode.EXACT_INPUT,
     ) -> SwapRoute:
         """Get a quote for swapping between two assets on Uniswap V2."""
+        strategy = self._get_mode_strategy(mode)
         input_asset = cast(EthereumAsset, input_asset)
         output_asset = cast(EthereumAsset, output_asset)
 
-        # Ensure asset data is initialized
-        if input_asset.data is None:
-            await input_asset.initialize_data()
-        if output_asset.data is None:
-            await output_asset.initialize_data()
+        # Get raw reserves, ordered as (input, output); this also loads asset data
+        reserve_in, reserve_out = await self.get_reserves_raw(input_asset, output_asset)
 
         # Assert data is not None after initialization
         assert input_asset.data is not None, "Input asset data should be initialized"
         assert output_asset.data is not None, "Output asset data should be initialized"
 
-        # Get pair address
-        pair_address = await self._get_pair(input_asset, output_asset)
-        if (
-            not pair_address
-            or pair_address == "0x0000000000000000000000000000000000000000"
-        ):
-            raise ValueError(
-                f"No pair found for {input_asset.data.symbol}/{output_asset.data.symbol}"
-            )
-
-        # Get reserves
-        reserve_a, reserve_b = await self.get_reserves(input_asset, output_asset)
-
-        if mode == SwapMode.EXACT_INPUT:
-            # Calculate output amount using Uniswap V2 formula: x * y = k
-            input_amount_raw = int(amount * (10**input_asset.data.decimals))
-            output_amount_raw = await self._get_amount_out(
-                input_amount_raw, reserve_a, reserve_b
-            )
-            output_amount = Decimal(output_amount_raw) / (
-                10**output_asset.data.decimals
-            )
-        else:
-            # Calculate input amount for exact output
-            output_amount_raw = int(amount * (10**output_asset.data.decimals))
-            input_amount_raw = await self._get_amount_in(
-                output_amount_raw, reserve_a, reserve_b
-            )
-            amount = Decimal(input_amount_raw) / (10**input_asset.data.decimals)
-            output_amount = amount
+        input_amount, output_amount = await strategy.quote(
+            amount,
+            input_asset.data.decimals,
+            output_asset.data.decimals,
+            reserve_in,
+            reserve_out,
+        )
 
         # Create swap hop
         swap_hop = SwapHop(
             input_asset=input_asset,
-            input_amount=amount,
+            input_amount=input_amount,
             output_asset=output_asset,
             output_amount=output_amount,
             are_amounts_raw=False,
@@ -128,17 +181,38 @@ class UniswapV2(ProtocolImplementation):
 
         return SwapRoute(
             input_asset=input_asset,
-            input_amount=amount,
+            input_amount=input_amount,
             output_asset=output_asset,
             output_amount=output_amount,
             are_amounts_raw=False,
             sequence=[swap_hop],
             mode=mode,
-            max_slippage=Decimal("0.005"),  # 0.5% default slippage
-            taxes=Decimal("0.003"),  # 0.3% Uniswap V2 fee
+            max_slippage=self.default_slippage,
+            taxes=self.fee,
             protocol="uniswap_v2",
         )
 
+    async def quote_swap_path(
+        self, path: Sequence[EthereumAsset], amount_in_raw: int
+    ) -> list[int]:
+        """Quote a multi-hop exact-input swap with a single router call.
+
+        Args:
+            path: The assets to swap through, starting with the input asset
+            amount_in_raw: The unscaled input amount
+
+        Returns:
+            list[int]: The unscaled amounts for each asset in the path
+        """
+        if len(path) < 2:
+            raise ValueError("Swap path must contain at least two assets")
+
+        await self._ensure_contracts_initialized()
+        amounts: list[int] = await self.router_contract.functions.getAmountsOut(
+            amount_in_raw, [asset.address.raw for asset in path]
+        ).call()
+        return amounts
+
     async def get_reserves(
         self,
         asset_a: BlockchainAsset,
@@ -148,61 +222,61 @@ class UniswapV2(ProtocolImplementation):
         asset_a = cast(EthereumAsset, asset_a)
         asset_b = cast(EthereumAsset, asset_b)
 
-        # Ensure asset data is initialized
-        if asset_a.data is None:
-            await asset_a.initialize_data()
-        if asset_b.data is None:
-            await asset_b.initialize_data()
+        reserve_a, reserve_b = await self.get_reserves_raw(asset_a, asset_b)
+
+        # Assert data is not None after initialization
+        assert asset_a.data is not None, "Asset A data should be initialized"
+        assert asset_b.data is not None, "Asset B data should be initialized"
+
+        return (
+            Decimal(reserve_a) / (10**asset_a.data.decimals),
+            Decimal(reserve_b) / (10**asset_b.data.decimals),
+        )
+
+    async def get_reserves_raw(
+        self,
+        asset_a: EthereumAsset,
+        asset_b: EthereumAsset,
+    ) -> tuple[int, int]:
+        """Get the current unscaled reserves for a pair of assets, in asset order."""
+        if self.multicall is not None:
+            pair_address = await self._bootstrap_quote(asset_a, asset_b)
+        else:
+            # Ensure asset data is initialized
+            if asset_a.data is None:
+                await asset_a.initialize_data()
+            if asset_b.data is None:
+                await asset_b.initialize_data()
+
+            pair_address = await self._get_pair(asset_a, asset_b)
 
         # Assert data is not None after initialization
         assert asset_a.data is not None, "Asset A data should be initialized"
         assert asset_b.data is not None, "Asset B data should be initialized"
 
-        pair_address = await self._get_pair(asset_a, asset_b)
-        if (
-            not pair_address
-            or pair_address == "0x0000000000000000000000000000000000000000"
-        ):
+        if not pair_address or pair_address == _ZERO_ADDRESS:
             raise ValueError(
                 f"No pair found for {asset_a.data.symbol}/{asset_b.data.symbol}"
             )
 
-        # Create pair contract
-        pair_abi = EthereumLocalFileABI(file_name="UniswapV2Pair.json")
-        ethereum_platform = BlockchainPlatform(
-            identifier="ethereum",
-            type=EthereumBlockchainType,
-            chain_id=1,
-        )
+        pair_contract = await self._get_pair_contract(pair_address)
 
-        pair_contract = EthereumSmartContract(
-            EthereumContractConfiguration(
-                address=EthereumAddress.from_string(pair_address),
-                abi_configuration=pair_abi,
-                platform=ethereum_platform,
+        # Get reserves and token0 from the pair contract in one round-trip, or
+        # with two calls when the endpoint does not support JSON-RPC batches
+        get_reserves = pair_contract.functions.getReserves()
+        get_token0 = pair_contract.functions.token0()
+        try:
+            reserves, token0 = await pair_contract.blockchain.call_batch(
+                [get_reserves, get_token0]
             )
-        )
-
-        # Initialize pair contract
-        await pair_contract.initialize()
-
-        # Get reserves from pair contract
-        reserves = await pair_contract.functions.getReserves().call()
+        except Exception:
+            reserves = await get_reserves.call()
+            token0 = await get_token0.call()
         reserve0, reserve1, _ = reserves
 
-        # Determine which asset is token0 and token1
-        token0 = await pair_contract.functions.token0().call()
-
         if asset_a.address.raw.lower() == token0.lower():
-            return (
-                Decimal(reserve0) / (10**asset_a.data.decimals),
-                Decimal(reserve1) / (10**asset_b.data.decimals),
-            )
-        else:
-            return (
-                Decimal(reserve1) / (10**asset_a.data.decimals),
-                Decimal(reserve0) / (10**asset_b.data.decimals),
-            )
+            return reserve0, reserve1
+        return reserve1, reserve0
 
     async def build_swap_transaction(  # type: ignore[override]
         self,
@@ -230,57 +304,36 @@ class UniswapV2(ProtocolImplementation):
         assert input_asset.data is not None, "Input asset data should be initialized"
         assert output_asset.data is not None, "Output asset data should be initialized"
 
-        # Calculate minimum amount out with slippage protection
-        min_amount_out = int(
-            hop.output_amount
-            * (1 - route.max_slippage)
-            * (10**output_asset.data.decimals)
-        )
-
         # Calculate deadline (20 minutes from now)
-        deadline = int(self.blockchain.current_timestamp) + (20 * 60)
+        deadline = int(time.time()) + (20 * 60)
 
         # Use wallet address as recipient if not specified
         if recipient is None:
             recipient = wallet.address.raw
 
-        if route.mode == SwapMode.EXACT_INPUT:
-            # swapExactTokensForTokens
-            amount_in = int(hop.input_amount * (10**input_asset.data.decimals))
-            path = [input_asset.address, output_asset.address]
-
-            function_name = "swapExactTokensForTokens"
-            args = [amount_in, min_amount_out, path, recipient, deadline]
-        else:
-            # swapTokensForExactTokens
-            amount_out = int(hop.output_amount * (10**output_asset.data.decimals))
-            max_amount_in = int(
-                hop.input_amount
-                * (1 + route.max_slippage)
-                * (10**input_asset.data.decimals)
-            )
-            path = [input_asset.address, output_asset.address]
-
-            function_name = "swapTokensForExactTokens"
-            args = [amount_out, max_amount_in, path, recipient, deadline]
+        path = [input_asset.address.raw, output_asset.address.raw]
 
-        # Ensure contracts are initialized
-        await self._ensure_contracts_initialized()
+        # Swap amount and its slippage-protected limit for the route mode
+        strategy = self._get_mode_strategy(route.mode)
+        amount, amount_limit = strategy.amount_limits(
+            hop,
+            route.max_slippage,
+            input_asset.data.decimals,
+            output_asset.data.decimals,
+        )
 
-        # Build transaction using Web3 contract function
-        if function_name == "swapExactTokensForTokens":
-            contract_function = self.router_contract.functions.swapExactTokensForTokens(
-                *args
-            )
-        elif function_name == "swapTokensForExactTokens":
-            contract_function = self.router_contract.functions.swapTokensForExactTokens(
-                *args
-            )
-        else:
-            raise ValueError(f"Unsupported function: {function_name}")
+        # Encode the router call directly from the precomputed selector
+        calldata = strategy.selector + encode(
+            self._SWAP_ARGUMENT_TYPES,
+            [amount, amount_limit, path, recipient, deadline],
+        )
 
         # Build the transaction using wallet's build_transaction method
-        return await wallet.build_transaction(function=contract_function)
+        return await wallet.build_transaction(
+            tx_data=TxParams(
+                {"to": self._router_checksum_address, "data": calldata, "value": Wei(0)}
+            )
+        )
 
     async def create_swap_transaction(
         self,
@@ -301,9 +354,11 @@ class UniswapV2(ProtocolImplementation):
             EthereumTransaction: The created and signed transaction ready for broadcast
         """
         if client_operation_id is None:
-            input_asset_id = cast(EthereumAsset, route.input_asset).address.raw[:8]
-            output_asset_id = cast(EthereumAsset, route.output_asset).address.raw[:8]
-            client_operation_id = f"uniswap_v2_swap_{input_asset_id}_{output_asset_id}"
+            input_address = cast(EthereumAsset, route.input_asset).address.raw
+            output_address = cast(EthereumAsset, route.output_asset).address.raw
+            client_operation_id = (
+                f"uniswap_v2_swap_{input_address[:8]}_{output_address[:8]}"
+            )
 
         # Build the transaction parameters
         tx_params = await self.build_swap_transaction(route, wallet, recipient)
@@ -350,39 +405,152 @@ class UniswapV2(ProtocolImplementation):
             client_operation_id=client_operation_id,
         )
 
+    async def _bootstrap_quote(
+        self, asset_a: EthereumAsset, asset_b: EthereumAsset
+    ) -> str:
+        """Load missing token metadata and the pair address in a single multicall."""
+        assert self.multicall is not None, "Multicall should be configured"
+
+        await self._ensure_contracts_initialized()
+        if not self.multicall.is_initialized:
+            await self.multicall.initialize()
+
+        tokens = [
+            asset
+            for asset in (asset_a, asset_b)
+            if asset.data is None and isinstance(asset, ERC20Token)
+        ]
+        calls: list[AsyncContractFunction] = []
+        for token in tokens:
+            if not token.contract.is_initialized:
+                await token.contract.initialize()
+            functions = token.contract.functions
+            calls.extend((functions.name(), functions.symbol(), functions.decimals()))
+        if self._pair_init_code_hash is None:
+            calls.append(
+                self.factory_contract.functions.getPair(
+                    asset_a.address.raw, asset_b.address.raw
+                )
+            )
+
+        results = await self.multicall.try_aggregate(calls)
+
+        for index, token in enumerate(tokens):
+            name, symbol, decimals = results[index * 3 : index * 3 + 3]
+            if name is not None and symbol is not None and decimals is not None:
+                token.data = EthereumAssetData(
+                    name=name, symbol=symbol, decimals=decimals
+                )
+
+        # Assets the multicall could not resolve fall back to their own loader
+        for asset in (asset_a, asset_b):
+            if asset.data is None:
+                await asset.initialize_data()
+
+        if self._pair_init_code_hash is not None:
+            return self.compute_pair_address(asset_a, asset_b)
+        return cast(str, results[-1] or "")
+
+    def compute_pair_address(
+        self, asset_a: EthereumAsset, asset_b: EthereumAsset
+    ) -> str:
+        """Derive the CREATE2 address of the pair for two assets."""
+        if self._pair_init_code_hash is None:
+            raise ValueError("Pair init code hash is not configured")
+
+        token0, token1 = sorted(
+            (bytes(HexBytes(asset_a.address.raw)), bytes(HexBytes(asset_b.address.raw)))
+        )
+        salt = keccak(token0 + token1)
+        digest = keccak(
+            b"\xff" + self._factory_bytes + salt + self._pair_init_code_hash
+        )
+        return AsyncWeb3.to_checksum_address(digest[12:])
+
     async def _get_pair(self, asset_a: EthereumAsset, asset_b: EthereumAsset) -> str:
         """Get the pair address for two assets."""
+        if self._pair_init_code_hash is not None:
+            return self.compute_pair_address(asset_a, asset_b)
+
         await self._ensure_contracts_initialized()
         result: str = await self.factory_contract.functions.getPair(
             asset_a.address.raw, asset_b.address.raw
         ).call()
         return result
 
+    def _get_mode_strategy(self, mode: SwapMode) -> "_SwapModeStrategy":
+        """Get the quoting and encoding strategy for a swap mode."""
+        strategy = self._mode_dispatch.get(mode)
+        if strategy is None:
+            raise ValueError(f"Unsupported swap mode: {mode}")
+        return strategy
+
+    async def _quote_exact_input(
+        self,
+        amount: Decimal,
+        input_decimals: int,
+        output_decimals: int,
+        reserve_in: int,
+        reserve_out: int,
+    ) -> tuple[Decimal, Decimal]:
+        """Quote the output amount for an exact input amount."""
+        # Calculate output amount using Uniswap V2 formula: x * y = k
+        output_amount_raw = await self._get_amount_out(
+            int(amount * (10**input_decimals)), reserve_in, reserve_out
+        )
+        return amount, Decimal(output_amount_raw) / (10**output_decimals)
+
+    async def _quote_exact_output(
+        self,
+        amount: Decimal,
+        input_decimals: int,
+        output_decimals: int,
+        reserve_in: int,
+        reserve_out: int,
+    ) -> tuple[Decimal, Decimal]:
+        """Quote the input amount required for an exact output amount."""
+        input_amount_raw = await self._get_amount_in(
+            int(amount * (10**output_decimals)), reserve_in, reserve_out
+        )
+        return Decimal(input_amount_raw) / (10**input_decimals), amount
+
+    @staticmethod
+    def _exact_input_limits(
+        hop: SwapHop, max_slippage: Decimal, input_decimals: int, output_decimals: int
+    ) -> tuple[int, int]:
+        """Get (amountIn, amountOutMin) for swapExactTokensForTokens."""
+        return (
+            int(hop.input_amount * (10**input_decimals)),
+            int(hop.output_amount * (1 - max_slippage) * (10**output_decimals)),
+        )
+
+    @staticmethod
+    def _exact_output_limits(
+        hop: SwapHop, max_slippage: Decimal, input_decimals: int, output_decimals: int
+    ) -> tuple[int, int]:
+        """Get (amountOut, amountInMax) for swapTokensForExactTokens."""
+        return (
+            int(hop.output_amount * (10**output_decimals)),
+            int(hop.input_amount * (1 + max_slippage) * (10**input_decimals)),
+        )
+
     async def _get_amount_out(
-        self, amount_in: int, reserve_in: Decimal, reserve_out: Decimal
+        self, amount_in: int, reserve_in: int, reserve_out: int
     ) -> int:
         """Calculate output amount using Uniswap V2 formula."""
-        # Convert reserves to int for calculation
-        reserve_in_int = int(reserve_in)
-        reserve_out_int = int(reserve_out)
-
         # Uniswap V2 formula: amount_out = (amount_in * 997 * reserve_out) / (reserve_in * 1000 + amount_in * 997)
         amount_in_with_fee = amount_in * 997
-        numerator = amount_in_with_fee * reserve_out_int
-        denominator = reserve_in_int * 1000 + amount_in_with_fee
+        numerator = amount_in_with_fee * reserve_out
+        denominator = reserve_in * 1000 + amount_in_with_fee
 
         return numerator // denominator
 
     async def _get_amount_in(
-        self, amount_out: int, reserve_in: Decimal, reserve_out: Decimal
+        self, amount_out: int, reserve_in: int, reserve_out: int
     ) -> int:
         """Calculate input amount required for exact output using Uniswap V2 formula."""
-        # Convert reserves to int for calculation
-        reserve_in_int = int(reserve_in)
-        reserve_out_int = int(reserve_out)
-
         # Uniswap V2 formula: amount_in = (reserve_in * amount_out * 1000) / ((reserve_out - amount_out) * 997) + 1
-        numerator = reserve_in_int * amount_out * 1000
-        denominator = (reserve_out_int - amount_out) * 997
+        numerator = reserve_in * amount_out * 1000
+        denominator = (reserve_out - amount_out) * 997
 
         return (numerator // denominator) + 1
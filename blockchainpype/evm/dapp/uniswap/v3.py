@@ -1,9 +1,17 @@
+import asyncio
+import functools
+import time
 from decimal import Decimal
-from typing import cast
+from typing import Any, cast
 
+from eth_abi.abi import encode
+from eth_hash.auto import keccak
 from financepype.assets.blockchain import BlockchainAsset
 from financepype.platforms.blockchain import BlockchainPlatform
-from web3.types import TxParams
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import TxParams, Wei
 
 from blockchainpype.dapps.router.dex import ProtocolImplementation
 from blockchainpype.dapps.router.models import SwapHop, SwapMode, SwapRoute
@@ -18,62 +26,141 @@ from blockchainpype.evm.dapp.contract import (
     EthereumContractConfiguration,
     EthereumSmartContract,
 )
+from blockchainpype.evm.dapp.multicall import Multicall
 from blockchainpype.evm.transaction import EthereumTransaction
 from blockchainpype.evm.wallet.wallet import EthereumWallet
 
+_ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+_ZERO_WORD = bytes(32)
+
+# Init code hash of the canonical Uniswap V3 pool, used to derive pool addresses
+UNISWAP_V3_POOL_INIT_CODE_HASH = (
+    "0xe34f199b19b2b4f47f68442619d555527d244f78a3297ea89325f843f87b8b54"
+)
+
+
+def _address_word(address: str) -> bytes:
+    """Left-pad a hex address to a 32-byte ABI word."""
+    return bytes.fromhex(address[2:]).rjust(32, b"\x00")
+
+
+@functools.lru_cache(maxsize=64)
+def _pow10(exponent: int) -> int:
+    """Get the integer scale for a token with the given number of decimals."""
+    scale: int = 10**exponent
+    return scale
+
 
 class UniswapV3(ProtocolImplementation):
     """Uniswap V3 protocol implementation for DEX routing."""
 
+    _FACTORY_ABI = EthereumLocalFileABI(file_name="uniswap_v3/UniswapV3Factory.json")
+    _ROUTER_ABI = EthereumLocalFileABI(file_name="uniswap_v3/ISwapRouter.json")
+    _QUOTER_ABI = EthereumLocalFileABI(file_name="uniswap_v3/IQuoter.json")
+    _POOL_ABI = EthereumLocalFileABI(file_name="uniswap_v3/UniswapV3Pool.json")
+    _ETHEREUM_PLATFORM = BlockchainPlatform(
+        identifier="ethereum",
+        type=EthereumBlockchainType,
+        chain_id=1,
+    )
+
+    # Read-only calls are encoded from precomputed selectors, skipping the
+    # per-call ABI lookup of Web3 contract functions
+    _GET_POOL_ARGUMENT_TYPES = ("address", "address", "uint24")
+    _GET_POOL_SELECTOR = keccak(b"getPool(address,address,uint24)")[:4]
+    _QUOTE_EXACT_INPUT_SELECTOR = keccak(
+        b"quoteExactInputSingle(address,address,uint24,uint256,uint160)"
+    )[:4]
+    _QUOTE_EXACT_OUTPUT_SELECTOR = keccak(
+        b"quoteExactOutputSingle(address,address,uint24,uint256,uint160)"
+    )[:4]
+    _LIQUIDITY_SELECTOR = keccak(b"liquidity()")[:4]
+
+    # ExactInputSingleParams and ExactOutputSingleParams share the same layout
+    _SWAP_PARAMS_TYPE = (
+        "(address,address,uint24,address,uint256,uint256,uint256,uint160)"
+    )
+    _EXACT_INPUT_SINGLE_SELECTOR = keccak(
+        f"exactInputSingle({_SWAP_PARAMS_TYPE})".encode()
+    )[:4]
+    _EXACT_OUTPUT_SINGLE_SELECTOR = keccak(
+        f"exactOutputSingle({_SWAP_PARAMS_TYPE})".encode()
+    )[:4]
+
     def __init__(
         self,
         blockchain: EthereumBlockchain,
         factory_address: str,
         router_address: str,
         quoter_address: str,
+        multicall: Multicall | None = None,
+        pool_init_code_hash: str | None = None,
+        min_liquidity: int = 0,
     ):
         self.blockchain = blockchain
         self.factory_address = factory_address
         self.router_address = router_address
         self.quoter_address = quoter_address
+        self.multicall = multicall
+
+        # When the pool init code hash is known, candidate pool addresses are
+        # derived locally via CREATE2 instead of querying the factory
+        self._factory_bytes = bytes(HexBytes(factory_address))
+        self._pool_init_code_hash = (
+            bytes(HexBytes(pool_init_code_hash))
+            if pool_init_code_hash is not None
+            else None
+        )
 
-        # Load ABIs from common directory
-        factory_abi = EthereumLocalFileABI(file_name="uniswap_v3/UniswapV3Factory.json")
-        router_abi = EthereumLocalFileABI(file_name="uniswap_v3/ISwapRouter.json")
-        quoter_abi = EthereumLocalFileABI(file_name="uniswap_v3/IQuoter.json")
+        self.factory_contract = self._build_contract(factory_address, self._FACTORY_ABI)
+        self.router_contract = self._build_contract(router_address, self._ROUTER_ABI)
+        self.quoter_contract = self._build_contract(quoter_address, self._QUOTER_ABI)
+        self._factory_checksum_address = AsyncWeb3.to_checksum_address(factory_address)
+        self._router_checksum_address = AsyncWeb3.to_checksum_address(router_address)
+        self._quoter_checksum_address = AsyncWeb3.to_checksum_address(quoter_address)
 
-        ethereum_platform = BlockchainPlatform(
-            identifier="ethereum",
-            type=EthereumBlockchainType,
-            chain_id=1,
-        )
+        # Pools are immutable once deployed, so their addresses and contracts
+        # are cached for the lifetime of the instance
+        self._pool_addresses: dict[tuple[str, str, int], str] = {}
+        self._pool_contracts: dict[str, EthereumSmartContract] = {}
 
-        self.factory_contract = EthereumSmartContract(
-            EthereumContractConfiguration(
-                address=EthereumAddress.from_string(factory_address),
-                abi_configuration=factory_abi,
-                platform=ethereum_platform,
-            )
-        )
+        # Common fee tiers for Uniswap V3
+        self.fee_tiers = [100, 500, 3000, 10000]  # 0.01%, 0.05%, 0.3%, 1%
 
-        self.router_contract = EthereumSmartContract(
-            EthereumContractConfiguration(
-                address=EthereumAddress.from_string(router_address),
-                abi_configuration=router_abi,
-                platform=ethereum_platform,
-            )
-        )
+        # Pools below this active liquidity are not quoted (0 disables the check)
+        self.min_liquidity = min_liquidity
 
-        self.quoter_contract = EthereumSmartContract(
+    @classmethod
+    def _build_contract(
+        cls, address: str, abi: EthereumLocalFileABI
+    ) -> EthereumSmartContract:
+        """Create a contract bound to the Uniswap V3 platform."""
+        return EthereumSmartContract(
             EthereumContractConfiguration(
-                address=EthereumAddress.from_string(quoter_address),
-                abi_configuration=quoter_abi,
-                platform=ethereum_platform,
+                address=EthereumAddress.from_string(address),
+                abi_configuration=abi,
+                platform=cls._ETHEREUM_PLATFORM,
             )
         )
 
-        # Common fee tiers for Uniswap V3
-        self.fee_tiers = [100, 500, 3000, 10000]  # 0.01%, 0.05%, 0.3%, 1%
+    async def _get_pool_contract(self, pool_address: str) -> EthereumSmartContract:
+        """Get the initialized contract for a pool, creating it on first use."""
+        pool_contract = self._pool_contracts.get(pool_address)
+        if pool_contract is None:
+            pool_contract = self._build_contract(pool_address, self._POOL_ABI)
+            await pool_contract.initialize()
+            self._pool_contracts[pool_address] = pool_contract
+        return pool_contract
+
+    async def _resolve_assets(
+        self, asset_a: BlockchainAsset, asset_b: BlockchainAsset
+    ) -> tuple[EthereumAsset, EthereumAsset]:
+        """Initialize the data of both assets concurrently where it is missing."""
+        assets = (cast(EthereumAsset, asset_a), cast(EthereumAsset, asset_b))
+        await asyncio.gather(
+            *[asset.initialize_data() for asset in assets if asset.data is None]
+        )
+        return assets
 
     async def _ensure_contracts_initialized(self) -> None:
         """Ensure factory, router, and quoter contracts are initialized."""
@@ -92,72 +179,46 @@ class UniswapV3(ProtocolImplementation):
         mode: SwapMode = SwapMode.EXACT_INPUT,
     ) -> SwapRoute:
         """Get a quote for swapping between two assets on Uniswap V3."""
-        input_asset = cast(EthereumAsset, input_asset)
-        output_asset = cast(EthereumAsset, output_asset)
-
         # Ensure asset data is initialized
-        if input_asset.data is None:
-            await input_asset.initialize_data()
-        if output_asset.data is None:
-            await output_asset.initialize_data()
-        # Assert data is not None after initialization
+        input_asset, output_asset = await self._resolve_assets(
+            input_asset, output_asset
+        )
         assert input_asset.data is not None, "Input asset data should be initialized"
         assert output_asset.data is not None, "Output asset data should be initialized"
 
         # Ensure contracts are initialized
         await self._ensure_contracts_initialized()
 
-        # Find the best pool across different fee tiers
+        input_scale = _pow10(input_asset.data.decimals)
+        output_scale = _pow10(output_asset.data.decimals)
+        if mode == SwapMode.EXACT_INPUT:
+            amount_raw = int(amount * input_scale)
+            quote_scale = output_scale
+        else:
+            amount_raw = int(amount * output_scale)
+            quote_scale = input_scale
+
+        if self.multicall is not None:
+            fee_tier_quotes = await self._quote_fee_tiers_multicall(
+                input_asset, output_asset, amount_raw, mode
+            )
+        else:
+            fee_tier_quotes = await self._quote_fee_tiers(
+                input_asset, output_asset, amount_raw, mode
+            )
+
+        # Keep the best quote (highest output for exact input, lowest input for exact output)
         best_quote = None
         best_fee_tier = None
-
-        for fee_tier in self.fee_tiers:
-            try:
-                # Check if pool exists
-                pool_address = await self._get_pool(input_asset, output_asset, fee_tier)
-                if (
-                    not pool_address
-                    or pool_address == "0x0000000000000000000000000000000000000000"
-                ):
-                    continue
-
-                # Get quote for this fee tier
-                if mode == SwapMode.EXACT_INPUT:
-                    amount_raw = int(amount * (10**input_asset.data.decimals))
-                    quote_raw = (
-                        await self.quoter_contract.functions.quoteExactInputSingle(
-                            input_asset.address.raw,
-                            output_asset.address.raw,
-                            fee_tier,
-                            amount_raw,
-                            0,  # sqrtPriceLimitX96 (0 = no limit)
-                        ).call()
-                    )
-                    quote_amount = Decimal(quote_raw) / (10**output_asset.data.decimals)
-                else:
-                    amount_raw = int(amount * (10**output_asset.data.decimals))
-                    quote_raw = (
-                        await self.quoter_contract.functions.quoteExactOutputSingle(
-                            input_asset.address.raw,
-                            output_asset.address.raw,
-                            fee_tier,
-                            amount_raw,
-                            0,  # sqrtPriceLimitX96 (0 = no limit)
-                        ).call()
-                    )
-                    quote_amount = Decimal(quote_raw) / (10**input_asset.data.decimals)
-
-                # Keep the best quote (highest output for exact input, lowest input for exact output)
-                if (
-                    best_quote is None
-                    or (mode == SwapMode.EXACT_INPUT and quote_amount > best_quote)
-                    or (mode == SwapMode.EXACT_OUTPUT and quote_amount < best_quote)
-                ):
-                    best_quote = quote_amount
-                    best_fee_tier = fee_tier
-
-            except Exception:
-                continue
+        for fee_tier, quote_raw in fee_tier_quotes:
+            quote_amount = Decimal(quote_raw) / quote_scale
+            if (
+                best_quote is None
+                or (mode == SwapMode.EXACT_INPUT and quote_amount > best_quote)
+                or (mode == SwapMode.EXACT_OUTPUT and quote_amount < best_quote)
+            ):
+                best_quote = quote_amount
+                best_fee_tier = fee_tier
 
         if best_quote is None or best_fee_tier is None:
             raise ValueError(
@@ -200,87 +261,56 @@ class UniswapV3(ProtocolImplementation):
         asset_b: BlockchainAsset,
     ) -> tuple[Decimal, Decimal]:
         """Get the current liquidity for a pair of assets (approximation using 0.3% pool)."""
-        asset_a = cast(EthereumAsset, asset_a)
-        asset_b = cast(EthereumAsset, asset_b)
-
         # Ensure asset data is initialized
-        if asset_a.data is None:
-            await asset_a.initialize_data()
-        if asset_b.data is None:
-            await asset_b.initialize_data()
-        # Assert data is not None after initialization
+        asset_a, asset_b = await self._resolve_assets(asset_a, asset_b)
         assert asset_a.data is not None, "Asset A data should be initialized"
         assert asset_b.data is not None, "Asset B data should be initialized"
 
-        # Try to find a pool in the most common fee tier (0.3%)
-        pool_address = await self._get_pool(asset_a, asset_b, 3000)
-        if (
-            not pool_address
-            or pool_address == "0x0000000000000000000000000000000000000000"
-        ):
-            # Try other fee tiers
-            for fee_tier in [500, 10000, 100]:
-                pool_address = await self._get_pool(asset_a, asset_b, fee_tier)
-                if (
-                    pool_address
-                    and pool_address != "0x0000000000000000000000000000000000000000"
-                ):
-                    break
-            else:
-                raise ValueError(
-                    f"No pool found for {asset_a.data.symbol}/{asset_b.data.symbol}"
-                )
-
-        # Create pool contract
-        pool_abi = EthereumLocalFileABI(file_name="uniswap_v3/UniswapV3Pool.json")
-        ethereum_platform = BlockchainPlatform(
-            identifier="ethereum",
-            type=EthereumBlockchainType,
-            chain_id=1,
-        )
-
-        pool_contract = EthereumSmartContract(
-            EthereumContractConfiguration(
-                address=EthereumAddress.from_string(pool_address),
-                abi_configuration=pool_abi,
-                platform=ethereum_platform,
-            )
-        )
-
-        # Initialize pool contract
-        await pool_contract.initialize()
-
-        # Get liquidity (this is a simplified approximation)
-        liquidity = await pool_contract.functions.liquidity().call()
-        slot0 = await pool_contract.functions.slot0().call()
-        sqrt_price_x96 = slot0[0]
+        liquidity, sqrt_price_x96 = await self._get_pool_state(asset_a, asset_b)
 
-        # Convert sqrt price to regular price
-        price = (sqrt_price_x96 / (2**96)) ** 2
-
-        # Approximate reserves based on liquidity and price
+        # Approximate reserves with the virtual reserves of the active liquidity:
+        # x = L / sqrt(P) and y = L * sqrt(P), with sqrt(P) in Q64.96 fixed point
         # This is a simplification - actual V3 reserves are distributed across price ranges
-        token0 = await pool_contract.functions.token0().call()
+        reserve0_raw = (liquidity << 96) // sqrt_price_x96
+        reserve1_raw = (liquidity * sqrt_price_x96) >> 96
 
-        if asset_a.address.raw.lower() == token0.lower():
+        # Pools order their tokens by address, so token0 is known without a call
+        token0, _, _ = self._pool_key(asset_a, asset_b, 0)
+        if token0 == asset_a.address.raw.lower():
             # asset_a is token0, asset_b is token1
-            reserve_a = (
-                Decimal(liquidity) / Decimal(price) / (10**asset_a.data.decimals)
-            )
-            reserve_b = (
-                Decimal(liquidity) * Decimal(price) / (10**asset_b.data.decimals)
-            )
+            reserve_a_raw, reserve_b_raw = reserve0_raw, reserve1_raw
         else:
             # asset_a is token1, asset_b is token0
-            reserve_a = (
-                Decimal(liquidity) * Decimal(price) / (10**asset_a.data.decimals)
-            )
-            reserve_b = (
-                Decimal(liquidity) / Decimal(price) / (10**asset_b.data.decimals)
-            )
+            reserve_a_raw, reserve_b_raw = reserve1_raw, reserve0_raw
+
+        reserve_a = Decimal(reserve_a_raw) / _pow10(asset_a.data.decimals)
+        reserve_b = Decimal(reserve_b_raw) / _pow10(asset_b.data.decimals)
 
         return (reserve_a, reserve_b)
 
+    async def get_price(
+        self,
+        asset_a: BlockchainAsset,
+        asset_b: BlockchainAsset,
+    ) -> Decimal:
+        """Get the spot price of asset A in units of asset B (approximation using 0.3% pool)."""
+        # Ensure asset data is initialized
+        asset_a, asset_b = await self._resolve_assets(asset_a, asset_b)
+        assert asset_a.data is not None, "Asset A data should be initialized"
+        assert asset_b.data is not None, "Asset B data should be initialized"
+
+        _, sqrt_price_x96 = await self._get_pool_state(asset_a, asset_b)
+
+        # Raw token1/token0 price as an exact integer ratio, scaled by decimals
+        price_num, price_den = self._price_ratio(sqrt_price_x96)
+        token0, _, _ = self._pool_key(asset_a, asset_b, 0)
+        if token0 != asset_a.address.raw.lower():
+            price_num, price_den = price_den, price_num
+
+        return Decimal(price_num * _pow10(asset_a.data.decimals)) / Decimal(
+            price_den * _pow10(asset_b.data.decimals)
+        )
+
     async def build_swap_transaction(  # type: ignore[override]
         self,
         route: SwapRoute,
@@ -294,15 +324,10 @@ class UniswapV3(ProtocolImplementation):
             )
 
         hop = route.sequence[0]
-        input_asset = cast(EthereumAsset, hop.input_asset)
-        output_asset = cast(EthereumAsset, hop.output_asset)
-
         # Ensure asset data is initialized
-        if input_asset.data is None:
-            await input_asset.initialize_data()
-        if output_asset.data is None:
-            await output_asset.initialize_data()
-        # Assert data is not None after initialization
+        input_asset, output_asset = await self._resolve_assets(
+            hop.input_asset, hop.output_asset
+        )
         assert input_asset.data is not None, "Input asset data should be initialized"
         assert output_asset.data is not None, "Output asset data should be initialized"
 
@@ -310,70 +335,54 @@ class UniswapV3(ProtocolImplementation):
         fee_tier = int(route.protocol.split("_")[-1])
 
         # Calculate deadline (20 minutes from now)
-        deadline = int(self.blockchain.current_timestamp) + (20 * 60)
+        deadline = int(time.time()) + (20 * 60)
 
         # Use wallet address as recipient if not specified
         if recipient is None:
             recipient = wallet.address.raw
 
+        input_scale = _pow10(input_asset.data.decimals)
+        output_scale = _pow10(output_asset.data.decimals)
+
         if route.mode == SwapMode.EXACT_INPUT:
-            # exactInputSingle
-            amount_in = int(hop.input_amount * (10**input_asset.data.decimals))
-            amount_out_minimum = int(
-                hop.output_amount
-                * (1 - route.max_slippage)
-                * (10**output_asset.data.decimals)
+            # exactInputSingle: (amountIn, amountOutMinimum)
+            selector = self._EXACT_INPUT_SINGLE_SELECTOR
+            amount = int(hop.input_amount * input_scale)
+            amount_limit = int(
+                hop.output_amount * (1 - route.max_slippage) * output_scale
             )
-
-            params = {
-                "tokenIn": input_asset.address,
-                "tokenOut": output_asset.address,
-                "fee": fee_tier,
-                "recipient": recipient,
-                "deadline": deadline,
-                "amountIn": amount_in,
-                "amountOutMinimum": amount_out_minimum,
-                "sqrtPriceLimitX96": 0,
-            }
-
-            function_name = "exactInputSingle"
-            args = [params]
         else:
-            # exactOutputSingle
-            amount_out = int(hop.output_amount * (10**output_asset.data.decimals))
-            amount_in_maximum = int(
-                hop.input_amount
-                * (1 + route.max_slippage)
-                * (10**input_asset.data.decimals)
+            # exactOutputSingle: (amountOut, amountInMaximum)
+            selector = self._EXACT_OUTPUT_SINGLE_SELECTOR
+            amount = int(hop.output_amount * output_scale)
+            amount_limit = int(
+                hop.input_amount * (1 + route.max_slippage) * input_scale
             )
 
-            params = {
-                "tokenIn": input_asset.address,
-                "tokenOut": output_asset.address,
-                "fee": fee_tier,
-                "recipient": recipient,
-                "deadline": deadline,
-                "amountOut": amount_out,
-                "amountInMaximum": amount_in_maximum,
-                "sqrtPriceLimitX96": 0,
-            }
-
-            function_name = "exactOutputSingle"
-            args = [params]
-
-        # Ensure contracts are initialized
-        await self._ensure_contracts_initialized()
-
-        # Build transaction using Web3 contract function
-        if function_name == "exactInputSingle":
-            contract_function = self.router_contract.functions.exactInputSingle(*args)
-        elif function_name == "exactOutputSingle":
-            contract_function = self.router_contract.functions.exactOutputSingle(*args)
-        else:
-            raise ValueError(f"Unsupported function: {function_name}")
+        # Encode the router call directly so that the wallet only has to run
+        # its (concurrent) gas and fee estimation on top of it
+        calldata = selector + encode(
+            [self._SWAP_PARAMS_TYPE],
+            [
+                (
+                    input_asset.address.raw,
+                    output_asset.address.raw,
+                    fee_tier,
+                    recipient,
+                    deadline,
+                    amount,
+                    amount_limit,
+                    0,
+                )
+            ],
+        )
 
         # Build the transaction using wallet's build_transaction method
-        return await wallet.build_transaction(function=contract_function)
+        return await wallet.build_transaction(
+            tx_data=TxParams(
+                {"to": self._router_checksum_address, "data": calldata, "value": Wei(0)}
+            )
+        )
 
     async def create_swap_transaction(
         self,
@@ -446,12 +455,382 @@ class UniswapV3(ProtocolImplementation):
             client_operation_id=client_operation_id,
         )
 
+    async def _get_pool_state(
+        self, asset_a: EthereumAsset, asset_b: EthereumAsset
+    ) -> tuple[int, int]:
+        """Get the active liquidity and sqrtPriceX96 of the pool for two assets."""
+        assert asset_a.data is not None, "Asset A data should be initialized"
+        assert asset_b.data is not None, "Asset B data should be initialized"
+
+        # Try to find a pool in the most common fee tier (0.3%)
+        pool_address = await self._get_pool(asset_a, asset_b, 3000)
+        if not self._is_pool_address(pool_address):
+            # Try other fee tiers concurrently, keeping their order of preference
+            fallback_addresses = await asyncio.gather(
+                *[
+                    self._get_pool(asset_a, asset_b, fee_tier)
+                    for fee_tier in [500, 10000, 100]
+                ],
+                return_exceptions=True,
+            )
+            for fallback_address in fallback_addresses:
+                if self._is_pool_address(fallback_address):
+                    pool_address = cast(str, fallback_address)
+                    break
+            else:
+                raise ValueError(
+                    f"No pool found for {asset_a.data.symbol}/{asset_b.data.symbol}"
+                )
+
+        pool_contract = await self._get_pool_contract(pool_address)
+
+        # Get liquidity (this is a simplified approximation)
+        if self.multicall is not None:
+            liquidity, slot0 = await self._aggregate(
+                [
+                    pool_contract.functions.liquidity(),
+                    pool_contract.functions.slot0(),
+                ]
+            )
+        else:
+            liquidity = await pool_contract.functions.liquidity().call()
+            slot0 = await pool_contract.functions.slot0().call()
+        sqrt_price_x96 = slot0[0]
+
+        if sqrt_price_x96 == 0:
+            raise ValueError(
+                f"Pool for {asset_a.data.symbol}/{asset_b.data.symbol} is not initialized"
+            )
+
+        return liquidity, sqrt_price_x96
+
+    @staticmethod
+    def _price_ratio(sqrt_price_x96: int) -> tuple[int, int]:
+        """Convert a Q64.96 square root price into an exact (numerator, denominator)."""
+        return sqrt_price_x96 * sqrt_price_x96, 1 << 192
+
+    async def _quote_fee_tiers(
+        self,
+        input_asset: EthereumAsset,
+        output_asset: EthereumAsset,
+        amount_raw: int,
+        mode: SwapMode,
+    ) -> list[tuple[int, int]]:
+        """Quote every fee tier with an existing pool using concurrent calls."""
+        if self._pool_init_code_hash is not None:
+            # Pool addresses are derived locally and the quoter reverts for pools
+            # that are not deployed, so every fee tier is quoted directly
+            pool_fee_tiers = list(self.fee_tiers)
+        else:
+            # Probe every fee tier concurrently, then quote the existing pools at once
+            pool_addresses = await asyncio.gather(
+                *[
+                    self._get_pool(input_asset, output_asset, fee_tier)
+                    for fee_tier in self.fee_tiers
+                ],
+                return_exceptions=True,
+            )
+            pool_fee_tiers = [
+                fee_tier
+                for fee_tier, pool_address in zip(
+                    self.fee_tiers, pool_addresses, strict=True
+                )
+                if self._is_pool_address(pool_address)
+            ]
+
+        if self.min_liquidity > 0:
+            pool_fee_tiers = await self._filter_liquid_fee_tiers(
+                input_asset, output_asset, pool_fee_tiers
+            )
+
+        selector = (
+            self._QUOTE_EXACT_INPUT_SELECTOR
+            if mode == SwapMode.EXACT_INPUT
+            else self._QUOTE_EXACT_OUTPUT_SELECTOR
+        )
+        quotes_raw = await asyncio.gather(
+            *[
+                self._quote(
+                    self._encode_quote(
+                        selector, input_asset, output_asset, fee_tier, amount_raw
+                    )
+                )
+                for fee_tier in pool_fee_tiers
+            ],
+            return_exceptions=True,
+        )
+
+        fee_tier_quotes = [
+            (fee_tier, quote_raw)
+            for fee_tier, quote_raw in zip(pool_fee_tiers, quotes_raw, strict=True)
+            if not isinstance(quote_raw, BaseException)
+        ]
+
+        # A successful quote proves the derived pool is deployed
+        if self._pool_init_code_hash is not None:
+            for fee_tier, _ in fee_tier_quotes:
+                self._pool_addresses[
+                    self._pool_key(input_asset, output_asset, fee_tier)
+                ] = self.compute_pool_address(input_asset, output_asset, fee_tier)
+
+        return fee_tier_quotes
+
+    async def _filter_liquid_fee_tiers(
+        self,
+        asset_a: EthereumAsset,
+        asset_b: EthereumAsset,
+        fee_tiers: list[int],
+    ) -> list[int]:
+        """Keep the fee tiers whose pool holds at least the minimum liquidity."""
+        liquidities = await asyncio.gather(
+            *[
+                self._call(
+                    self._candidate_pool_address(asset_a, asset_b, fee_tier),
+                    self._LIQUIDITY_SELECTOR,
+                )
+                for fee_tier in fee_tiers
+            ],
+            return_exceptions=True,
+        )
+
+        # Undeployed pools return no data and are dropped as well
+        return [
+            fee_tier
+            for fee_tier, liquidity in zip(fee_tiers, liquidities, strict=True)
+            if not isinstance(liquidity, BaseException)
+            and len(liquidity) >= 32
+            and int.from_bytes(liquidity[:32], "big") >= self.min_liquidity
+        ]
+
+    def _candidate_pool_address(
+        self, asset_a: EthereumAsset, asset_b: EthereumAsset, fee: int
+    ) -> str:
+        """Get the known or locally derived address of a pool."""
+        pool_address = self._pool_addresses.get(self._pool_key(asset_a, asset_b, fee))
+        if pool_address is None:
+            pool_address = self.compute_pool_address(asset_a, asset_b, fee)
+        return pool_address
+
+    async def _quote_fee_tiers_multicall(
+        self,
+        input_asset: EthereumAsset,
+        output_asset: EthereumAsset,
+        amount_raw: int,
+        mode: SwapMode,
+    ) -> list[tuple[int, int]]:
+        """Quote every fee tier with an existing pool through the multicall.
+
+        Without a pool init code hash, the liquidity filter needs the getPool
+        results and reads the quoted pools with a second multicall.
+        """
+        quote_function = (
+            self.quoter_contract.functions.quoteExactInputSingle
+            if mode == SwapMode.EXACT_INPUT
+            else self.quoter_contract.functions.quoteExactOutputSingle
+        )
+        quote_calls = [
+            quote_function(
+                input_asset.address.raw,
+                output_asset.address.raw,
+                fee_tier,
+                amount_raw,
+                0,  # sqrtPriceLimitX96 (0 = no limit)
+            )
+            for fee_tier in self.fee_tiers
+        ]
+
+        n_fee_tiers = len(self.fee_tiers)
+        liquidities: list[Any] = [None] * n_fee_tiers
+        if self._pool_init_code_hash is not None:
+            # Pool addresses are derived locally and the quoter fails for pools
+            # that are not deployed, so no getPool probes are sent
+            pool_addresses: list[Any] = [
+                self.compute_pool_address(input_asset, output_asset, fee_tier)
+                for fee_tier in self.fee_tiers
+            ]
+            liquidity_calls = (
+                await self._liquidity_calls(pool_addresses)
+                if self.min_liquidity > 0
+                else []
+            )
+            results = await self._aggregate(quote_calls + liquidity_calls)
+            quotes_raw = results[:n_fee_tiers]
+            if liquidity_calls:
+                liquidities = results[n_fee_tiers:]
+        else:
+            pool_calls = [
+                self.factory_contract.functions.getPool(
+                    input_asset.address.raw, output_asset.address.raw, fee_tier
+                )
+                for fee_tier in self.fee_tiers
+            ]
+            results = await self._aggregate(pool_calls + quote_calls)
+            pool_addresses = results[:n_fee_tiers]
+            quotes_raw = results[n_fee_tiers:]
+
+            for fee_tier, pool_address in zip(
+                self.fee_tiers, pool_addresses, strict=True
+            ):
+                if self._is_pool_address(pool_address):
+                    pool_key = self._pool_key(input_asset, output_asset, fee_tier)
+                    self._pool_addresses[pool_key] = pool_address
+
+            # Liquidity needs the getPool results, so the quoted pools are read
+            # with a second multicall
+            if self.min_liquidity > 0:
+                liquidities = await self._aggregate_quoted_liquidities(
+                    pool_addresses, quotes_raw
+                )
+
+        fee_tier_quotes = []
+        for fee_tier, pool_address, quote_raw, liquidity in zip(
+            self.fee_tiers, pool_addresses, quotes_raw, liquidities, strict=True
+        ):
+            if not self._is_pool_address(pool_address) or quote_raw is None:
+                continue
+
+            # A successful quote proves the derived pool is deployed
+            if self._pool_init_code_hash is not None:
+                pool_key = self._pool_key(input_asset, output_asset, fee_tier)
+                self._pool_addresses[pool_key] = pool_address
+
+            if self.min_liquidity > 0 and (liquidity or 0) < self.min_liquidity:
+                continue
+            fee_tier_quotes.append((fee_tier, quote_raw))
+        return fee_tier_quotes
+
+    async def _aggregate_quoted_liquidities(
+        self, pool_addresses: list[Any], quotes_raw: list[Any]
+    ) -> list[Any]:
+        """Read the liquidity of the quoted pools, None for the other fee tiers."""
+        liquidities: list[Any] = [None] * len(pool_addresses)
+        quoted_indices = [
+            index
+            for index, (pool_address, quote_raw) in enumerate(
+                zip(pool_addresses, quotes_raw, strict=True)
+            )
+            if self._is_pool_address(pool_address) and quote_raw is not None
+        ]
+        if quoted_indices:
+            quoted_liquidities = await self._aggregate(
+                await self._liquidity_calls(
+                    [pool_addresses[index] for index in quoted_indices]
+                )
+            )
+            for index, liquidity in zip(
+                quoted_indices, quoted_liquidities, strict=True
+            ):
+                liquidities[index] = liquidity
+        return liquidities
+
+    async def _liquidity_calls(
+        self, pool_addresses: list[str]
+    ) -> list[AsyncContractFunction]:
+        """Build the liquidity() calls of several pools."""
+        pool_contracts = await asyncio.gather(
+            *[self._get_pool_contract(pool_address) for pool_address in pool_addresses]
+        )
+        return [pool_contract.functions.liquidity() for pool_contract in pool_contracts]
+
+    async def _aggregate(self, calls: list[AsyncContractFunction]) -> list[Any]:
+        """Execute read-only calls through the configured multicall."""
+        assert self.multicall is not None, "Multicall should be configured"
+        if not self.multicall.is_initialized:
+            await self.multicall.initialize()
+        return await self.multicall.try_aggregate(calls)
+
+    def compute_pool_address(
+        self, asset_a: EthereumAsset, asset_b: EthereumAsset, fee: int
+    ) -> str:
+        """Derive the CREATE2 address of the pool for two assets and a fee tier."""
+        if self._pool_init_code_hash is None:
+            raise ValueError("Pool init code hash is not configured")
+
+        token0, token1 = sorted(
+            (bytes(HexBytes(asset_a.address.raw)), bytes(HexBytes(asset_b.address.raw)))
+        )
+        salt = keccak(encode(self._GET_POOL_ARGUMENT_TYPES, [token0, token1, fee]))
+        digest = keccak(
+            b"\xff" + self._factory_bytes + salt + self._pool_init_code_hash
+        )
+        return AsyncWeb3.to_checksum_address(digest[12:])
+
     async def _get_pool(
         self, asset_a: EthereumAsset, asset_b: EthereumAsset, fee: int
     ) -> str:
         """Get the pool address for two assets and a specific fee tier."""
-        await self._ensure_contracts_initialized()
-        result: str = await self.factory_contract.functions.getPool(
-            asset_a.address.raw, asset_b.address.raw, fee
-        ).call()
-        return result
+        pool_key = self._pool_key(asset_a, asset_b, fee)
+        cached_address = self._pool_addresses.get(pool_key)
+        if cached_address is not None:
+            return cached_address
+
+        calldata = b"".join(
+            (
+                self._GET_POOL_SELECTOR,
+                _address_word(asset_a.address.raw),
+                _address_word(asset_b.address.raw),
+                fee.to_bytes(32, "big"),
+            )
+        )
+        result = await self._call(self._factory_checksum_address, calldata)
+        if len(result) < 32:
+            raise ValueError("Factory returned no data")
+
+        # The address is right-aligned in the single returned word
+        pool_address = AsyncWeb3.to_checksum_address(result[12:32])
+        if self._is_pool_address(pool_address):
+            self._pool_addresses[pool_key] = pool_address
+        return pool_address
+
+    def _encode_quote(
+        self,
+        selector: bytes,
+        token_in: EthereumAsset,
+        token_out: EthereumAsset,
+        fee: int,
+        amount_raw: int,
+    ) -> bytes:
+        """Encode a single-pool quoter call as fixed-width ABI words."""
+        return b"".join(
+            (
+                selector,
+                _address_word(token_in.address.raw),
+                _address_word(token_out.address.raw),
+                fee.to_bytes(32, "big"),
+                amount_raw.to_bytes(32, "big"),
+                _ZERO_WORD,  # sqrtPriceLimitX96 (0 = no limit)
+            )
+        )
+
+    async def _quote(self, calldata: bytes) -> int:
+        """Execute a quoter call and read the quoted amount from its first word."""
+        result = await self._call(self._quoter_checksum_address, calldata)
+        if len(result) < 32:
+            raise ValueError("Quoter returned no data")
+        return int.from_bytes(result[:32], "big")
+
+    async def _call(self, to: str, calldata: bytes) -> bytes:
+        """Execute a read-only call with prebuilt calldata."""
+        result = await self.blockchain.web3.eth.call(
+            TxParams({"to": to, "data": calldata})
+        )
+        return bytes(result)
+
+    @staticmethod
+    def _pool_key(
+        asset_a: EthereumAsset, asset_b: EthereumAsset, fee: int
+    ) -> tuple[str, str, int]:
+        """Build an order-independent key for a pool, as (token0, token1, fee)."""
+        token_a = asset_a.address.raw.lower()
+        token_b = asset_b.address.raw.lower()
+        if token_a > token_b:
+            return (token_b, token_a, fee)
+        return (token_a, token_b, fee)
+
+    @staticmethod
+    def _is_pool_address(pool_address: object) -> bool:
+        """Check whether a getPool result points to a deployed pool."""
+        return isinstance(pool_address, str) and pool_address not in (
+            "",
+            _ZERO_ADDRESS,
+        )
@@ -8,7 +8,13 @@ contract metadata such as ABIs.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import os
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
 from typing import Any
 
 import aiohttp
@@ -20,6 +26,33 @@ from blockchainpype.evm.blockchain.identifier import (
     EthereumTransactionHash,
 )
 
+# orjson decodes ABI-sized payloads noticeably faster than the stdlib decoder
+try:
+    import orjson
+
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ABI entries exposed by upgradeable proxies (EIP-1967, transparent, UUPS, beacon)
+_PROXY_ABI_MARKERS = frozenset(
+    {
+        "implementation",
+        "upgradeTo",
+        "upgradeToAndCall",
+        "Upgraded",
+        "BeaconUpgraded",
+        "AdminChanged",
+    }
+)
+
+
+# Checksumming hashes the address with keccak, so memoize it per lowercase address
+@functools.lru_cache(maxsize=4096)
+def _to_checksum(address_lower: str) -> str:
+    checksum = EthereumAddress.id_from_string(address_lower)
+    return EthereumAddress.id_to_string(checksum)
+
 
 class EtherscanConfiguration(BaseModel):
     """
@@ -32,12 +65,21 @@ class EtherscanConfiguration(BaseModel):
         base_url (str): Base URL for Etherscan web interface, defaults to mainnet
         api_key (str | None): Optional API key for accessing Etherscan API
         api_url (str): Base URL for Etherscan API endpoints
+        cache_dir (Path | None): Optional directory where fetched ABIs and proxy
+            resolutions are persisted across runs
+        cache_ttl (int | None): Optional lifetime in seconds of cached entries,
+            entries never expire when unset
+        max_concurrent_requests (int): Maximum number of API requests in flight,
+            defaults to the free tier rate limit
     """
 
     base_url: str = "https://etherscan.io"
     api_url: str = "https://api.etherscan.io/v2/api"
     chain_id: int | None = 1
     api_key: SecretStr | None = None
+    cache_dir: Path | None = None
+    cache_ttl: int | None = None
+    max_concurrent_requests: int = 5
 
 
 class EtherscanExplorer:
@@ -63,6 +105,15 @@ class EtherscanExplorer:
         """
         self.configuration = configuration
 
+        # The session, the semaphore and the in-flight tasks belong to the event
+        # loop that created them, and are recreated when a new loop uses the explorer
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session: ClientSession | None = None
+        self._request_semaphore = asyncio.Semaphore(
+            configuration.max_concurrent_requests
+        )
+        self._inflight_abis: dict[str, asyncio.Task[list[Any] | dict[str, Any]]] = {}
+
     @property
     def base_url(self) -> str:
         return self.configuration.base_url
@@ -71,6 +122,60 @@ class EtherscanExplorer:
     def api_url(self) -> str:
         return self.configuration.api_url
 
+    async def close(self) -> None:
+        """
+        Close the HTTP session shared by the explorer's API requests.
+        """
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _bind_to_running_loop(self) -> None:
+        """
+        Reset the loop-bound state when the explorer is used from a new event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+
+        # The previous loop owns the old session, which cannot be closed from here
+        self._loop = loop
+        self._session = None
+        self._request_semaphore = asyncio.Semaphore(
+            self.configuration.max_concurrent_requests
+        )
+        self._inflight_abis = {}
+
+    def _get_session(self) -> ClientSession:
+        """
+        Get the session shared by the running event loop, creating it on first use.
+
+        A long-lived session keeps connections to the API alive across requests,
+        avoiding a new DNS lookup and TCP/TLS handshake per call.
+
+        Returns:
+            ClientSession: The shared session
+        """
+        self._bind_to_running_loop()
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20, ttl_dns_cache=300, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=10),
+            )
+        return self._session
+
+    def _get_request_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore limiting the running event loop's concurrent API requests.
+
+        Returns:
+            asyncio.Semaphore: The request semaphore
+        """
+        self._bind_to_running_loop()
+        return self._request_semaphore
+
     def get_transaction_link(self, transaction_hash: EthereumTransactionHash) -> str:
         """
         Generate a web link to view a transaction on Etherscan.
@@ -94,8 +199,9 @@ class EtherscanExplorer:
 
         Args:
             address: Contract address, either as ``EthereumAddress`` or string.
-            session: Optional ``aiohttp`` session to reuse across calls.
-            timeout: Optional request timeout (only used when creating the session).
+            session: Optional ``aiohttp`` session to use instead of the explorer's
+                shared session.
+            timeout: Optional timeout applied to each API request.
 
         Returns:
             The decoded ABI as a list or dictionary.
@@ -110,50 +216,139 @@ class EtherscanExplorer:
 
         checksum_address = self._normalize_address(address)
 
-        close_session = False
-        client_session = session
-        if client_session is None:
-            close_session = True
-            client_session = aiohttp.ClientSession(
-                timeout=timeout or aiohttp.ClientTimeout(total=10)
+        # Concurrent requests for the same contract share a single fetch
+        self._bind_to_running_loop()
+        inflight_abis = self._inflight_abis
+        inflight = inflight_abis.get(checksum_address)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_contract_abi_uncoalesced(
+                    checksum_address, session=session, timeout=timeout
+                )
             )
-
-        try:
-            target_address, inline_abi = await self._resolve_target_contract(
-                checksum_address,
-                client_session,
+            inflight_abis[checksum_address] = inflight
+            inflight.add_done_callback(
+                lambda _: inflight_abis.pop(checksum_address, None)
             )
 
-            if inline_abi is not None:
-                return inline_abi
+        return await asyncio.shield(inflight)
 
-            payload = await self._perform_api_request(
-                client_session,
-                self._build_contract_params(
-                    action="getabi",
-                    address=target_address,
-                ),
-            )
+    async def fetch_contract_abis(
+        self,
+        addresses: Iterable[EthereumAddress | str],
+        *,
+        session: ClientSession | None = None,
+        timeout: aiohttp.ClientTimeout | None = None,
+    ) -> dict[str, list[Any] | dict[str, Any]]:
+        """Retrieve the ABIs of several contracts concurrently.
+
+        Requests are bounded by ``max_concurrent_requests`` and duplicate
+        addresses are fetched once.
+
+        Args:
+            addresses: Contract addresses, either as ``EthereumAddress`` or string.
+            session: Optional ``aiohttp`` session to use instead of the explorer's
+                shared session.
+            timeout: Optional timeout applied to each API request.
+
+        Returns:
+            The decoded ABIs keyed by checksum address.
+
+        Raises:
+            ValueError: If an address is invalid or an API request fails.
+        """
+
+        checksum_addresses = list(
+            dict.fromkeys(self._normalize_address(address) for address in addresses)
+        )
+        abis = await asyncio.gather(
+            *[
+                self.fetch_contract_abi(address, session=session, timeout=timeout)
+                for address in checksum_addresses
+            ]
+        )
+        return dict(zip(checksum_addresses, abis, strict=True))
+
+    async def _fetch_contract_abi_uncoalesced(
+        self,
+        checksum_address: str,
+        *,
+        session: ClientSession | None,
+        timeout: aiohttp.ClientTimeout | None,
+    ) -> list[Any] | dict[str, Any]:
+        abi_cache_key = self._cache_key("abi", checksum_address)
+        cached_abi = self._read_cache(abi_cache_key)
+        if isinstance(cached_abi, (list, dict)):
+            return cached_abi
+
+        client_session = session or self._get_session()
+
+        try:
+            # Most contracts are not proxies: fetch their ABI directly and only
+            # download the (much larger) source metadata when it looks like a proxy
+            abi = await self._fetch_abi(checksum_address, client_session, timeout)
+
+            if self._looks_like_proxy_abi(abi):
+                target_address, inline_abi = await self._resolve_target_contract(
+                    checksum_address,
+                    client_session,
+                    timeout=timeout,
+                )
+
+                if inline_abi is not None:
+                    abi = inline_abi
+                elif target_address != checksum_address:
+                    abi = await self._fetch_abi(target_address, client_session, timeout)
         except aiohttp.ClientResponseError as exc:
             raise ValueError(
                 f"Failed to fetch ABI from Etherscan: HTTP {exc.status}"
             ) from exc
         except aiohttp.ClientError as exc:
             raise ValueError("Failed to fetch ABI from Etherscan") from exc
-        finally:
-            if close_session:
-                await client_session.close()
 
+        self._write_cache(abi_cache_key, abi)
+        return abi
+
+    async def _fetch_abi(
+        self,
+        checksum_address: str,
+        session: ClientSession,
+        timeout: aiohttp.ClientTimeout | None,
+    ) -> list[Any] | dict[str, Any]:
+        payload = await self._perform_api_request(
+            session,
+            self._build_contract_params(action="getabi", address=checksum_address),
+            timeout=timeout,
+        )
         return self._decode_abi_payload(payload)
 
+    @staticmethod
+    def _looks_like_proxy_abi(abi: list[Any] | dict[str, Any]) -> bool:
+        """Check whether an ABI belongs to a contract that may delegate to another."""
+        if not isinstance(abi, list):
+            return False
+
+        entries = [entry for entry in abi if isinstance(entry, dict)]
+        if any(entry.get("name") in _PROXY_ABI_MARKERS for entry in entries):
+            return True
+
+        # Bare delegating proxies expose no functions of their own
+        return not any(entry.get("type") == "function" for entry in entries)
+
     async def _resolve_target_contract(
         self,
         checksum_address: str,
         session: ClientSession,
+        timeout: aiohttp.ClientTimeout | None = None,
     ) -> tuple[str, list[Any] | dict[str, Any] | None]:
+        proxy_cache_key = self._cache_key("proxy", checksum_address)
+        cached_target = self._read_cache(proxy_cache_key)
+        if isinstance(cached_target, dict):
+            return cached_target["target"], cached_target["abi"]
+
         try:
             metadata = await self._fetch_contract_metadata(
-                checksum_address, session=session
+                checksum_address, session=session, timeout=timeout
             )
         except ValueError:
             return checksum_address, None
@@ -161,6 +356,17 @@ class EtherscanExplorer:
         if metadata is None:
             return checksum_address, None
 
+        target_address, inline_abi = self._resolve_target_from_metadata(
+            checksum_address, metadata
+        )
+        self._write_cache(
+            proxy_cache_key, {"target": target_address, "abi": inline_abi}
+        )
+        return target_address, inline_abi
+
+    def _resolve_target_from_metadata(
+        self, checksum_address: str, metadata: dict[str, Any]
+    ) -> tuple[str, list[Any] | dict[str, Any] | None]:
         if metadata.get("Proxy") != "1":
             return checksum_address, None
 
@@ -186,7 +392,10 @@ class EtherscanExplorer:
         return checksum_address, None
 
     async def _fetch_contract_metadata(
-        self, checksum_address: str, session: ClientSession
+        self,
+        checksum_address: str,
+        session: ClientSession,
+        timeout: aiohttp.ClientTimeout | None = None,
     ) -> dict[str, Any] | None:
         payload = await self._perform_api_request(
             session,
@@ -194,6 +403,7 @@ class EtherscanExplorer:
                 action="getsourcecode",
                 address=checksum_address,
             ),
+            timeout=timeout,
         )
 
         if not isinstance(payload, dict):
@@ -218,13 +428,56 @@ class EtherscanExplorer:
 
         return first_entry
 
+    def _cache_key(self, namespace: str, checksum_address: str) -> str:
+        return f"{namespace}-{self.configuration.chain_id}-{checksum_address}"
+
+    def _read_cache(self, key: str) -> Any:
+        """Return a cached value, or None when missing, expired or unreadable."""
+        cache_dir = self.configuration.cache_dir
+        if cache_dir is None:
+            return None
+
+        try:
+            with open(cache_dir / f"{key}.json") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict):
+            return None
+
+        cache_ttl = self.configuration.cache_ttl
+        stored_at = entry.get("stored_at")
+        if cache_ttl is not None and (
+            not isinstance(stored_at, (int, float))
+            or time.time() - stored_at > cache_ttl
+        ):
+            return None
+
+        return entry.get("value")
+
+    def _write_cache(self, key: str, value: Any) -> None:
+        """Persist a value, ignoring filesystem errors since caching is best effort."""
+        cache_dir = self.configuration.cache_dir
+        if cache_dir is None:
+            return
+
+        path = cache_dir / f"{key}.json"
+        temporary_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(temporary_path, "w") as file:
+                json.dump({"stored_at": time.time(), "value": value}, file)
+            os.replace(temporary_path, path)
+        except OSError:
+            return
+
     @staticmethod
     def _normalize_address(address: EthereumAddress | str) -> str:
         if isinstance(address, EthereumAddress):
             return address.string
 
-        checksum = EthereumAddress.id_from_string(str(address))
-        return EthereumAddress.id_to_string(checksum)
+        return _to_checksum(str(address).lower())
 
     @staticmethod
     def _decode_abi_payload(payload: Any) -> list[Any] | dict[str, Any]:
@@ -242,8 +495,8 @@ class EtherscanExplorer:
             raise ValueError("Etherscan ABI payload is not a JSON string")
 
         try:
-            abi = json.loads(result)
-        except json.JSONDecodeError as exc:
+            abi = _json_loads(result)
+        except ValueError as exc:
             raise ValueError("Etherscan returned malformed ABI JSON") from exc
 
         if not isinstance(abi, (list, dict)):
@@ -254,8 +507,8 @@ class EtherscanExplorer:
     @staticmethod
     def _decode_abi_json_string(raw_abi: str) -> list[Any] | dict[str, Any]:
         try:
-            abi = json.loads(raw_abi)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+            abi = _json_loads(raw_abi)
+        except ValueError as exc:  # pragma: no cover - defensive
             raise ValueError("Etherscan inline ABI JSON is malformed") from exc
 
         if not isinstance(abi, (list, dict)):
@@ -279,8 +532,16 @@ class EtherscanExplorer:
         return params
 
     async def _perform_api_request(
-        self, session: ClientSession, params: dict[str, str]
+        self,
+        session: ClientSession,
+        params: dict[str, str],
+        timeout: aiohttp.ClientTimeout | None = None,
     ) -> Any:
-        async with session.get(self.api_url, params=params) as response:
-            response.raise_for_status()
-            return await response.json(content_type=None)
+        request_options: dict[str, Any] = {"params": params}
+        if timeout is not None:
+            request_options["timeout"] = timeout
+
+        async with self._get_request_semaphore():
+            async with session.get(self.api_url, **request_options) as response:
+                response.raise_for_status()
+                return _json_loads(await response.read())
@@ -1,13 +1,16 @@
+from collections.abc import Iterable
 from typing import cast
 
 from financepype.operators.blockchains.models import BlockchainConfiguration
 from financepype.operators.factory import OperatorFactory
+from financepype.operators.operator import Operator
 from financepype.owners.wallet import (
     BlockchainWallet,
     BlockchainWalletConfiguration,
     BlockchainWalletIdentifier,
 )
 from financepype.platforms.blockchain import BlockchainType
+from financepype.platforms.platform import Platform
 
 from blockchainpype.blockchain import Blockchain
 from blockchainpype.evm.blockchain.blockchain import EthereumBlockchain
@@ -27,6 +30,17 @@ class BlockchainFactory(OperatorFactory):
 
     _blockchain_classes: dict[BlockchainType, type[Blockchain]] = {}
 
+    # Derived lookups keep the registry they were built from and its size, so they
+    # are rebuilt when the registry is replaced or mutated directly (e.g. through
+    # ``OperatorFactory.register_operator_class()`` or ``OperatorFactory.reset()``)
+    _blockchain_types: (
+        tuple[dict[BlockchainType, type[Blockchain]], int, tuple[BlockchainType, ...]]
+        | None
+    ) = None
+    _platforms_by_identifier: (
+        tuple[dict[Platform, type[Operator]], int, dict[str, list[Platform]]] | None
+    ) = None
+
     @classmethod
     def register_blockchain_class_for_type(
         cls,
@@ -40,20 +54,56 @@ class BlockchainFactory(OperatorFactory):
         cls._blockchain_classes[blockchain_type] = blockchain_class
 
     @classmethod
-    def get_blockchain_types(cls) -> list[BlockchainType]:
+    def get_blockchain_types(cls) -> tuple[BlockchainType, ...]:
         """Get all registered blockchain types."""
-        return list(cls._blockchain_classes.keys())
+        classes = cls._blockchain_classes
+        cached = cls._blockchain_types
+        if cached is None or cached[0] is not classes or cached[1] != len(classes):
+            cached = (classes, len(classes), tuple(classes))
+            cls._blockchain_types = cached
+        return cached[2]
+
+    @classmethod
+    def _get_platforms_by_identifier(cls) -> dict[str, list[Platform]]:
+        mapping = cls._platform_class_mapping
+        cached = cls._platforms_by_identifier
+        if cached is None or cached[0] is not mapping or cached[1] != len(mapping):
+            platforms_by_identifier: dict[str, list[Platform]] = {}
+            for platform in mapping:
+                platforms_by_identifier.setdefault(platform.identifier, []).append(
+                    platform
+                )
+            cached = (mapping, len(mapping), platforms_by_identifier)
+            cls._platforms_by_identifier = cached
+        return cached[2]
+
+    @classmethod
+    def get_by_identifier(cls, identifier: str) -> Operator:
+        """Get a blockchain instance by its identifier.
+
+        Registered platforms are indexed by identifier, so lookups do not scan every
+        registered platform. Anything the index cannot answer with a single
+        registered platform falls back to the linear scan of ``OperatorFactory``.
+
+        Raises:
+            ValueError: If no or multiple platforms are registered for the identifier
+        """
+        platforms = cls._get_platforms_by_identifier().get(identifier)
+        if (
+            platforms is not None
+            and len(platforms) == 1
+            and platforms[0] in cls._platform_class_mapping
+        ):
+            return cls.get(platforms[0])
+        return super().get_by_identifier(identifier)
 
     @classmethod
     def register_configuration(cls, configuration: BlockchainConfiguration) -> None:
         """Register a new blockchain configuration."""
-        if configuration.platform.type in cls._blockchain_classes and (
-            configuration.platform not in cls._platform_class_mapping
-        ):
-            cls.register_operator_class(
-                configuration.platform,
-                cls._blockchain_classes[configuration.platform.type],
-            )
+        platform = configuration.platform
+        blockchain_class = cls._blockchain_classes.get(platform.type)
+        if blockchain_class is not None and platform not in cls._platform_class_mapping:
+            cls.register_operator_class(platform, blockchain_class)
 
         super().register_configuration(configuration)
 
@@ -79,7 +129,9 @@ class WalletRegistry:
     easier to maintain consistent wallet settings across the application.
     """
 
-    _configurations: dict[str, BlockchainWalletConfiguration] = {}
+    # Each entry keeps a configuration with its blockchain type, so both are
+    # resolved by a single lookup
+    _entries: dict[str, tuple[BlockchainWalletConfiguration, BlockchainType]] = {}
 
     @classmethod
     def register(cls, config: BlockchainWalletConfiguration) -> None:
@@ -92,19 +144,57 @@ class WalletRegistry:
             ValueError: If a configuration with the same identifier already exists
         """
         identifier = config.identifier.identifier
-        if identifier in cls._configurations:
+        entry = (config, config.identifier.platform.type)
+        if cls._entries.setdefault(identifier, entry) is not entry:
             raise ValueError(f"Wallet configuration for {identifier} already exists")
-        cls._configurations[identifier] = config
+
+    @classmethod
+    def register_many(cls, configs: Iterable[BlockchainWalletConfiguration]) -> None:
+        """Register several wallet configurations at once.
+
+        The configurations are validated first and then merged with a single update,
+        so the registry grows its storage once instead of once per configuration.
+
+        Args:
+            configs: The wallet configurations to register
+
+        Raises:
+            ValueError: If a configuration with the same identifier already exists
+        """
+        entries: dict[str, tuple[BlockchainWalletConfiguration, BlockchainType]] = {}
+        for config in configs:
+            identifier = config.identifier.identifier
+            if identifier in cls._entries or identifier in entries:
+                raise ValueError(
+                    f"Wallet configuration for {identifier} already exists"
+                )
+            entries[identifier] = (config, config.identifier.platform.type)
+
+        cls._entries.update(entries)
 
     @classmethod
     def get(cls, identifier: str) -> BlockchainWalletConfiguration | None:
         """Get a wallet configuration by its identifier."""
-        return cls._configurations.get(identifier)
+        entry = cls._entries.get(identifier)
+        return entry[0] if entry is not None else None
+
+    @classmethod
+    def get_entry(
+        cls, identifier: str
+    ) -> tuple[BlockchainWalletConfiguration, BlockchainType] | None:
+        """Get a wallet configuration together with its blockchain type."""
+        return cls._entries.get(identifier)
+
+    @classmethod
+    def get_platform_type(cls, identifier: str) -> BlockchainType | None:
+        """Get the blockchain type of a registered wallet configuration."""
+        entry = cls._entries.get(identifier)
+        return entry[1] if entry is not None else None
 
     @classmethod
     def list(cls) -> dict[str, BlockchainWalletConfiguration]:
         """List all registered wallet configurations."""
-        return cls._configurations.copy()
+        return {identifier: entry[0] for identifier, entry in cls._entries.items()}
 
 
 class WalletFactory:
@@ -144,28 +234,23 @@ class WalletFactory:
         Raises:
             ValueError: If configuration or wallet class is not found
         """
-        identifier = (
-            identifier.identifier
-            if isinstance(identifier, BlockchainWalletIdentifier)
-            else identifier
-        )
+        # Plain strings are the common case and skip the isinstance check
+        if type(identifier) is not str and isinstance(
+            identifier, BlockchainWalletIdentifier
+        ):
+            identifier = identifier.identifier
 
-        if identifier in cls._wallet_instances:
-            return cls._wallet_instances[identifier]
+        # Cached instances are never None, so a single lookup covers the hit path
+        cached_instance = cls._wallet_instances.get(identifier)
+        if cached_instance is not None:
+            return cached_instance
 
-        config = WalletRegistry.get(identifier)
-        if not config:
+        entry = WalletRegistry.get_entry(identifier)
+        if entry is None:
             raise ValueError(f"Wallet configuration not found for {identifier}")
 
-        wallet_class = cls._wallet_classes.get(config.identifier.platform.type)
-        if not wallet_class:
-            raise ValueError(
-                f"Wallet class not found for blockchain type {config.identifier.platform.type}"
-            )
-
-        instance = wallet_class(configuration=config)
-        cls._wallet_instances[identifier] = instance
-        return instance
+        config, platform_type = entry
+        return cls._make(identifier, config, platform_type)
 
     @classmethod
     def create_from_config(
@@ -187,13 +272,24 @@ class WalletFactory:
         """
         identifier = config.identifier.identifier
 
-        if identifier in cls._wallet_instances:
-            return cls._wallet_instances[identifier]
+        cached_instance = cls._wallet_instances.get(identifier)
+        if cached_instance is not None:
+            return cached_instance
 
-        wallet_class = cls._wallet_classes.get(config.identifier.platform.type)
+        return cls._make(identifier, config, config.identifier.platform.type)
+
+    @classmethod
+    def _make(
+        cls,
+        identifier: str,
+        config: BlockchainWalletConfiguration,
+        platform_type: BlockchainType,
+    ) -> BlockchainWallet:
+        """Instantiate and cache the wallet for a resolved configuration."""
+        wallet_class = cls._wallet_classes.get(platform_type)
         if not wallet_class:
             raise ValueError(
-                f"Wallet class not found for blockchain type {config.identifier.platform.type}"
+                f"Wallet class not found for blockchain type {platform_type}"
             )
 
         instance = wallet_class(configuration=config)
@@ -1,10 +1,11 @@
+import functools
 import os
+from collections.abc import Sequence
 
 from financepype.operators.blockchains.models import BlockchainConfiguration
 from financepype.platforms.blockchain import BlockchainPlatform, BlockchainType
 from pydantic import SecretStr
 from solana.rpc.async_api import AsyncClient
-from web3 import AsyncHTTPProvider
 
 from blockchainpype.evm.blockchain.blockchain import (
     EthereumBlockchain,
@@ -15,6 +16,7 @@ from blockchainpype.evm.blockchain.configuration import (
     EthereumConnectivityConfiguration,
     EthereumNativeAssetConfiguration,
 )
+from blockchainpype.evm.blockchain.providers import FastJSONHTTPProvider
 from blockchainpype.evm.explorer.etherscan import EtherscanConfiguration
 from blockchainpype.factory import BlockchainFactory
 from blockchainpype.solana.blockchain.blockchain import (
@@ -34,10 +36,21 @@ class SupportedBlockchainType(BlockchainType):
 
 
 class BlockchainConfigurations:
+    # Configuration method names per class, discovered once on first use
+    _configuration_methods: dict[type["BlockchainConfigurations"], list[str]] = {}
+
+    # The built-in configurations are built once per class, and the Ethereum one
+    # once per Etherscan API key read from the environment, so callers share the
+    # same configuration and provider objects until ``clear_cache()`` is called
     @classmethod
     def ethereum_configuration(cls) -> EthereumBlockchainConfiguration | None:
-        api_key = os.getenv("ETHERSCAN_API_KEY")
+        return cls._ethereum_configuration_for_key(os.getenv("ETHERSCAN_API_KEY"))
 
+    @classmethod
+    @functools.cache
+    def _ethereum_configuration_for_key(
+        cls, api_key: str | None
+    ) -> EthereumBlockchainConfiguration:
         return EthereumBlockchainConfiguration(
             platform=BlockchainPlatform(
                 identifier="ethereum",
@@ -46,7 +59,7 @@ class BlockchainConfigurations:
             ),
             native_asset=EthereumNativeAssetConfiguration(),
             connectivity=EthereumConnectivityConfiguration(
-                rpc_provider=AsyncHTTPProvider("https://eth.llamarpc.com")
+                rpc_provider=FastJSONHTTPProvider("https://eth.llamarpc.com")
             ),
             explorer=EtherscanConfiguration(
                 base_url="https://etherscan.io",
@@ -57,6 +70,7 @@ class BlockchainConfigurations:
         )
 
     @classmethod
+    @functools.cache
     def hardhat_configuration(cls) -> EthereumBlockchainConfiguration | None:
         return EthereumBlockchainConfiguration(
             platform=BlockchainPlatform(
@@ -68,13 +82,14 @@ class BlockchainConfigurations:
             ),
             native_asset=EthereumNativeAssetConfiguration(),
             connectivity=EthereumConnectivityConfiguration(
-                rpc_provider=AsyncHTTPProvider("http://127.0.0.1:8545/"),
+                rpc_provider=FastJSONHTTPProvider("http://127.0.0.1:8545/"),
                 # ws_provider=WebSocketProvider("ws://127.0.0.1:8546"),
             ),
             explorer=None,
         )
 
     @classmethod
+    @functools.cache
     def solana_configuration(cls) -> SolanaBlockchainConfiguration | None:
         return SolanaBlockchainConfiguration(
             platform=BlockchainPlatform(
@@ -88,13 +103,24 @@ class BlockchainConfigurations:
             explorer=SolscanConfiguration(),
         )
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop the memoized built-in configurations so they are rebuilt on next use."""
+        cls._ethereum_configuration_for_key.cache_clear()
+        cls.hardhat_configuration.cache_clear()
+        cls.solana_configuration.cache_clear()
+
     @classmethod
     def configurations_methods(cls) -> list[str]:
-        return [
-            method
-            for method in dir(cls)
-            if callable(getattr(cls, method)) and method.endswith("_configuration")
-        ]
+        methods = cls._configuration_methods.get(cls)
+        if methods is None:
+            methods = [
+                method
+                for method in dir(cls)
+                if method.endswith("_configuration") and callable(getattr(cls, method))
+            ]
+            cls._configuration_methods[cls] = methods
+        return list(methods)
 
     @classmethod
     def get_configurations(cls) -> dict[str, BlockchainConfiguration | None]:
@@ -118,22 +144,37 @@ class BlockchainsInitializer:
     @classmethod
     def register_blockchain_configurations(
         cls,
-        blockchain_types: list[BlockchainType] | None = None,
+        blockchain_types: Sequence[BlockchainType] | None = None,
         configurations: type[BlockchainConfigurations] = BlockchainConfigurations,
     ) -> None:
         """Register blockchain configurations for different blockchain types."""
         if blockchain_types is None:
             blockchain_types = BlockchainFactory.get_blockchain_types()
 
-        for _, config in configurations.get_configurations().items():
-            if config is not None and config.platform.type in blockchain_types:
+        allowed_types = frozenset(blockchain_types)
+        for config in configurations.get_configurations().values():
+            if config is not None and config.platform.type in allowed_types:
                 BlockchainFactory.register_configuration(config)
 
+    @classmethod
+    def prewarm(cls, blockchain_types: Sequence[BlockchainType] | None = None) -> None:
+        """Instantiate the registered blockchains ahead of their first use."""
+        if blockchain_types is None:
+            blockchain_types = BlockchainFactory.get_blockchain_types()
+
+        allowed_types = frozenset(blockchain_types)
+        for platform in BlockchainFactory.list_configurations():
+            if platform.type in allowed_types:
+                BlockchainFactory.get(platform)
+
     @classmethod
     def configure(
         cls,
-        blockchain_types: list[BlockchainType] | None = None,
+        blockchain_types: Sequence[BlockchainType] | None = None,
         configurations: type[BlockchainConfigurations] = BlockchainConfigurations,
+        prewarm: bool = False,
     ) -> None:
         cls.register_blockchain_classes()
         cls.register_blockchain_configurations(blockchain_types, configurations)
+        if prewarm:
+            cls.prewarm(blockchain_types)
@@ -5,7 +5,8 @@ These classes handle the validation, conversion, and string representation of
 Solana identifiers.
 """
 
-from typing import Any
+from typing import Any, Self, cast
+from weakref import WeakValueDictionary
 
 from financepype.operators.blockchains.identifier import BlockchainIdentifier
 from pydantic import Field
@@ -80,6 +81,12 @@ class SolanaTransactionSignature(BlockchainIdentifier):
         return str(value)
 
 
+# Parsed public keys by class and string, kept only while they are in use
+_interned_public_keys: WeakValueDictionary[
+    tuple[type["SolanaPublicKey"], str], "SolanaPublicKey"
+] = WeakValueDictionary()
+
+
 class SolanaPublicKey(BlockchainIdentifier):
     """
     Represents and validates Solana public keys.
@@ -95,6 +102,30 @@ class SolanaPublicKey(BlockchainIdentifier):
     raw: Pubkey
     string: str
 
+    @classmethod
+    def from_string(cls, value: str) -> Self:
+        """
+        Create a public key from its string representation.
+
+        Identifiers are immutable, so the same string resolves to the same
+        instance for as long as it is referenced, and is base58-decoded once.
+
+        Args:
+            value (str): The public key string to convert
+
+        Returns:
+            Self: The public key identifier
+
+        Raises:
+            ValueError: If the public key string is invalid
+        """
+        key = (cls, value)
+        identifier = _interned_public_keys.get(key)
+        if identifier is None:
+            identifier = super().from_string(value)
+            _interned_public_keys[key] = identifier
+        return cast(Self, identifier)
+
     @classmethod
     def is_valid(cls, value: Any) -> bool:
         """
@@ -128,10 +159,10 @@ class SolanaPublicKey(BlockchainIdentifier):
         Raises:
             ValueError: If the public key string is invalid
         """
-        if not cls.is_valid(value):
-            raise ValueError(f"Invalid public key: {value}")
-
-        return Pubkey.from_string(value)
+        try:
+            return Pubkey.from_string(value)
+        except ValueError as exc:
+            raise ValueError(f"Invalid public key: {value}") from exc
 
     @classmethod
     def id_to_string(cls, value: Pubkey) -> str:
@@ -4,6 +4,7 @@ It supports loading IDLs from different sources, including direct dictionaries a
 with an extensible base class for implementing additional IDL sources.
 """
 
+import functools
 import json
 import os
 from abc import abstractmethod
@@ -13,6 +14,15 @@ from pydantic import BaseModel, Field
 from blockchainpype import common_idl_path
 
 
+# IDL files are static, so each one is read and parsed at most once per process
+# and the parsed IDL is shared by every SolanaLocalFileIDL pointing at it
+@functools.cache
+def _load_idl_file(file_path: str) -> dict[str, object]:
+    with open(file_path) as file:
+        result: dict[str, object] = json.load(file)
+        return result
+
+
 class SolanaIDL(BaseModel):
     """
     Abstract base class for Solana IDL handling.
@@ -94,6 +104,4 @@ class SolanaLocalFileIDL(SolanaIDL):
             FileNotFoundError: If the IDL file doesn't exist
             json.JSONDecodeError: If the file contains invalid JSON
         """
-        with open(self.file_path) as file:
-            result: dict[str, object] = json.load(file)
-            return result
+        return _load_idl_file(os.path.abspath(self.file_path))
@@ -3,8 +3,6 @@ Solana-specific implementation of money market protocols.
 Provides base classes for implementing money market protocols on Solana.
 """
 
-from typing import cast
-
 from blockchainpype.dapps.money_market import MoneyMarket, MoneyMarketConfiguration
 from blockchainpype.solana.blockchain.blockchain import SolanaBlockchain
 
@@ -18,14 +16,19 @@ class SolanaMoneyMarketConfiguration(MoneyMarketConfiguration):
 class SolanaMoneyMarket(MoneyMarket):
     """Solana-specific money market implementation."""
 
+    # Narrowed once here so the typed properties read the attributes set by the
+    # base classes directly, without going through super() and cast()
+    _configuration: SolanaMoneyMarketConfiguration
+    _blockchain: SolanaBlockchain
+
     def __init__(self, configuration: SolanaMoneyMarketConfiguration):
         super().__init__(configuration)
 
     @property
     def configuration(self) -> SolanaMoneyMarketConfiguration:
-        return cast(SolanaMoneyMarketConfiguration, super().configuration)
+        return self._configuration
 
     @property
     def blockchain(self) -> SolanaBlockchain:
         """Get the Solana blockchain instance."""
-        return cast(SolanaBlockchain, super().blockchain)
+        return self._blockchain
@@ -3,11 +3,16 @@ Solend protocol implementation for money market operations on Solana.
 Provides integration with Solend's lending program.
 """
 
+import functools
+import struct
+import time
 from decimal import Decimal
 from typing import Any, cast
 
 from financepype.assets.blockchain import BlockchainAsset
-from solders.instruction import AccountMeta
+from financepype.operators.blockchains.models import BlockchainPlatform
+from financepype.owners.owner import OwnerIdentifier
+from solders.instruction import AccountMeta, Instruction
 
 from blockchainpype.dapps.money_market import (
     BorrowingPosition,
@@ -28,6 +33,21 @@ from blockchainpype.solana.transaction import SolanaTransaction
 
 from .money_market import SolanaMoneyMarket, SolanaMoneyMarketConfiguration
 
+# Instruction amounts are little-endian u64 values
+_pack_u64 = struct.Struct("<Q").pack
+_U64_MAX_BYTES = _pack_u64(2**64 - 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _scale(decimals: int) -> Decimal:
+    """Get the decimal scale for a token with the given number of decimals."""
+    return Decimal(10**decimals)
+
+
+def _to_raw_amount(amount: Decimal, decimals: int) -> int:
+    """Convert a token amount to raw units, truncating any sub-unit remainder."""
+    return int(amount * _scale(decimals))
+
 
 class SolendConfiguration(SolanaMoneyMarketConfiguration):
     """Configuration for Solend protocol."""
@@ -45,8 +65,6 @@ class SolendProgram(SolanaProgram):
     """Solend program interface."""
 
     def __init__(self, address: SolanaAddress, platform: Any = None) -> None:
-        from financepype.operators.blockchains.models import BlockchainPlatform
-
         if platform is None:
             platform = BlockchainPlatform(
                 identifier="solana",
@@ -65,6 +83,18 @@ class SolendProgram(SolanaProgram):
 class Solend(ProtocolImplementation):
     """Solend protocol implementation."""
 
+    _SOLANA_PLATFORM = BlockchainPlatform(
+        identifier="solana",
+        type=SolanaBlockchainType,
+        chain_id=None,
+    )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _owner_identifier(cls, name: str) -> OwnerIdentifier:
+        """Get the owner identifier of a user, shared between its transactions."""
+        return OwnerIdentifier(platform=cls._SOLANA_PLATFORM, name=name)
+
     def __init__(
         self,
         protocol_config: ProtocolConfiguration,
@@ -142,6 +172,18 @@ class Solend(ProtocolImplementation):
         # For now, return empty list as this requires more complex implementation
         return []
 
+    def _build_transaction(
+        self, instruction: Instruction, owner_address: str
+    ) -> SolanaTransaction:
+        """Wrap a Solend instruction into a transaction owned by the given address."""
+        return SolanaTransaction(
+            client_operation_id="test-operation",
+            owner_identifier=self._owner_identifier(owner_address),
+            creation_timestamp=time.time(),
+            instructions=[instruction],
+            recent_blockhash="",  # Would be filled by the blockchain
+        )
+
     async def build_supply_transaction(
         self,
         asset: BlockchainAsset,
@@ -156,7 +198,7 @@ class Solend(ProtocolImplementation):
             await self.program.initialize()
 
         # Convert amount to raw units
-        raw_amount = int(amount * Decimal(10**solana_asset.decimals))
+        raw_amount = _to_raw_amount(amount, solana_asset.decimals)
 
         # Build accounts for supply instruction
         accounts = [
@@ -170,27 +212,10 @@ class Solend(ProtocolImplementation):
 
         # Create supply instruction
         instruction = self.program.create_instruction(
-            name="deposit", accounts=accounts, data=raw_amount.to_bytes(8, "little")
-        )
-
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
+            name="deposit", accounts=accounts, data=_pack_u64(raw_amount)
         )
 
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(platform=test_platform, name=user_address),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_address)
 
     async def build_withdraw_transaction(
         self,
@@ -205,7 +230,7 @@ class Solend(ProtocolImplementation):
             await self.program.initialize()
 
         # Convert amount to raw units
-        raw_amount = int(amount * Decimal(10**solana_asset.decimals))
+        raw_amount = _to_raw_amount(amount, solana_asset.decimals)
 
         # Build accounts for withdraw instruction
         accounts = [
@@ -219,27 +244,10 @@ class Solend(ProtocolImplementation):
 
         # Create withdraw instruction
         instruction = self.program.create_instruction(
-            name="withdraw", accounts=accounts, data=raw_amount.to_bytes(8, "little")
-        )
-
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
+            name="withdraw", accounts=accounts, data=_pack_u64(raw_amount)
         )
 
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(platform=test_platform, name=user_address),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_address)
 
     async def build_borrow_transaction(
         self,
@@ -255,7 +263,7 @@ class Solend(ProtocolImplementation):
             await self.program.initialize()
 
         # Convert amount to raw units
-        raw_amount = int(amount * Decimal(10**solana_asset.decimals))
+        raw_amount = _to_raw_amount(amount, solana_asset.decimals)
 
         # Build accounts for borrow instruction
         accounts = [
@@ -269,27 +277,10 @@ class Solend(ProtocolImplementation):
 
         # Create borrow instruction
         instruction = self.program.create_instruction(
-            name="borrow", accounts=accounts, data=raw_amount.to_bytes(8, "little")
+            name="borrow", accounts=accounts, data=_pack_u64(raw_amount)
         )
 
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
-        )
-
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(platform=test_platform, name=user_address),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_address)
 
     async def build_repay_transaction(
         self,
@@ -305,11 +296,11 @@ class Solend(ProtocolImplementation):
         if not self.program.is_initialized:
             await self.program.initialize()
 
-        # Convert amount to raw units
+        # Convert amount to raw units, repaying everything with the max u64
         if repay_all:
-            raw_amount = 2**64 - 1  # Max u64
+            data = _U64_MAX_BYTES
         else:
-            raw_amount = int(amount * Decimal(10**solana_asset.decimals))
+            data = _pack_u64(_to_raw_amount(amount, solana_asset.decimals))
 
         # Build accounts for repay instruction
         accounts = [
@@ -323,27 +314,10 @@ class Solend(ProtocolImplementation):
 
         # Create repay instruction
         instruction = self.program.create_instruction(
-            name="repay", accounts=accounts, data=raw_amount.to_bytes(8, "little")
-        )
-
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
+            name="repay", accounts=accounts, data=data
         )
 
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(platform=test_platform, name=user_address),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_address)
 
     async def build_collateral_transaction(
         self,
@@ -375,24 +349,7 @@ class Solend(ProtocolImplementation):
             name=instruction_name, accounts=accounts, data=b""
         )
 
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
-        )
-
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(platform=test_platform, name=user_address),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_address)
 
     async def build_liquidation_transaction(
         self,
@@ -409,7 +366,7 @@ class Solend(ProtocolImplementation):
             await self.program.initialize()
 
         # Convert debt amount to raw units
-        raw_debt_amount = int(debt_to_cover * Decimal(10**debt_solana_asset.decimals))
+        raw_debt_amount = _to_raw_amount(debt_to_cover, debt_solana_asset.decimals)
 
         # Build accounts for liquidation instruction
         accounts = [
@@ -425,29 +382,10 @@ class Solend(ProtocolImplementation):
         instruction = self.program.create_instruction(
             name="liquidate",
             accounts=accounts,
-            data=raw_debt_amount.to_bytes(8, "little"),
+            data=_pack_u64(raw_debt_amount),
         )
 
-        from datetime import datetime
-
-        from financepype.operators.blockchains.models import BlockchainPlatform
-        from financepype.owners.owner import OwnerIdentifier
-
-        test_platform = BlockchainPlatform(
-            identifier="solana",
-            type=SolanaBlockchainType,
-            chain_id=None,
-        )
-
-        return SolanaTransaction(
-            client_operation_id="test-operation",
-            owner_identifier=OwnerIdentifier(
-                platform=test_platform, name=user_to_liquidate
-            ),
-            creation_timestamp=datetime.now().timestamp(),
-            instructions=[instruction],
-            recent_blockhash="",  # Would be filled by the blockchain
-        )
+        return self._build_transaction(instruction, user_to_liquidate)
 
 
 class SolendMoneyMarket(SolanaMoneyMarket):
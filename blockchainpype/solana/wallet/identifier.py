@@ -4,7 +4,11 @@ address-based and name-based wallet identification. It extends the base OwnerIde
 functionality to work with Solana-specific wallet addresses.
 """
 
+from collections.abc import Iterable, Mapping
+from typing import Any
+
 from financepype.owners.wallet import BlockchainWalletIdentifier
+from pydantic import TypeAdapter
 
 from blockchainpype.solana.blockchain.identifier import SolanaAddress
 
@@ -22,3 +26,27 @@ class SolanaWalletIdentifier(BlockchainWalletIdentifier):
     """
 
     address: SolanaAddress
+
+    @classmethod
+    def from_dicts(
+        cls, items: Iterable[Mapping[str, Any]]
+    ) -> list["SolanaWalletIdentifier"]:
+        """
+        Create several wallet identifiers from their field mappings.
+
+        The whole list is validated by a single call into pydantic-core, which is
+        faster than constructing the identifiers one by one when bulk-loading wallets.
+
+        Args:
+            items (Iterable[Mapping[str, Any]]): The fields of each identifier
+
+        Returns:
+            list[SolanaWalletIdentifier]: The identifiers, in the order given
+
+        Raises:
+            pydantic.ValidationError: If any of the mappings is invalid
+        """
+        return _identifiers_adapter.validate_python(list(items))
+
+
+_identifiers_adapter = TypeAdapter(list[SolanaWalletIdentifier])
@@ -11,45 +11,41 @@ async function main() {
 
     const deployedContracts = {};
 
-    // Deploy TestToken
-    console.log("\n1. Deploying TestToken...");
+    // Independent transactions are submitted together with explicit nonces, in
+    // the same nonce order as a sequential deployment so addresses are unchanged
+    let nonce = await deployer.getNonce();
+
+    // Deploy TestToken, TestToken2 (for pair creation) and TestUniswapV2Factory
+    console.log("\n1. Deploying TestToken, TestToken2 and TestUniswapV2Factory...");
     const TestToken = await hre.ethers.getContractFactory("TestToken");
-    const testToken = await TestToken.deploy();
-    await testToken.waitForDeployment();
+    const TestUniswapV2Factory = await hre.ethers.getContractFactory("TestUniswapV2Factory");
+    const [testToken, testToken2, factory] = await Promise.all([
+        TestToken.deploy({ nonce: nonce++ }),
+        TestToken.deploy({ nonce: nonce++ }),
+        TestUniswapV2Factory.deploy({ nonce: nonce++ }),
+    ]);
+    await Promise.all([testToken, testToken2, factory].map((contract) => contract.waitForDeployment()));
     deployedContracts.TestToken = await testToken.getAddress();
-    console.log(`TestToken deployed to: ${deployedContracts.TestToken}`);
-
-    // Deploy another TestToken for pair creation
-    console.log("\n2. Deploying TestToken2...");
-    const testToken2 = await TestToken.deploy();
-    await testToken2.waitForDeployment();
     deployedContracts.TestToken2 = await testToken2.getAddress();
-    console.log(`TestToken2 deployed to: ${deployedContracts.TestToken2}`);
-
-    // Deploy TestUniswapV2Factory
-    console.log("\n3. Deploying TestUniswapV2Factory...");
-    const TestUniswapV2Factory = await hre.ethers.getContractFactory("TestUniswapV2Factory");
-    const factory = await TestUniswapV2Factory.deploy();
-    await factory.waitForDeployment();
     deployedContracts.TestUniswapV2Factory = await factory.getAddress();
+    console.log(`TestToken deployed to: ${deployedContracts.TestToken}`);
+    console.log(`TestToken2 deployed to: ${deployedContracts.TestToken2}`);
     console.log(`TestUniswapV2Factory deployed to: ${deployedContracts.TestUniswapV2Factory}`);
 
-    // Create a pair
-    console.log("\n4. Creating TestUniswapV2Pair...");
-    const createPairTx = await factory.createPair(deployedContracts.TestToken, deployedContracts.TestToken2);
-    await createPairTx.wait();
-    const pairAddress = await factory.getPair(deployedContracts.TestToken, deployedContracts.TestToken2);
-    deployedContracts.TestUniswapV2Pair = pairAddress;
-    console.log(`TestUniswapV2Pair created at: ${pairAddress}`);
-
-    // Deploy TestMultisig
-    console.log("\n5. Deploying TestMultisig...");
+    // Create a pair and deploy TestMultisig
+    console.log("\n2. Creating TestUniswapV2Pair and deploying TestMultisig...");
     const owners = [deployer.address, "0x70997970C51812dc3A010C7d01b50e0d17dc79C8", "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"];
     const requiredConfirmations = 2;
     const TestMultisig = await hre.ethers.getContractFactory("TestMultisig");
-    const multisig = await TestMultisig.deploy(owners, requiredConfirmations);
-    await multisig.waitForDeployment();
+    const [createPairTx, multisig] = await Promise.all([
+        factory.createPair(deployedContracts.TestToken, deployedContracts.TestToken2, { nonce: nonce++ }),
+        TestMultisig.deploy(owners, requiredConfirmations, { nonce: nonce++ }),
+    ]);
+    await Promise.all([createPairTx.wait(), multisig.waitForDeployment()]);
+    const pairAddress = await factory.getPair(deployedContracts.TestToken, deployedContracts.TestToken2);
+    deployedContracts.TestUniswapV2Pair = pairAddress;
     deployedContracts.TestMultisig = await multisig.getAddress();
+    console.log(`TestUniswapV2Pair created at: ${pairAddress}`);
     console.log(`TestMultisig deployed to: ${deployedContracts.TestMultisig}`);
 
     // Save deployment addresses to file
@@ -61,16 +57,18 @@ async function main() {
     console.log(`\nDeployment addresses saved to: ${deploymentPath}`);
 
     console.log("\n=== Initial Setup ===");
-    // Mint some tokens to the deployer
-    await testToken.mint(deployer.address, hre.ethers.parseEther("1000"));
-    await testToken2.mint(deployer.address, hre.ethers.parseEther("1000"));
+    // Mint some tokens to the deployer and fund the multisig with some ETH
+    const setupTxs = await Promise.all([
+        testToken.mint(deployer.address, hre.ethers.parseEther("1000"), { nonce: nonce++ }),
+        testToken2.mint(deployer.address, hre.ethers.parseEther("1000"), { nonce: nonce++ }),
+        deployer.sendTransaction({
+            to: deployedContracts.TestMultisig,
+            value: hre.ethers.parseEther("1.0"),
+            nonce: nonce++,
+        }),
+    ]);
+    await Promise.all(setupTxs.map((tx) => tx.wait()));
     console.log("Minted 1000 tokens to deployer for both TestToken and TestToken2");
-
-    // Fund the multisig with some ETH
-    await deployer.sendTransaction({
-        to: deployedContracts.TestMultisig,
-        value: hre.ethers.parseEther("1.0")
-    });
     console.log("Funded multisig with 1 ETH");
 
     return deployedContracts;
@@ -43,8 +43,6 @@ class WalletsInitializer:
             # ),
         )
 
-        WalletRegistry.register(wallet_configuration)
-
         # Example Solana wallet configuration
         solana_blockchain = BlockchainFactory.get_by_identifier("solana")
         if solana_blockchain is None:
@@ -63,7 +61,10 @@ class WalletsInitializer:
             # ),
         )
 
-        WalletRegistry.register(solana_wallet_configuration)
+        # Registering the wallets together validates them before storing any
+        WalletRegistry.register_many(
+            [wallet_configuration, solana_wallet_configuration]
+        )
 
 
 WalletsInitializer.register_wallet_classes()
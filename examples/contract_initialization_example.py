@@ -20,7 +20,7 @@ ERC-20 contract address can be swapped in.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from importlib import import_module
 from importlib.util import find_spec
 
@@ -59,6 +59,7 @@ class ReadOnlyERC20(EthereumSmartContract):
 
 async def initialize_with_fallbacks(
     configurations: Iterable[tuple[str, EthereumContractConfiguration]],
+    log: Callable[[str], object] = print,
 ) -> ReadOnlyERC20:
     """Attempt contract initialization with multiple ABI sources."""
 
@@ -68,11 +69,11 @@ async def initialize_with_fallbacks(
         try:
             await contract.initialize()
         except Exception as exc:  # pragma: no cover - exercised in example run
-            print(f"❌ Initialization via {label} failed: {exc}")
+            log(f"❌ Initialization via {label} failed: {exc}")
             last_error = exc
             continue
 
-        print(f"✅ Contract initialized using {label} ABI source")
+        log(f"✅ Contract initialized using {label} ABI source")
         return contract
 
     if last_error is not None:
@@ -102,8 +103,13 @@ async def main() -> None:
         ),
     ]
 
-    for label, address in targets:
-        print(f"\n--- Initializing {label} ---")
+    # The generic ERC-20 fallback is the same for every target, and its parsed
+    # file is memoized, so a single ABI source is shared between them
+    local_erc20_abi = EthereumLocalFileABI(file_name="ERC20Mock.json")
+
+    async def process_target(label: str, address: EthereumAddress) -> list[str]:
+        # Output is collected per target so concurrent targets do not interleave
+        lines = [f"\n--- Initializing {label} ---"]
 
         configurations: list[tuple[str, EthereumContractConfiguration]] = []
 
@@ -129,18 +135,34 @@ async def main() -> None:
                 EthereumContractConfiguration(
                     platform=platform,
                     address=address,
-                    abi_configuration=EthereumLocalFileABI(
-                        file_name="ERC20Mock.json",
-                    ),
+                    abi_configuration=local_erc20_abi,
                 ),
             )
         )
 
-        contract = await initialize_with_fallbacks(configurations)
+        contract = await initialize_with_fallbacks(configurations, lines.append)
 
-        print(f"Symbol: {await contract.get_symbol()}")
-        print(f"Decimals: {await contract.get_decimals()}")
-        print(f"Total supply (raw units): {await contract.get_total_supply()}")
+        # The read-only calls are independent, so they run concurrently
+        symbol, decimals, total_supply = await asyncio.gather(
+            contract.get_symbol(),
+            contract.get_decimals(),
+            contract.get_total_supply(),
+        )
+        lines.append(f"Symbol: {symbol}")
+        lines.append(f"Decimals: {decimals}")
+        lines.append(f"Total supply (raw units): {total_supply}")
+        return lines
+
+    # Targets are independent, so they are initialized and queried concurrently
+    # over the blockchain's shared explorer session and RPC provider
+    try:
+        results = await asyncio.gather(
+            *(process_target(label, address) for label, address in targets)
+        )
+    finally:
+        await blockchain.close()
+    for lines in results:
+        print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -16,7 +16,10 @@ from pathlib import Path
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from web3 import Web3
+
 from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.dapp.abi import EthereumLocalFileABI
 from tests.evm.hardhat import HardhatTestEnvironment, get_hardhat_accounts
 
 
@@ -53,8 +56,9 @@ async def main():
 
         # Check account balances
         print("\n4. Checking account balances...")
-        for i, account in enumerate(test_accounts[:3]):  # Show first 3 accounts
-            balance = await env.get_account_balance(account)
+        # Show the first 3 accounts, fetching their balances in one batch request
+        balances = await env.get_account_balances(test_accounts[:3])
+        for i, balance in enumerate(balances):
             print(f"   💰 Account {i + 1}: {balance:.2f} ETH")
 
         # Test deployed contracts
@@ -130,6 +134,29 @@ async def main():
         print(f"   🏭 Factory: {factory_address}")
         print(f"   🔗 Pair: {pair_address}")
 
+        # Read the factory and pair state in a single JSON-RPC batch request
+        factory_abi, pair_abi = await asyncio.gather(
+            EthereumLocalFileABI(file_name="UniswapV2Factory.json").get_abi(),
+            EthereumLocalFileABI(file_name="UniswapV2Pair.json").get_abi(),
+        )
+        factory = blockchain.web3.eth.contract(
+            address=Web3.to_checksum_address(factory_address), abi=factory_abi
+        )
+        pair = blockchain.web3.eth.contract(
+            address=Web3.to_checksum_address(pair_address), abi=pair_abi
+        )
+        pairs_count, token0, token1, reserves = await blockchain.call_batch(
+            [
+                factory.functions.allPairsLength(),
+                pair.functions.token0(),
+                pair.functions.token1(),
+                pair.functions.getReserves(),
+            ]
+        )
+        print(f"   🔢 Pairs created: {pairs_count}")
+        print(f"   🪙 Pair tokens: {token0} / {token1}")
+        print(f"   💧 Reserves: {reserves[0]} / {reserves[1]}")
+
         # Summary
         print("\n12. Test Summary...")
         print("   ✅ Hardhat node started successfully")
@@ -11,7 +11,7 @@ This example shows how to:
 import asyncio
 import logging
 from decimal import Decimal
-from pprint import pprint as print
+from pprint import pprint
 from typing import cast
 
 from blockchainpype.dapps.router.models import SwapMode
@@ -44,44 +44,45 @@ async def main() -> None:
     uniswap = UniswapDEX(blockchain)
 
     # Define some common tokens
+    usdt_address = EthereumAddress.from_string(
+        "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+    )  # USDT on mainnet
+    weth_address = EthereumAddress.from_string(
+        "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+    )
+
     usdt = ERC20Token(
         platform=blockchain.platform,
-        identifier=EthereumAddress.from_string(
-            "0xdAC17F958D2ee523a2206206994597C13D831ec7"
-        ),  # USDC on mainnet
+        identifier=usdt_address,
         contract=ERC20Contract(
             configuration=ERC20ContractConfiguration(
                 platform=blockchain.platform,
-                address=EthereumAddress.from_string(
-                    "0xdAC17F958D2ee523a2206206994597C13D831ec7"
-                ),
+                address=usdt_address,
             )
         ),
     )
-    await usdt.initialize_data()
-    print(f"USDT: {usdt}")
 
     eth = EthereumNativeAsset(
         platform=blockchain.platform,
     )
-    await eth.initialize_data()
-    print(f"ETH: {eth}")
 
     weth = ERC20Token(
         platform=blockchain.platform,
-        identifier=EthereumAddress.from_string(
-            "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
-        ),
+        identifier=weth_address,
         contract=ERC20Contract(
             configuration=ERC20ContractConfiguration(
                 platform=blockchain.platform,
-                address=EthereumAddress.from_string(
-                    "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
-                ),
+                address=weth_address,
             )
         ),
     )
-    await weth.initialize_data()
+
+    # Token metadata is fetched concurrently, as the lookups are independent
+    await asyncio.gather(
+        usdt.initialize_data(), eth.initialize_data(), weth.initialize_data()
+    )
+    print(f"USDT: {usdt}")
+    print(f"ETH: {eth}")
     print(f"WETH: {weth}")
 
     # Example 1: Get a quote for swapping 100 USDC to WETH
@@ -93,7 +94,7 @@ async def main() -> None:
             amount=Decimal("100"),  # 100 USDC
             mode=SwapMode.EXACT_INPUT,
         )
-        print(f"Quote: {quote}")
+        pprint(quote.model_dump())
         print(
             f"Quote: {quote.input_amount} {quote.input_asset.data.symbol} -> {quote.output_amount} {quote.output_asset.data.symbol}"
         )
@@ -110,24 +111,24 @@ async def main() -> None:
     # Example 2: Get quotes from specific protocols
     print("=== Comparing V2 vs V3 quotes ===")
     try:
-        # Get V2 quote
-        v2_quote = await uniswap.quote_swap(
-            input_asset=usdt,
-            output_asset=weth,
-            amount=Decimal("100"),
-            protocol="uniswap_v2",
+        # The V2 and V3 quotes are independent, so they are requested concurrently
+        v2_quote, v3_quote = await asyncio.gather(
+            uniswap.quote_swap(
+                input_asset=usdt,
+                output_asset=weth,
+                amount=Decimal("100"),
+                protocol="uniswap_v2",
+            ),
+            uniswap.quote_swap(
+                input_asset=usdt,
+                output_asset=weth,
+                amount=Decimal("100"),
+                protocol="uniswap_v3",
+            ),
         )
         print(
             f"V2 Quote: {v2_quote.output_amount} {v2_quote.output_asset.data.symbol} (fees: {v2_quote.taxes * 100}%)"
         )
-
-        # Get V3 quote
-        v3_quote = await uniswap.quote_swap(
-            input_asset=usdt,
-            output_asset=weth,
-            amount=Decimal("100"),
-            protocol="uniswap_v3",
-        )
         print(
             f"V3 Quote: {v3_quote.output_amount} {v3_quote.output_asset.data.symbol} (fees: {v3_quote.taxes * 100}%)"
         )
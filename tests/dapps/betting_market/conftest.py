@@ -12,7 +12,7 @@ from blockchainpype.evm.dapp.betting_market import PolymarketConfiguration
 from blockchainpype.initializer import SupportedBlockchainType
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_platform():
     """Create a test blockchain platform."""
     return BlockchainPlatform(
@@ -22,7 +22,7 @@ def test_platform():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def polymarket_protocol():
     """Polymarket protocol configuration."""
     return PolymarketConfiguration(
@@ -35,7 +35,7 @@ def polymarket_protocol():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generic_betting_protocol():
     """Generic betting market protocol configuration."""
     return ProtocolConfiguration(
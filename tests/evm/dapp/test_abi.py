@@ -1,3 +1,4 @@
+import asyncio
 import json
 from dataclasses import dataclass
 from typing import Any
@@ -8,12 +9,23 @@ import pytest
 from web3 import AsyncWeb3
 
 from blockchainpype.evm.blockchain.identifier import EthereumAddress
-from blockchainpype.evm.dapp.abi import EthereumEtherscanABI
+from blockchainpype.evm.dapp.abi import EthereumEtherscanABI, EthereumLocalFileABI
 from blockchainpype.evm.explorer.etherscan import (
     EtherscanConfiguration,
     EtherscanExplorer,
 )
 
+PROXY_ABI_RESPONSE = {
+    "status": "1",
+    "message": "OK",
+    "result": json.dumps(
+        [
+            {"type": "event", "name": "Upgraded"},
+            {"type": "function", "name": "implementation"},
+        ]
+    ),
+}
+
 
 @dataclass
 class _StubResponse:
@@ -25,8 +37,8 @@ class _StubResponse:
     async def __aexit__(self, exc_type, exc, tb) -> bool:
         return False
 
-    async def json(self, content_type: str | None = None) -> Any:
-        return self.payload
+    async def read(self) -> bytes:
+        return json.dumps(self.payload).encode()
 
     def raise_for_status(self) -> None:
         return None
@@ -37,6 +49,7 @@ class _StubSession:
         self._responses = list(responses)
         self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
         self.close_calls = 0
+        self.closed = False
 
     def get(self, *args: Any, **kwargs: Any) -> _StubResponse:
         if not self._responses:
@@ -48,6 +61,7 @@ class _StubSession:
 
     async def close(self) -> None:
         self.close_calls += 1
+        self.closed = True
 
 
 @pytest.fixture
@@ -84,18 +98,8 @@ async def test_fetch_contract_abi_success(
         "result": json.dumps(abi_payload),
     }
 
-    metadata_payload = {
-        "status": "1",
-        "result": [
-            {
-                "Proxy": "0",
-            }
-        ],
-    }
-
     stub_session = _StubSession(
         responses=[
-            _StubResponse(payload=metadata_payload),
             _StubResponse(payload=response_payload),
         ]
     )
@@ -108,9 +112,12 @@ async def test_fetch_contract_abi_success(
 
     assert result == abi_payload
     mock_session_cls.assert_called_once()
-    assert len(stub_session.calls) == 2
+    assert len(stub_session.calls) == 1
     actions = [call[1]["params"]["action"] for call in stub_session.calls]
-    assert actions == ["getsourcecode", "getabi"]
+    assert actions == ["getabi"]
+    assert stub_session.close_calls == 0
+
+    await explorer.close()
     assert stub_session.close_calls == 1
 
 
@@ -124,18 +131,8 @@ async def test_fetch_contract_abi_raises_when_status_not_ok(
         "result": "Contract source code not verified",
     }
 
-    metadata_payload = {
-        "status": "1",
-        "result": [
-            {
-                "Proxy": "0",
-            }
-        ],
-    }
-
     stub_session = _StubSession(
         responses=[
-            _StubResponse(payload=metadata_payload),
             _StubResponse(payload=response_payload),
         ]
     )
@@ -159,18 +156,8 @@ async def test_fetch_contract_abi_uses_existing_session(
         "result": json.dumps(abi_payload),
     }
 
-    metadata_payload = {
-        "status": "1",
-        "result": [
-            {
-                "Proxy": "0",
-            }
-        ],
-    }
-
     stub_session = _StubSession(
         responses=[
-            _StubResponse(payload=metadata_payload),
             _StubResponse(payload=response_payload),
         ]
     )
@@ -180,7 +167,7 @@ async def test_fetch_contract_abi_uses_existing_session(
     )
 
     assert result == abi_payload
-    assert len(stub_session.calls) == 2
+    assert len(stub_session.calls) == 1
     assert stub_session.close_calls == 0
 
 
@@ -194,18 +181,8 @@ async def test_fetch_contract_abi_invalid_json(
         "result": "not-json",
     }
 
-    metadata_payload = {
-        "status": "1",
-        "result": [
-            {
-                "Proxy": "0",
-            }
-        ],
-    }
-
     stub_session = _StubSession(
         responses=[
-            _StubResponse(payload=metadata_payload),
             _StubResponse(payload=response_payload),
         ]
     )
@@ -241,6 +218,7 @@ async def test_fetch_contract_abi_proxy_uses_inline_implementation_abi(
 
     stub_session = _StubSession(
         responses=[
+            _StubResponse(payload=PROXY_ABI_RESPONSE),
             _StubResponse(payload=metadata_payload),
         ]
     )
@@ -252,8 +230,8 @@ async def test_fetch_contract_abi_proxy_uses_inline_implementation_abi(
         abi = await explorer.fetch_contract_abi(sample_contract_address)
 
     assert abi == json.loads(inline_abi)
-    assert len(stub_session.calls) == 1
-    assert stub_session.calls[0][1]["params"]["action"] == "getsourcecode"
+    assert len(stub_session.calls) == 2
+    assert stub_session.calls[1][1]["params"]["action"] == "getsourcecode"
 
 
 @pytest.mark.asyncio
@@ -287,6 +265,7 @@ async def test_fetch_contract_abi_proxy_fetches_implementation_address(
 
     stub_session = _StubSession(
         responses=[
+            _StubResponse(payload=PROXY_ABI_RESPONSE),
             _StubResponse(payload=metadata_payload),
             _StubResponse(payload=abi_payload),
         ]
@@ -299,8 +278,8 @@ async def test_fetch_contract_abi_proxy_fetches_implementation_address(
         abi = await explorer.fetch_contract_abi(sample_contract_address)
 
     assert abi == json.loads(abi_payload["result"])
-    assert len(stub_session.calls) == 2
-    assert stub_session.calls[1][1]["params"]["address"] == implementation_address
+    assert len(stub_session.calls) == 3
+    assert stub_session.calls[2][1]["params"]["address"] == implementation_address
 
 
 @pytest.mark.asyncio
@@ -313,20 +292,10 @@ async def test_fetch_contract_abi_metadata_failure_falls_back(
         "result": "Unable to locate contract at address",
     }
 
-    abi_payload = {
-        "status": "1",
-        "message": "OK",
-        "result": json.dumps(
-            [
-                {"type": "function", "name": "totalSupply"},
-            ]
-        ),
-    }
-
     stub_session = _StubSession(
         responses=[
+            _StubResponse(payload=PROXY_ABI_RESPONSE),
             _StubResponse(payload=metadata_payload),
-            _StubResponse(payload=abi_payload),
         ]
     )
 
@@ -336,11 +305,10 @@ async def test_fetch_contract_abi_metadata_failure_falls_back(
     ):
         abi = await explorer.fetch_contract_abi(sample_contract_address)
 
-    assert abi == json.loads(abi_payload["result"])
+    # The proxy's own ABI is kept when its implementation cannot be resolved
+    assert abi == json.loads(PROXY_ABI_RESPONSE["result"])
     assert len(stub_session.calls) == 2
-    assert (
-        stub_session.calls[1][1]["params"]["address"] == sample_contract_address.string
-    )
+    assert stub_session.calls[1][1]["params"]["action"] == "getsourcecode"
 
 
 @pytest.mark.asyncio
@@ -383,3 +351,224 @@ async def test_etherscan_abi_raises_with_context(
         await abi_source.get_abi()
 
     assert sample_contract_address.string in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_fetch_contract_abi_persists_to_disk_cache(
+    tmp_path, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "balanceOf"}]
+    configuration = EtherscanConfiguration(
+        api_url="https://api.etherscan.io/v2/api", cache_dir=tmp_path
+    )
+
+    stub_session = _StubSession(
+        responses=[
+            _StubResponse(
+                payload={
+                    "status": "1",
+                    "message": "OK",
+                    "result": json.dumps(abi_payload),
+                }
+            ),
+        ]
+    )
+
+    with patch(
+        "blockchainpype.evm.explorer.etherscan.aiohttp.ClientSession",
+        return_value=stub_session,
+    ):
+        first = await EtherscanExplorer(configuration).fetch_contract_abi(
+            sample_contract_address
+        )
+
+    with patch(
+        "blockchainpype.evm.explorer.etherscan.aiohttp.ClientSession"
+    ) as mock_session_cls:
+        second = await EtherscanExplorer(configuration).fetch_contract_abi(
+            sample_contract_address
+        )
+
+    assert first == second == abi_payload
+    mock_session_cls.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_contract_abi_ignores_expired_cache_entries(
+    tmp_path, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "decimals"}]
+    configuration = EtherscanConfiguration(
+        api_url="https://api.etherscan.io/v2/api", cache_dir=tmp_path, cache_ttl=60
+    )
+    explorer = EtherscanExplorer(configuration)
+    stale_entry = {"stored_at": 0, "value": [{"type": "function", "name": "stale"}]}
+    for namespace in ("abi", "proxy"):
+        cache_key = explorer._cache_key(namespace, sample_contract_address.string)
+        (tmp_path / f"{cache_key}.json").write_text(json.dumps(stale_entry))
+
+    stub_session = _StubSession(
+        responses=[
+            _StubResponse(
+                payload={
+                    "status": "1",
+                    "message": "OK",
+                    "result": json.dumps(abi_payload),
+                }
+            ),
+        ]
+    )
+
+    with patch(
+        "blockchainpype.evm.explorer.etherscan.aiohttp.ClientSession",
+        return_value=stub_session,
+    ):
+        abi = await explorer.fetch_contract_abi(sample_contract_address)
+
+    assert abi == abi_payload
+    assert len(stub_session.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_contract_abi_reuses_shared_session(
+    explorer: EtherscanExplorer, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "name"}]
+    abi_response = {"status": "1", "message": "OK", "result": json.dumps(abi_payload)}
+
+    stub_session = _StubSession(
+        responses=[
+            _StubResponse(payload=abi_response),
+            _StubResponse(payload=abi_response),
+        ]
+    )
+
+    with patch(
+        "blockchainpype.evm.explorer.etherscan.aiohttp.ClientSession",
+        return_value=stub_session,
+    ) as mock_session_cls:
+        await explorer.fetch_contract_abi(sample_contract_address)
+        await explorer.fetch_contract_abi(sample_contract_address)
+
+    mock_session_cls.assert_called_once()
+    assert len(stub_session.calls) == 2
+    assert stub_session.close_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_fetch_contract_abi_coalesces_concurrent_requests(
+    explorer: EtherscanExplorer, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "symbol"}]
+    stub_session = _StubSession(
+        responses=[
+            _StubResponse(
+                payload={
+                    "status": "1",
+                    "message": "OK",
+                    "result": json.dumps(abi_payload),
+                }
+            ),
+        ]
+    )
+
+    first, second = await asyncio.gather(
+        explorer.fetch_contract_abi(sample_contract_address, session=stub_session),
+        explorer.fetch_contract_abi(
+            sample_contract_address.string.lower(), session=stub_session
+        ),
+    )
+
+    assert first == second == abi_payload
+    assert len(stub_session.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_contract_abis_fetches_each_address_once(
+    explorer: EtherscanExplorer, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "owner"}]
+    other_address = AsyncWeb3.to_checksum_address(
+        "0x000000000000000000000000000000000000bEEF"
+    )
+    metadata_response = {"status": "1", "result": [{"Proxy": "0"}]}
+    abi_response = {"status": "1", "message": "OK", "result": json.dumps(abi_payload)}
+    stub_session = _StubSession(responses=[])
+
+    def respond_by_action(*args: Any, **kwargs: Any) -> _StubResponse:
+        stub_session.calls.append((args, kwargs))
+        if kwargs["params"]["action"] == "getsourcecode":
+            return _StubResponse(payload=metadata_response)
+        return _StubResponse(payload=abi_response)
+
+    stub_session.get = respond_by_action  # type: ignore[method-assign]
+
+    abis = await explorer.fetch_contract_abis(
+        [sample_contract_address, other_address, sample_contract_address.string],
+        session=stub_session,
+    )
+
+    assert abis == {
+        sample_contract_address.string: abi_payload,
+        other_address: abi_payload,
+    }
+    assert len(stub_session.calls) == 2
+
+
+def test_explorer_session_is_recreated_for_each_event_loop(
+    explorer: EtherscanExplorer, sample_contract_address: EthereumAddress
+) -> None:
+    abi_payload = [{"type": "function", "name": "balanceOf"}]
+    abi_response = {"status": "1", "message": "OK", "result": json.dumps(abi_payload)}
+    sessions: list[_StubSession] = []
+
+    def new_session(*args: Any, **kwargs: Any) -> _StubSession:
+        sessions.append(_StubSession(responses=[_StubResponse(abi_response)]))
+        return sessions[-1]
+
+    async def fetch_abi() -> list[Any] | dict[str, Any]:
+        return await explorer.fetch_contract_abi(sample_contract_address)
+
+    with patch(
+        "blockchainpype.evm.explorer.etherscan.aiohttp.ClientSession",
+        side_effect=new_session,
+    ):
+        assert asyncio.run(fetch_abi()) == abi_payload
+        assert asyncio.run(fetch_abi()) == abi_payload
+
+    assert len(sessions) == 2
+    assert all(len(session.calls) == 1 for session in sessions)
+    assert explorer._session is sessions[1]
+
+
+def test_normalize_address_checksums_string_addresses(
+    sample_contract_address: EthereumAddress,
+) -> None:
+    lowercase = sample_contract_address.string.lower()
+
+    assert EtherscanExplorer._normalize_address(lowercase) == (
+        sample_contract_address.string
+    )
+    assert EtherscanExplorer._normalize_address(sample_contract_address) == (
+        sample_contract_address.string
+    )
+    with pytest.raises(ValueError):
+        EtherscanExplorer._normalize_address("0x1234")
+
+
+@pytest.mark.asyncio
+async def test_local_file_abi_parses_each_file_once(tmp_path) -> None:
+    abi_payload = [{"type": "function", "name": "owner"}]
+    (tmp_path / "Owned.json").write_text(json.dumps({"abi": abi_payload}))
+
+    with patch("blockchainpype.evm.dapp.abi.json.load", wraps=json.load) as load:
+        first = await EthereumLocalFileABI(
+            file_name="Owned.json", folder_path=str(tmp_path)
+        ).get_abi()
+        second = await EthereumLocalFileABI(
+            file_name="Owned.json", folder_path=str(tmp_path)
+        ).get_abi()
+
+    assert first == abi_payload
+    assert second is first
+    assert load.call_count == 1
@@ -0,0 +1,52 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from financepype.platforms.blockchain import BlockchainPlatform
+from web3 import AsyncWeb3
+
+from blockchainpype.evm.blockchain.blockchain import (
+    EthereumBlockchain,
+    EthereumBlockchainType,
+)
+from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.dapp.erc20 import ERC20Contract, ERC20ContractConfiguration
+
+PLATFORM = BlockchainPlatform(
+    identifier="ethereum", type=EthereumBlockchainType, chain_id=1
+)
+
+
+def make_token(blockchain: EthereumBlockchain, address: str) -> ERC20Contract:
+    with patch(
+        "financepype.operators.factory.OperatorFactory.get", return_value=blockchain
+    ):
+        return ERC20Contract(
+            ERC20ContractConfiguration(
+                platform=PLATFORM, address=EthereumAddress.from_string(address)
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_contracts_with_the_same_abi_share_a_contract_factory() -> None:
+    blockchain = MagicMock(spec=EthereumBlockchain)
+    blockchain.web3 = AsyncWeb3()
+    usdt = make_token(blockchain, "0xdAC17F958D2ee523a2206206994597C13D831ec7")
+    weth = make_token(blockchain, "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2")
+
+    await usdt.initialize()
+    await weth.initialize()
+
+    assert usdt.contract is not None and weth.contract is not None
+    assert type(usdt.contract) is type(weth.contract)
+    assert usdt.contract.address == usdt.address.raw
+    assert weth.contract.address == weth.address.raw
+
+    other_blockchain = MagicMock(spec=EthereumBlockchain)
+    other_blockchain.web3 = AsyncWeb3()
+    other = make_token(other_blockchain, "0xdAC17F958D2ee523a2206206994597C13D831ec7")
+    await other.initialize()
+
+    assert other.contract is not None
+    assert type(other.contract) is not type(usdt.contract)
+    assert other.contract.w3 is other_blockchain.web3
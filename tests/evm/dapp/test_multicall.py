@@ -0,0 +1,81 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from eth_abi import encode
+from financepype.platforms.blockchain import BlockchainPlatform
+from web3 import AsyncWeb3
+
+from blockchainpype.evm.blockchain.blockchain import (
+    EthereumBlockchain,
+    EthereumBlockchainType,
+)
+from blockchainpype.evm.dapp.abi import EthereumLocalFileABI
+from blockchainpype.evm.dapp.multicall import (
+    MULTICALL3_ADDRESS,
+    Multicall,
+    MulticallConfiguration,
+)
+
+TOKEN_ADDRESS = AsyncWeb3.to_checksum_address(
+    "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+)
+
+
+@pytest.fixture
+async def token_contract():
+    abi = await EthereumLocalFileABI(file_name="ERC20Mock.json").get_abi()
+    return AsyncWeb3().eth.contract(address=TOKEN_ADDRESS, abi=abi)
+
+
+@pytest.fixture
+def multicall() -> Multicall:
+    with patch(
+        "financepype.operators.factory.OperatorFactory.get",
+        return_value=MagicMock(spec=EthereumBlockchain),
+    ):
+        multicall = Multicall(
+            MulticallConfiguration(
+                platform=BlockchainPlatform(
+                    identifier="ethereum",
+                    type=EthereumBlockchainType,
+                    chain_id=1,
+                )
+            )
+        )
+    multicall._contract = MagicMock()
+    return multicall
+
+
+def test_configuration_defaults_to_multicall3(multicall: Multicall) -> None:
+    assert multicall.address.raw == MULTICALL3_ADDRESS
+
+
+@pytest.mark.asyncio
+async def test_try_aggregate_decodes_results(multicall, token_contract) -> None:
+    try_aggregate = multicall.functions.tryAggregate
+    try_aggregate.return_value.call = AsyncMock(
+        return_value=[
+            (True, encode(["string"], ["Wrapped Ether"])),
+            (True, encode(["uint8"], [18])),
+            (False, b""),
+        ]
+    )
+    calls = [
+        token_contract.functions.name(),
+        token_contract.functions.decimals(),
+        token_contract.functions.symbol(),
+    ]
+
+    results = await multicall.try_aggregate(calls)
+
+    assert results == ["Wrapped Ether", 18, None]
+    require_success, encoded_calls = try_aggregate.call_args.args
+    assert require_success is False
+    assert [target for target, _ in encoded_calls] == [TOKEN_ADDRESS] * 3
+    assert encoded_calls[1][1] == "0x313ce567"  # decimals() selector
+
+
+@pytest.mark.asyncio
+async def test_try_aggregate_without_calls(multicall) -> None:
+    assert await multicall.try_aggregate([]) == []
+    multicall.functions.tryAggregate.assert_not_called()
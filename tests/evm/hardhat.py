@@ -327,6 +327,25 @@ class HardhatTestEnvironment:
             print(f"⚠️  Failed to get balance for {account}: {e}")
             return 0.0
 
+    async def get_account_balances(self, accounts: list[str]) -> list[float]:
+        """Get ETH balances of several accounts in a single batch request."""
+        if self.blockchain is None:
+            return [0.0] * len(accounts)
+
+        web3 = self.blockchain.web3
+        try:
+            async with web3.batch_requests() as batch:
+                for account in accounts:
+                    batch.add(web3.eth.get_balance(Web3.to_checksum_address(account)))
+                balances_wei = await batch.async_execute()
+            return [
+                float(Web3.from_wei(balance_wei, "ether"))
+                for balance_wei in balances_wei
+            ]
+        except Exception as e:
+            print(f"⚠️  Failed to get balances for {accounts}: {e}")
+            return [0.0] * len(accounts)
+
     async def send_eth(
         self, from_account: str, to_account: str, amount_eth: float
     ) -> str:
@@ -358,9 +377,8 @@ class HardhatTestEnvironment:
         if self.blockchain is None:
             raise RuntimeError("Blockchain not initialized")
 
-        for _ in range(count):
-            # Use proper Web3 method for mining blocks
-            await self.blockchain.web3.provider.make_request("evm_mine", [])
+        # hardhat_mine mines all the blocks in a single request
+        await self.blockchain.web3.provider.make_request("hardhat_mine", [hex(count)])
 
     async def set_next_block_timestamp(self, timestamp: int) -> None:
         """Set the timestamp for the next block."""
@@ -440,34 +458,40 @@ async def blockchain_snapshot(hardhat_env) -> AsyncGenerator[str]:
     await hardhat_env.revert_to_snapshot(snapshot_id)
 
 
+# Default accounts of the fixed Hardhat mnemonic, built once at import time
+HARDHAT_ACCOUNTS: tuple[str, ...] = (
+    "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+    "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+    "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC",
+    "0x90F79bf6EB2c4f870365E785982E1f101E93b906",
+    "0x15d34AAf54267DB7D7c367839AAf71A00a2C6A65",
+    "0x9965507D1a55bcC2695C58ba16FB37d819B0A4dc",
+    "0x976EA74026E726554dB657fA54763abd0C3a0aa9",
+    "0x14dC79964da2C08b23698B3D3cc7Ca32193d9955",
+    "0x23618e81E3f5cdF7f54C3d65f7FBc0aBf5B21E8f",
+    "0xa0Ee7A142d267C1f36714E4a8F75612F20a79720",
+)
+
+HARDHAT_PRIVATE_KEYS: tuple[str, ...] = (
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+    "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+    "0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a",
+    "0x7c852118294e51e653712a81e05800f419141751be58f605c371e15141b007a6",
+    "0x47e179ec197488593b187f80a00eb0da91f1b9d0b13f8733639f19c30a34926a",
+    "0x8b3a350cf5c34c9194ca85829a2df0ec3153be0318b5e2d3348e872092edffba",
+    "0x92db14e403b83dfe3df233f83dfa3a0d7096f21ca9b0d6d6b8d88b2b4ec1564e",
+    "0x4bbbf85ce3377467afe5d46f804f221813b2bb87f24d81f60f1fcdbf7cbf4356",
+    "0xdbda1821b80551c9d65939329250298aa3472ba22feea921c0cf5d620ea67b97",
+    "0x2a871d0798f97d79848a013d4936a73bf4cc922c825d33c1cf7073dff6d409c6",
+)
+
+
 # Utility functions
 def get_hardhat_accounts() -> list[str]:
     """Get the default Hardhat accounts (deterministic)."""
-    return [
-        "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
-        "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
-        "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC",
-        "0x90F79bf6EB2c4f870365E785982E1f101E93b906",
-        "0x15d34AAf54267DB7D7c367839AAf71A00a2C6A65",
-        "0x9965507D1a55bcC2695C58ba16FB37d819B0A4dc",
-        "0x976EA74026E726554dB657fA54763abd0C3a0aa9",
-        "0x14dC79964da2C08b23698B3D3cc7Ca32193d9955",
-        "0x23618e81E3f5cdF7f54C3d65f7FBc0aBf5B21E8f",
-        "0xa0Ee7A142d267C1f36714E4a8F75612F20a79720",
-    ]
+    return list(HARDHAT_ACCOUNTS)
 
 
 def get_hardhat_private_keys() -> list[str]:
     """Get the default Hardhat private keys (deterministic)."""
-    return [
-        "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
-        "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
-        "0x5de4111afa1a4b94908f83103eb1f1706367c2e68ca870fc3fb9a804cdab365a",
-        "0x7c852118294e51e653712a81e05800f419141751be58f605c371e15141b007a6",
-        "0x47e179ec197488593b187f80a00eb0da91f1b9d0b13f8733639f19c30a34926a",
-        "0x8b3a350cf5c34c9194ca85829a2df0ec3153be0318b5e2d3348e872092edffba",
-        "0x92db14e403b83dfe3df233f83dfa3a0d7096f21ca9b0d6d6b8d88b2b4ec1564e",
-        "0x4bbbf85ce3377467afe5d46f804f221813b2bb87f24d81f60f1fcdbf7cbf4356",
-        "0xdbda1821b80551c9d65939329250298aa3472ba22feea921c0cf5d620ea67b97",
-        "0x2a871d0798f97d79848a013d4936a73bf4cc922c825d33c1cf7073dff6d409c6",
-    ]
+    return list(HARDHAT_PRIVATE_KEYS)
@@ -89,3 +89,19 @@ def test_ethereum_address_validation() -> None:
     # Invalid address
     with pytest.raises(ValueError):
         EthereumAddress.from_string("0xinvalid")
+
+
+def test_ethereum_address_from_string_interns_per_class() -> None:
+    """Test that parsing the same address string reuses the live instance."""
+    value = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
+    address = EthereumAddress.from_string(value)
+
+    assert EthereumAddress.from_string(value) is address
+    assert EthereumAddress.from_string(value.lower()).raw == address.raw
+    null_address = EthereumNullAddress.from_string(
+        "0x0000000000000000000000000000000000000000"
+    )
+    assert type(null_address) is EthereumNullAddress
+    with pytest.raises(ValueError, match="Invalid wallet id: 0xinvalid"):
+        EthereumAddress.from_string("0xinvalid")
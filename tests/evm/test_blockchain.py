@@ -1,6 +1,13 @@
+import asyncio
+import gc
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from eth_abi import encode
 from financepype.platforms.blockchain import BlockchainPlatform
-from web3 import AsyncWeb3
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3.exceptions import Web3RPCError
+from web3.types import TxParams
 
 from blockchainpype.evm.asset import EthereumNativeAsset
 from blockchainpype.evm.blockchain.blockchain import (
@@ -12,7 +19,13 @@ from blockchainpype.evm.blockchain.configuration import (
     EthereumConnectivityConfiguration,
     EthereumNativeAssetConfiguration,
 )
+from blockchainpype.evm.blockchain.gas import GasConfiguration
 from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.blockchain.providers import (
+    BatchingHTTPProvider,
+    FastJSONHTTPProvider,
+    MultipleHTTPProvider,
+)
 
 
 @pytest.fixture
@@ -91,3 +104,322 @@ async def test_fetch_block_timestamp(ethereum_blockchain: EthereumBlockchain) ->
 
     assert timestamp is not None
     assert timestamp > 0  # Ethereum timestamps are Unix timestamps
+
+
+@pytest.mark.asyncio
+async def test_close_closes_the_explorer_session(
+    ethereum_blockchain: EthereumBlockchain,
+) -> None:
+    """Test that closing the blockchain closes its explorer."""
+    await ethereum_blockchain.close()
+
+    explorer = MagicMock(close=AsyncMock())
+    ethereum_blockchain._explorer = explorer
+    await ethereum_blockchain.close()
+
+    explorer.close.assert_awaited_once_with()
+
+
+class StubBatchProvider(AsyncHTTPProvider):
+    """HTTP provider answering JSON-RPC batches without a network round-trip."""
+
+    def __init__(self, response: object = None) -> None:
+        super().__init__("http://127.0.0.1:8545/")
+        self.response = response
+        self.batches: list[list[tuple[str, object]]] = []
+
+    async def make_batch_request(self, batch_requests):
+        self.batches.append(list(batch_requests))
+        if self.response is not None:
+            return self.response
+        return [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "result": "0x" + encode(["uint256"], [request_id + 7]).hex(),
+            }
+            for request_id in range(len(batch_requests))
+        ]
+
+    async def make_request(self, method, params):
+        raise AssertionError(f"Unexpected single request {method}")
+
+
+def make_stub_blockchain(provider: StubBatchProvider) -> EthereumBlockchain:
+    return EthereumBlockchain(
+        configuration=EthereumBlockchainConfiguration(
+            platform=BlockchainPlatform(
+                identifier="ethereum",
+                type=EthereumBlockchainType,
+                chain_id=1,
+            ),
+            native_asset=EthereumNativeAssetConfiguration(),
+            connectivity=EthereumConnectivityConfiguration(rpc_provider=provider),
+            explorer=None,
+        )
+    )
+
+
+def make_view_functions(blockchain: EthereumBlockchain) -> list:
+    contract = blockchain.web3.eth.contract(
+        address="0x1234567890123456789012345678901234567890",
+        abi=[
+            {
+                "type": "function",
+                "name": name,
+                "inputs": [],
+                "outputs": [{"name": "", "type": "uint256"}],
+                "stateMutability": "view",
+            }
+            for name in ("first", "second")
+        ],
+    )
+    return [contract.functions.first(), contract.functions.second()]
+
+
+@pytest.mark.asyncio
+async def test_call_batch_sends_a_single_batch_request() -> None:
+    """Test that call_batch decodes the batched results in the order of the calls."""
+    provider = StubBatchProvider()
+    blockchain = make_stub_blockchain(provider)
+
+    results = await blockchain.call_batch(make_view_functions(blockchain))
+
+    assert results == [7, 8]
+    assert len(provider.batches) == 1
+    assert [method for method, _ in provider.batches[0]] == ["eth_call", "eth_call"]
+    assert [params[0]["data"] for _, params in provider.batches[0]] == [
+        "0x" + AsyncWeb3.keccak(text="first()")[:4].hex(),
+        "0x" + AsyncWeb3.keccak(text="second()")[:4].hex(),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_call_batch_raises_when_batches_are_rejected() -> None:
+    """Test that an endpoint rejecting batches surfaces as an RPC error."""
+    provider = StubBatchProvider(
+        response={
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {"code": -32600, "message": "Batch requests are not supported"},
+        }
+    )
+    blockchain = make_stub_blockchain(provider)
+
+    with pytest.raises(Web3RPCError, match="not supported"):
+        await blockchain.call_batch(make_view_functions(blockchain))
+
+
+@pytest.mark.asyncio
+async def test_multiple_provider_batch_request_falls_back() -> None:
+    """Test that batch requests are routed with the same fallback as single ones."""
+    failing = MagicMock(endpoint_uri="https://failing.example")
+    failing.make_batch_request = AsyncMock(
+        side_effect=RuntimeError("https://failing.example is down")
+    )
+    healthy = MagicMock(endpoint_uri="https://healthy.example")
+    healthy.make_batch_request = AsyncMock(return_value=[{"result": "0x1"}])
+
+    provider = MultipleHTTPProvider(retrieval_providers=[failing, healthy])
+    requests = [("eth_call", []), ("eth_call", [])]
+
+    responses = await provider.make_batch_request(requests)
+
+    assert responses == [{"result": "0x1"}]
+    healthy.make_batch_request.assert_awaited_once_with(requests)
+
+
+@pytest.mark.asyncio
+async def test_multiple_provider_races_retrieval_requests() -> None:
+    """Test that racing returns the first successful read and cancels the rest."""
+    cancelled = asyncio.Event()
+
+    async def slow_request(method, params):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    failing = MagicMock(endpoint_uri="https://failing.example")
+    failing.make_request = AsyncMock(side_effect=RuntimeError("down"))
+    slow = MagicMock(endpoint_uri="https://slow.example")
+    slow.make_request = AsyncMock(side_effect=slow_request)
+    fast = MagicMock(endpoint_uri="https://fast.example")
+    fast.make_request = AsyncMock(return_value={"result": "0x1"})
+
+    provider = MultipleHTTPProvider(
+        retrieval_providers=[failing, slow, fast], race_providers=True
+    )
+
+    response = await provider.make_request("eth_call", [])
+
+    assert response == {"result": "0x1"}
+    assert provider.current_retrieval_provider is fast
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_multiple_provider_race_retrieves_the_losing_errors() -> None:
+    """Test that errors raised by cancelled requests are not left unretrieved."""
+    loop = asyncio.get_running_loop()
+    unhandled: list[dict] = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    async def failing_cancellation(method, params):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            raise RuntimeError("connection reset") from None
+
+    slow = MagicMock(endpoint_uri="https://slow.example")
+    slow.make_request = AsyncMock(side_effect=failing_cancellation)
+    fast = MagicMock(endpoint_uri="https://fast.example")
+    fast.make_request = AsyncMock(return_value={"result": "0x1"})
+    provider = MultipleHTTPProvider(
+        retrieval_providers=[slow, fast], race_providers=True
+    )
+
+    try:
+        assert await provider.make_request("eth_call", []) == {"result": "0x1"}
+        gc.collect()
+        await asyncio.sleep(0)
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert unhandled == []
+
+
+@pytest.mark.asyncio
+async def test_multiple_provider_race_raises_when_all_fail() -> None:
+    """Test that racing raises the last error when no provider answers."""
+    providers = []
+    for name in ("first", "second"):
+        failing = MagicMock(endpoint_uri=f"https://{name}.example")
+        failing.make_request = AsyncMock(side_effect=RuntimeError(f"{name} down"))
+        providers.append(failing)
+
+    provider = MultipleHTTPProvider(retrieval_providers=providers, race_providers=True)
+
+    with pytest.raises(RuntimeError, match="down"):
+        await provider.make_request("eth_getBalance", [])
+
+    # Transactions are never raced
+    providers[0].make_request = AsyncMock(return_value={"result": "0x2"})
+    assert await provider.make_request("eth_sendRawTransaction", []) == {
+        "result": "0x2"
+    }
+    providers[1].make_request.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_coalesces_concurrent_requests() -> None:
+    """Test that concurrent requests are sent as one JSON-RPC batch."""
+    inner = MagicMock(endpoint_uri="https://node.example")
+    inner.make_batch_request = AsyncMock(
+        return_value=[{"result": "0x1"}, {"result": "0x2"}, {"result": "0x3"}]
+    )
+    inner.make_request = AsyncMock()
+    provider = BatchingHTTPProvider(inner, batch_wait_seconds=0.01)
+
+    responses = await asyncio.gather(
+        provider.make_request("eth_blockNumber", []),
+        provider.make_request("eth_getBalance", ["0x0", "latest"]),
+        provider.make_request("eth_chainId", []),
+    )
+
+    assert responses == [{"result": "0x1"}, {"result": "0x2"}, {"result": "0x3"}]
+    inner.make_batch_request.assert_awaited_once_with(
+        [
+            ("eth_blockNumber", []),
+            ("eth_getBalance", ["0x0", "latest"]),
+            ("eth_chainId", []),
+        ]
+    )
+    inner.make_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_flushes_full_batches_and_single_requests() -> None:
+    """Test that full batches flush immediately and lone requests are unbatched."""
+    inner = MagicMock(endpoint_uri="https://node.example")
+    inner.make_batch_request = AsyncMock(
+        return_value=[{"result": "0x1"}, {"result": "0x2"}]
+    )
+    inner.make_request = AsyncMock(return_value={"result": "0x3"})
+    provider = BatchingHTTPProvider(inner, batch_max_count=2, batch_wait_seconds=10)
+
+    responses = await asyncio.gather(
+        provider.make_request("eth_blockNumber", []),
+        provider.make_request("eth_chainId", []),
+    )
+    assert responses == [{"result": "0x1"}, {"result": "0x2"}]
+
+    provider.batch_wait_seconds = 0
+    assert await provider.make_request("eth_gasPrice", []) == {"result": "0x3"}
+    inner.make_request.assert_awaited_once_with("eth_gasPrice", [])
+
+
+@pytest.mark.asyncio
+async def test_batching_provider_propagates_batch_errors() -> None:
+    """Test that a failed batch fails every queued request."""
+    inner = MagicMock(endpoint_uri="https://node.example")
+    inner.make_batch_request = AsyncMock(side_effect=RuntimeError("node down"))
+    provider = BatchingHTTPProvider(inner, batch_wait_seconds=0)
+
+    results = await asyncio.gather(
+        provider.make_request("eth_blockNumber", []),
+        provider.make_request("eth_chainId", []),
+        return_exceptions=True,
+    )
+
+    assert [str(result) for result in results] == ["node down", "node down"]
+
+
+def test_fast_json_provider_decodes_like_the_default_provider() -> None:
+    """Test that responses decode to the same values as the web3 decoder."""
+    responses = [
+        b'{"jsonrpc": "2.0", "id": 1, "result": "0x1"}',
+        b'[{"jsonrpc": "2.0", "id": 1, "result": {"number": "0x10"}}]',
+        b'{"jsonrpc": "2.0", "id": 1, "result": 123456789012345678901234567890}',
+    ]
+
+    for response in responses:
+        assert FastJSONHTTPProvider.decode_rpc_response(
+            response
+        ) == AsyncWeb3.AsyncHTTPProvider.decode_rpc_response(response)
+
+
+@pytest.mark.asyncio
+async def test_eip1559_gas_fees_request_rpcs_concurrently() -> None:
+    """Test that gas, base fee and fee history are fetched concurrently."""
+    in_flight = 0
+    max_in_flight = 0
+
+    def tracked(result):
+        async def call(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result
+
+        return call
+
+    w3 = MagicMock()
+    w3.eth.estimate_gas = tracked(100_000)
+    w3.eth.get_block = tracked({"baseFeePerGas": 10})
+    w3.eth.fee_history = tracked({"reward": [[2, 4], [6, 8]]})
+
+    fees = await GasConfiguration().estimate_eip1559_gas_fees(
+        w3, TxParams({"to": "0x000000000000000000000000000000000000dEaD"})
+    )
+
+    assert max_in_flight == 3
+    assert fees == {
+        "gas": 130_000,
+        "maxPriorityFeePerGas": 5,
+        "maxFeePerGas": 25,
+    }
@@ -34,6 +34,17 @@ class TestHardhatBasicOperations:
         balance = await hardhat_env.get_account_balance(test_accounts[0])
         assert balance > 1000  # Should have more than 1000 ETH
 
+    @pytest.mark.asyncio
+    async def test_account_balances_batch(self, hardhat_env, test_accounts):
+        """Test that batched balances match individually fetched ones."""
+        accounts = test_accounts[:3]
+
+        balances = await hardhat_env.get_account_balances(accounts)
+
+        assert balances == [
+            await hardhat_env.get_account_balance(account) for account in accounts
+        ]
+
     @pytest.mark.asyncio
     async def test_eth_transfer(self, hardhat_env, test_accounts):
         """Test ETH transfer between accounts."""
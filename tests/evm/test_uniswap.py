@@ -13,19 +13,66 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from eth_abi.abi import decode, encode
 from financepype.platforms.blockchain import BlockchainPlatform
+from web3 import AsyncWeb3
 from web3.types import TxParams
 
 from blockchainpype.dapps.router.models import SwapMode, SwapRoute
 from blockchainpype.evm.asset import EthereumAssetData
-from blockchainpype.evm.blockchain.blockchain import EthereumBlockchain
+from blockchainpype.evm.blockchain.blockchain import (
+    EthereumBlockchain,
+    EthereumBlockchainType,
+)
 from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.dapp.erc20 import ERC20Contract, ERC20Token
+from blockchainpype.evm.dapp.multicall import Multicall
 from blockchainpype.evm.dapp.uniswap.dex import UniswapConfiguration, UniswapDEX
-from blockchainpype.evm.dapp.uniswap.v2 import UniswapV2
-from blockchainpype.evm.dapp.uniswap.v3 import UniswapV3
+from blockchainpype.evm.dapp.uniswap.v2 import (
+    UNISWAP_V2_PAIR_INIT_CODE_HASH,
+    UniswapV2,
+)
+from blockchainpype.evm.dapp.uniswap.v3 import (
+    UNISWAP_V3_POOL_INIT_CODE_HASH,
+    UniswapV3,
+)
 from blockchainpype.evm.transaction import EthereumTransaction
 from blockchainpype.evm.wallet.wallet import EthereumWallet
 
+SWAP_ARGUMENT_TYPES = ("uint256", "uint256", "address[]", "address", "uint256")
+V3_GET_POOL_ARGUMENT_TYPES = ("address", "address", "uint24")
+V3_QUOTE_ARGUMENT_TYPES = ("address", "address", "uint24", "uint256", "uint160")
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def mock_v3_eth_call(
+    strategy: UniswapV3,
+    pools: dict[int, str | Exception],
+    quotes: dict[int, int] | None = None,
+    liquidities: dict[str, int] | None = None,
+) -> AsyncMock:
+    """Serve raw factory getPool, quoter and pool liquidity calls."""
+
+    async def eth_call(transaction):
+        arguments = bytes(transaction["data"])[4:]
+        if not arguments:
+            liquidity = (liquidities or {}).get(transaction["to"])
+            return b"" if liquidity is None else encode(["uint256"], [liquidity])
+        if len(arguments) == 32 * len(V3_GET_POOL_ARGUMENT_TYPES):
+            _, _, fee = decode(V3_GET_POOL_ARGUMENT_TYPES, arguments)
+            pool = pools.get(fee, ZERO_ADDRESS)
+            if isinstance(pool, Exception):
+                raise pool
+            return encode(["address"], [pool])
+
+        _, _, fee, _, _ = decode(V3_QUOTE_ARGUMENT_TYPES, arguments)
+        if quotes is None or fee not in quotes:
+            raise Exception("No pool")
+        return encode(["uint256"], [quotes[fee]])
+
+    strategy.blockchain.web3.eth.call = AsyncMock(side_effect=eth_call)
+    return strategy.blockchain.web3.eth.call
+
 
 class MockEthereumAsset:
     """Mock EthereumAsset for testing."""
@@ -212,16 +259,16 @@ class TestUniswapV2Strategy:
             mock_factory.return_value = MagicMock()
             pair_contract = mock_pair_contract.return_value
             pair_contract.initialize = AsyncMock()
-            pair_contract.functions.getReserves.return_value.call = AsyncMock(
-                return_value=(
-                    Decimal("1000000") * 10**6,
-                    Decimal("1000") * 10**18,
-                    1640995200,
-                )
-            )  # getReserves
-            pair_contract.functions.token0.return_value.call = AsyncMock(
-                return_value=str(usdc_asset.address)
-            )  # token0
+            pair_contract.blockchain.call_batch = AsyncMock(
+                return_value=[
+                    (
+                        Decimal("1000000") * 10**6,
+                        Decimal("1000") * 10**18,
+                        1640995200,
+                    ),  # getReserves
+                    str(usdc_asset.address),  # token0
+                ]
+            )
 
             # Mock SwapHop and SwapRoute
             mock_swap_hop = MagicMock()
@@ -265,6 +312,21 @@ class TestUniswapV2Strategy:
                 mode=SwapMode.EXACT_INPUT,
             )
 
+    @pytest.mark.asyncio
+    async def test_quote_swap_unsupported_mode(
+        self, v2_strategy, usdc_asset, weth_asset
+    ):
+        """Test that an undefined swap mode is rejected before any RPC."""
+        with pytest.raises(ValueError, match="Unsupported swap mode"):
+            await v2_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.UNDEFINED,
+            )
+
+        v2_strategy.factory_contract.functions.getPair.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_reserves(self, v2_strategy, usdc_asset, weth_asset):
         """Test getting reserves for a pair."""
@@ -281,16 +343,16 @@ class TestUniswapV2Strategy:
             mock_factory.return_value = MagicMock()
             pair_contract = mock_pair_contract.return_value
             pair_contract.initialize = AsyncMock()
-            pair_contract.functions.getReserves.return_value.call = AsyncMock(
-                return_value=(
-                    1000000 * 10**6,
-                    1000 * 10**18,
-                    1640995200,
-                )
-            )  # getReserves
-            pair_contract.functions.token0.return_value.call = AsyncMock(
-                return_value=str(usdc_asset.address)
-            )  # token0
+            pair_contract.blockchain.call_batch = AsyncMock(
+                return_value=[
+                    (
+                        1000000 * 10**6,
+                        1000 * 10**18,
+                        1640995200,
+                    ),  # getReserves
+                    str(usdc_asset.address),  # token0
+                ]
+            )
 
             reserves = await v2_strategy.get_reserves(usdc_asset, weth_asset)
 
@@ -298,6 +360,212 @@ class TestUniswapV2Strategy:
             assert reserves[0] == Decimal("1000000")  # USDC reserves
             assert reserves[1] == Decimal("1000")  # WETH reserves
 
+    @pytest.mark.asyncio
+    async def test_get_reserves_raw_orders_by_asset(
+        self, v2_strategy, usdc_asset, weth_asset
+    ):
+        """Test that raw reserves are unscaled and follow the requested asset order."""
+        v2_strategy.factory_contract.functions.getPair.return_value.call.return_value = "0x1234567890123456789012345678901234567890"
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v2.EthereumSmartContract"
+            ) as mock_pair_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pair_contract = mock_pair_contract.return_value
+            pair_contract.initialize = AsyncMock()
+            pair_contract.blockchain.call_batch = AsyncMock(
+                return_value=[
+                    (1000 * 10**18, 1000000 * 10**6, 1640995200),  # getReserves
+                    str(weth_asset.address),  # token0
+                ]
+            )
+
+            reserves = await v2_strategy.get_reserves_raw(usdc_asset, weth_asset)
+
+            assert reserves == (1000000 * 10**6, 1000 * 10**18)
+
+    @pytest.mark.asyncio
+    async def test_get_reserves_raw_falls_back_when_batching_fails(
+        self, v2_strategy, usdc_asset, weth_asset
+    ):
+        """Test that reserves are read with single calls when a batch is rejected."""
+        v2_strategy.factory_contract.functions.getPair.return_value.call.return_value = "0x1234567890123456789012345678901234567890"
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v2.EthereumSmartContract"
+            ) as mock_pair_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pair_contract = mock_pair_contract.return_value
+            pair_contract.initialize = AsyncMock()
+            pair_contract.blockchain.call_batch = AsyncMock(
+                side_effect=ValueError("Batch requests are not supported")
+            )
+            functions = pair_contract.functions
+            functions.getReserves.return_value.call = AsyncMock(
+                return_value=(1000 * 10**18, 1000000 * 10**6, 1640995200)
+            )
+            functions.token0.return_value.call = AsyncMock(
+                return_value=str(weth_asset.address)
+            )
+
+            reserves = await v2_strategy.get_reserves_raw(usdc_asset, weth_asset)
+
+            assert reserves == (1000000 * 10**6, 1000 * 10**18)
+            pair_contract.blockchain.call_batch.assert_awaited_once()
+            functions.getReserves.return_value.call.assert_awaited_once()
+            functions.token0.return_value.call.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_reserves_bootstraps_with_multicall(
+        self, v2_strategy, weth_asset
+    ):
+        """Test that token metadata and the pair address share one multicall."""
+        token_contract = MagicMock(spec=ERC20Contract)
+        token_contract.is_initialized = True
+        usdc_token = ERC20Token(
+            platform=BlockchainPlatform(
+                identifier="ethereum", type=EthereumBlockchainType, chain_id=1
+            ),
+            identifier=EthereumAddress.from_string(
+                "0xA0b86a33E6441b29205ab6F5b10C0B7B5C7f1b4e"
+            ),
+            contract=token_contract,
+        )
+        multicall = MagicMock(spec=Multicall)
+        multicall.is_initialized = True
+        multicall.try_aggregate = AsyncMock(
+            return_value=[
+                "USD Coin",
+                "USDC",
+                6,
+                "0x1234567890123456789012345678901234567890",
+            ]
+        )
+        v2_strategy.multicall = multicall
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v2.EthereumSmartContract"
+            ) as mock_pair_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pair_contract = mock_pair_contract.return_value
+            pair_contract.initialize = AsyncMock()
+            pair_contract.blockchain.call_batch = AsyncMock(
+                return_value=[
+                    (1000000 * 10**6, 1000 * 10**18, 1640995200),  # getReserves
+                    str(usdc_token.address),  # token0
+                ]
+            )
+
+            reserves = await v2_strategy.get_reserves(usdc_token, weth_asset)
+
+        assert reserves == (Decimal("1000000"), Decimal("1000"))
+        assert usdc_token.data == EthereumAssetData(
+            name="USD Coin", symbol="USDC", decimals=6
+        )
+        assert len(multicall.try_aggregate.call_args.args[0]) == 4
+        mock_pair_contract.assert_called_once()
+        assert mock_pair_contract.call_args.args[0].address.raw == (
+            "0x1234567890123456789012345678901234567890"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_reserves_reuses_pair_contract(
+        self, v2_strategy, usdc_asset, weth_asset
+    ):
+        """Test that the pair contract is built and initialized only once."""
+        v2_strategy.factory_contract.functions.getPair.return_value.call.return_value = "0x1234567890123456789012345678901234567890"
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v2.EthereumSmartContract"
+            ) as mock_pair_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pair_contract = mock_pair_contract.return_value
+            pair_contract.initialize = AsyncMock()
+            pair_contract.blockchain.call_batch = AsyncMock(
+                return_value=[
+                    (1000000 * 10**6, 1000 * 10**18, 1640995200),  # getReserves
+                    str(usdc_asset.address),  # token0
+                ]
+            )
+
+            await v2_strategy.get_reserves(usdc_asset, weth_asset)
+            await v2_strategy.get_reserves(usdc_asset, weth_asset)
+
+            mock_pair_contract.assert_called_once()
+            pair_contract.initialize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_path(self, v2_strategy, usdc_asset, weth_asset):
+        """Test quoting a multi-hop path through the router's getAmountsOut."""
+        dai_asset = MockEthereumAsset(
+            symbol="DAI",
+            decimals=18,
+            address="0x6B175474E89094C44Da98b954EedeAC495271d0F",
+        )
+        get_amounts_out = v2_strategy.router_contract.functions.getAmountsOut
+        get_amounts_out.return_value.call = AsyncMock(
+            return_value=[100 * 10**6, 5 * 10**16, 99 * 10**18]
+        )
+
+        amounts = await v2_strategy.quote_swap_path(
+            [usdc_asset, weth_asset, dai_asset], 100 * 10**6
+        )
+
+        assert amounts == [100 * 10**6, 5 * 10**16, 99 * 10**18]
+        get_amounts_out.assert_called_once_with(
+            100 * 10**6,
+            [usdc_asset.address.raw, weth_asset.address.raw, dai_asset.address.raw],
+        )
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_path_requires_two_assets(self, v2_strategy, usdc_asset):
+        """Test that a path with a single asset is rejected."""
+        with pytest.raises(ValueError, match="at least two assets"):
+            await v2_strategy.quote_swap_path([usdc_asset], 100 * 10**6)
+
+    def test_compute_pair_address(self, mock_blockchain):
+        """Test local CREATE2 derivation of a Uniswap V2 pair address."""
+        with patch("blockchainpype.evm.dapp.uniswap.v2.EthereumSmartContract"):
+            strategy = UniswapV2(
+                blockchain=mock_blockchain,
+                factory_address="0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f",
+                router_address="0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",
+                pair_init_code_hash=UNISWAP_V2_PAIR_INIT_CODE_HASH,
+            )
+        usdc = MockEthereumAsset(
+            symbol="USDC",
+            decimals=6,
+            address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        )
+        weth = MockEthereumAsset(
+            symbol="WETH",
+            decimals=18,
+            address="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        )
+
+        expected = "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc"
+        assert strategy.compute_pair_address(usdc, weth) == expected
+        assert strategy.compute_pair_address(weth, usdc) == expected
+
+    def test_compute_pair_address_requires_init_code_hash(
+        self, v2_strategy, usdc_asset, weth_asset
+    ):
+        """Test that local derivation is unavailable without an init code hash."""
+        with pytest.raises(ValueError, match="init code hash"):
+            v2_strategy.compute_pair_address(usdc_asset, weth_asset)
+
     @pytest.mark.asyncio
     async def test_build_swap_transaction(self, v2_strategy, mock_wallet):
         """Test building a swap transaction with wallet integration."""
@@ -315,15 +583,11 @@ class TestUniswapV2Strategy:
         mock_hop.output_asset = MagicMock()
         mock_hop.output_asset.data = MagicMock()
         mock_hop.output_asset.data.decimals = 18
+        mock_hop.input_asset.address.raw = "0xA0b86a33E6441b29205ab6F5b10C0B7B5C7f1b4e"
+        mock_hop.output_asset.address.raw = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
         mock_hop.input_amount = Decimal("100")
         mock_hop.output_amount = Decimal("0.05")
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v2_strategy.router_contract.functions.swapExactTokensForTokens.return_value = (
-            mock_function
-        )
-
         # Test building swap transaction
         result = await v2_strategy.build_swap_transaction(
             mock_route,
@@ -331,8 +595,20 @@ class TestUniswapV2Strategy:
             recipient="0x742d35Cc6634C0532925a3b8D2bC7a5Fad7b6e4F",
         )
 
-        # Verify wallet.build_transaction was called with the contract function
-        mock_wallet.build_transaction.assert_called_once_with(function=mock_function)
+        # Verify wallet.build_transaction was called with the encoded router call
+        mock_wallet.build_transaction.assert_called_once()
+        tx_data = mock_wallet.build_transaction.call_args.kwargs["tx_data"]
+        assert tx_data["to"] == "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
+        assert tx_data["data"][:4] == bytes.fromhex("38ed1739")
+        amount_in, min_amount_out, path, _, _ = decode(
+            SWAP_ARGUMENT_TYPES, tx_data["data"][4:]
+        )
+        assert amount_in == 100 * 10**6
+        assert min_amount_out == int(Decimal("0.05") * Decimal("0.995") * 10**18)
+        assert path == (
+            "0xa0b86a33e6441b29205ab6f5b10c0b7b5c7f1b4e",
+            "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+        )
 
         # Verify the result is the expected TxParams
         assert result["to"] == "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
@@ -390,19 +666,13 @@ class TestUniswapV2Strategy:
             "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
         )
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v2_strategy.router_contract.functions.swapExactTokensForTokens.return_value = (
-            mock_function
-        )
-
         # Test creating swap transaction
         result = await v2_strategy.create_swap_transaction(
             route=mock_route, wallet=mock_wallet, client_operation_id="test_swap"
         )
 
         # Verify wallet methods were called correctly
-        mock_wallet.build_transaction.assert_called_once_with(function=mock_function)
+        mock_wallet.build_transaction.assert_called_once()
         mock_wallet.sign_and_send_transaction.assert_called_once()
 
         # Verify the result is an EthereumTransaction
@@ -490,21 +760,40 @@ class TestUniswapV2Strategy:
             "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
         )
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v2_strategy.router_contract.functions.swapExactTokensForTokens.return_value = (
-            mock_function
-        )
-
         # Test building swap transaction without specifying recipient
         await v2_strategy.build_swap_transaction(mock_route, mock_wallet)
 
-        # Verify that the swapExactTokensForTokens was called with wallet address as recipient
-        args, kwargs = (
-            v2_strategy.router_contract.functions.swapExactTokensForTokens.call_args
-        )
+        # Verify that the swap was encoded with wallet address as recipient
+        tx_data = mock_wallet.build_transaction.call_args.kwargs["tx_data"]
+        args = decode(SWAP_ARGUMENT_TYPES, tx_data["data"][4:])
         recipient_arg = args[3]  # recipient is the 4th argument (0-indexed)
-        assert recipient_arg == mock_wallet.address.raw
+        assert recipient_arg == mock_wallet.address.raw.lower()
+
+    @pytest.mark.asyncio
+    async def test_build_swap_transaction_exact_output(
+        self, v2_strategy, usdc_asset, weth_asset, mock_wallet
+    ):
+        """Test that exact output swaps encode swapTokensForExactTokens."""
+        mock_route = MagicMock()
+        mock_route.mode = SwapMode.EXACT_OUTPUT
+        mock_route.max_slippage = Decimal("0.005")
+
+        mock_hop = MagicMock()
+        mock_hop.input_asset = usdc_asset
+        mock_hop.output_asset = weth_asset
+        mock_hop.input_amount = Decimal("100")
+        mock_hop.output_amount = Decimal("0.05")
+        mock_route.sequence = [mock_hop]
+
+        await v2_strategy.build_swap_transaction(mock_route, mock_wallet)
+
+        tx_data = mock_wallet.build_transaction.call_args.kwargs["tx_data"]
+        assert tx_data["data"][:4] == bytes.fromhex("8803dbee")
+        amount_out, max_amount_in, _, _, _ = decode(
+            SWAP_ARGUMENT_TYPES, tx_data["data"][4:]
+        )
+        assert amount_out == 5 * 10**16
+        assert max_amount_in == int(Decimal("100") * Decimal("1.005") * 10**6)
 
     @pytest.mark.asyncio
     async def test_create_swap_transaction_auto_generates_operation_id(
@@ -532,12 +821,6 @@ class TestUniswapV2Strategy:
         mock_route.mode = SwapMode.EXACT_INPUT
         mock_route.max_slippage = Decimal("0.005")
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v2_strategy.router_contract.functions.swapExactTokensForTokens.return_value = (
-            mock_function
-        )
-
         # Test creating swap transaction without operation ID
         await v2_strategy.create_swap_transaction(route=mock_route, wallet=mock_wallet)
 
@@ -624,36 +907,15 @@ class TestUniswapV3Strategy:
     ):
         """Test quote swap across multiple fee tiers."""
 
-        # Mock pool addresses for different fee tiers
-        def mock_get_pool(*args):
-            # args will be (asset_a, asset_b, fee)
-            if len(args) >= 3:
-                fee = args[2]
-            else:
-                fee = 3000  # default
-            if fee == 500:
-                return "0x1111111111111111111111111111111111111111"
-            elif fee == 3000:
-                return "0x2222222222222222222222222222222222222222"
-            else:
-                return "0x0000000000000000000000000000000000000000"
-
-        v3_strategy.factory_contract.functions.getPool.return_value.call.side_effect = (
-            mock_get_pool
-        )
-
-        # Mock quoter responses (fee tier 3000 gives better rate)
-        def mock_quoter_call(*args):
-            # args will be (asset_a, asset_b, fee, amount, price_limit)
-            fee = args[2] if len(args) > 2 else 3000
-            if fee == 500:  # fee tier
-                return 50 * 10**18  # 50 WETH
-            elif fee == 3000:  # fee tier
-                return 51 * 10**18  # 51 WETH (better rate)
-            else:
-                raise Exception("No pool")
-
-        v3_strategy.quoter_contract.functions.quoteExactInputSingle.return_value.call.side_effect = mock_quoter_call
+        # Fee tier 3000 gives the better rate
+        mock_v3_eth_call(
+            v3_strategy,
+            pools={
+                500: "0x1111111111111111111111111111111111111111",
+                3000: "0x2222222222222222222222222222222222222222",
+            },
+            quotes={500: 50 * 10**18, 3000: 51 * 10**18},
+        )
 
         # Mock SwapHop and SwapRoute to avoid Pydantic validation
         with (
@@ -680,11 +942,354 @@ class TestUniswapV3Strategy:
             assert quote.output_amount == Decimal("51")  # Should pick better rate
             assert quote.protocol == "uniswap_v3_3000"  # Should use 0.3% fee tier
 
+    @pytest.mark.asyncio
+    async def test_quote_swap_skips_failed_fee_tier_probes(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that fee tiers whose pool lookup fails are ignored."""
+        eth_call = mock_v3_eth_call(
+            v3_strategy,
+            pools={
+                100: Exception("RPC error"),
+                3000: "0x2222222222222222222222222222222222222222",
+            },
+            quotes={100: 52 * 10**18, 3000: 51 * 10**18},
+        )
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["output_amount"] == Decimal("51")
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+        # Four pool probes and a single quote for the only existing pool
+        assert eth_call.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_get_pool_decodes_raw_factory_result(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that getPool results are decoded from the returned word."""
+        pool = "0x8ad599c3A0ff1De082011EFDDc58f1908eb6e6D8"
+        mock_v3_eth_call(v3_strategy, pools={3000: pool})
+
+        assert await v3_strategy._get_pool(usdc_asset, weth_asset, 3000) == pool
+        assert await v3_strategy._get_pool(usdc_asset, weth_asset, 500) == (
+            ZERO_ADDRESS
+        )
+
+        v3_strategy.blockchain.web3.eth.call = AsyncMock(return_value=b"")
+        with pytest.raises(ValueError, match="Factory returned no data"):
+            await v3_strategy._get_pool(usdc_asset, weth_asset, 100)
+
+    @pytest.mark.asyncio
+    async def test_resolve_assets_initializes_data_concurrently(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that missing asset data is initialized concurrently."""
+        started = []
+        release = asyncio.Event()
+
+        def deferred_initialize(asset):
+            data = asset.data
+            asset.data = None
+
+            async def initialize_data():
+                started.append(asset)
+                await release.wait()
+                asset.data = data
+
+            asset.initialize_data = initialize_data
+
+        deferred_initialize(usdc_asset)
+        deferred_initialize(weth_asset)
+
+        resolving = asyncio.ensure_future(
+            v3_strategy._resolve_assets(usdc_asset, weth_asset)
+        )
+        # Both initializations start before either of them is released
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert started == [usdc_asset, weth_asset]
+
+        release.set()
+        assert await resolving == (usdc_asset, weth_asset)
+        assert usdc_asset.data.decimals == 6
+        assert weth_asset.data.decimals == 18
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_skips_pools_below_min_liquidity(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that pools below the liquidity threshold are not quoted."""
+        eth_call = mock_v3_eth_call(
+            v3_strategy,
+            pools={
+                500: "0x1111111111111111111111111111111111111111",
+                3000: "0x2222222222222222222222222222222222222222",
+            },
+            quotes={500: 52 * 10**18, 3000: 51 * 10**18},
+            liquidities={
+                "0x1111111111111111111111111111111111111111": 10,
+                "0x2222222222222222222222222222222222222222": 10**18,
+            },
+        )
+        v3_strategy.min_liquidity = 10**6
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["output_amount"] == Decimal("51")
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+        # Four pool probes, two liquidity reads and a single quote
+        assert eth_call.await_count == 7
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_with_multicall(self, v3_strategy, usdc_asset, weth_asset):
+        """Test that pool probes and quotes share a single multicall."""
+        zero_address = "0x0000000000000000000000000000000000000000"
+        multicall = MagicMock(spec=Multicall)
+        multicall.is_initialized = True
+        multicall.try_aggregate = AsyncMock(
+            return_value=[
+                zero_address,
+                "0x1111111111111111111111111111111111111111",
+                "0x2222222222222222222222222222222222222222",
+                zero_address,
+                None,
+                50 * 10**18,
+                51 * 10**18,
+                None,
+            ]
+        )
+        v3_strategy.multicall = multicall
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        multicall.try_aggregate.assert_awaited_once()
+        assert len(multicall.try_aggregate.call_args.args[0]) == 8
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["output_amount"] == Decimal("51")
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+        v3_strategy.blockchain.web3.eth.call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_with_multicall_skips_pools_below_min_liquidity(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that the multicall path reads pool liquidity after getPool."""
+        zero_address = "0x0000000000000000000000000000000000000000"
+        low_liquidity_pool = "0x1111111111111111111111111111111111111111"
+        liquid_pool = "0x2222222222222222222222222222222222222222"
+        v3_strategy._pool_contracts[low_liquidity_pool] = MagicMock()
+        v3_strategy._pool_contracts[liquid_pool] = MagicMock()
+        v3_strategy.min_liquidity = 10**6
+        multicall = MagicMock(spec=Multicall)
+        multicall.is_initialized = True
+        multicall.try_aggregate = AsyncMock(
+            side_effect=[
+                [
+                    zero_address,
+                    low_liquidity_pool,
+                    liquid_pool,
+                    zero_address,
+                    None,
+                    52 * 10**18,
+                    51 * 10**18,
+                    None,
+                ],
+                [10, 10**18],
+            ]
+        )
+        v3_strategy.multicall = multicall
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        # The second multicall only reads the two quoted pools
+        assert multicall.try_aggregate.await_count == 2
+        assert len(multicall.try_aggregate.call_args.args[0]) == 2
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["output_amount"] == Decimal("51")
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+
+    def test_encode_quote_matches_abi_encoding(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that fixed-width quoter calldata matches the ABI encoding."""
+        selector = bytes.fromhex("f7729d43")
+
+        calldata = v3_strategy._encode_quote(
+            selector, usdc_asset, weth_asset, 3000, 100 * 10**6
+        )
+
+        assert calldata == selector + encode(
+            V3_QUOTE_ARGUMENT_TYPES,
+            [usdc_asset.address.raw, weth_asset.address.raw, 3000, 100 * 10**6, 0],
+        )
+
+    def test_compute_pool_address(self, v3_strategy):
+        """Test local CREATE2 derivation of Uniswap V3 pool addresses."""
+        v3_strategy._pool_init_code_hash = bytes.fromhex(
+            UNISWAP_V3_POOL_INIT_CODE_HASH[2:]
+        )
+        usdc = MockEthereumAsset(
+            symbol="USDC",
+            decimals=6,
+            address="0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        )
+        weth = MockEthereumAsset(
+            symbol="WETH",
+            decimals=18,
+            address="0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        )
+
+        assert (
+            v3_strategy.compute_pool_address(usdc, weth, 3000)
+            == "0x8ad599c3A0ff1De082011EFDDc58f1908eb6e6D8"
+        )
+        assert (
+            v3_strategy.compute_pool_address(weth, usdc, 500)
+            == "0x88e6A0c2dDD26FEEb64F039a2c41296FcB3f5640"
+        )
+
+    def test_compute_pool_address_requires_init_code_hash(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that local derivation is unavailable without an init code hash."""
+        with pytest.raises(ValueError, match="init code hash"):
+            v3_strategy.compute_pool_address(usdc_asset, weth_asset, 3000)
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_with_init_code_hash_skips_pool_lookups(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that derived pool addresses replace the factory getPool probes."""
+        v3_strategy._pool_init_code_hash = bytes.fromhex(
+            UNISWAP_V3_POOL_INIT_CODE_HASH[2:]
+        )
+        eth_call = mock_v3_eth_call(
+            v3_strategy, pools={}, quotes={500: 50 * 10**18, 3000: 51 * 10**18}
+        )
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        # Only the four quoter calls are issued
+        assert eth_call.await_count == 4
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+        assert len(v3_strategy._pool_addresses) == 2
+
+    @pytest.mark.asyncio
+    async def test_quote_swap_multicall_with_init_code_hash_skips_pool_lookups(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that derived pool addresses replace the getPool calls in a multicall."""
+        v3_strategy._pool_init_code_hash = bytes.fromhex(
+            UNISWAP_V3_POOL_INIT_CODE_HASH[2:]
+        )
+        v3_strategy.min_liquidity = 10**6
+        for fee_tier in v3_strategy.fee_tiers:
+            pool_address = v3_strategy.compute_pool_address(
+                usdc_asset, weth_asset, fee_tier
+            )
+            v3_strategy._pool_contracts[pool_address] = MagicMock()
+        multicall = MagicMock(spec=Multicall)
+        multicall.is_initialized = True
+        multicall.try_aggregate = AsyncMock(
+            return_value=[
+                None,
+                52 * 10**18,
+                51 * 10**18,
+                None,
+                None,
+                10,
+                10**18,
+                None,
+            ]
+        )
+        v3_strategy.multicall = multicall
+
+        with (
+            patch("blockchainpype.evm.dapp.uniswap.v3.SwapHop"),
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.SwapRoute"
+            ) as mock_swap_route_class,
+        ):
+            await v3_strategy.quote_swap(
+                input_asset=usdc_asset,
+                output_asset=weth_asset,
+                amount=Decimal("100"),
+                mode=SwapMode.EXACT_INPUT,
+            )
+
+        # Four quotes and four liquidity reads, without any getPool call
+        multicall.try_aggregate.assert_awaited_once()
+        assert len(multicall.try_aggregate.call_args.args[0]) == 8
+        v3_strategy.factory_contract.functions.getPool.assert_not_called()
+        route_kwargs = mock_swap_route_class.call_args.kwargs
+        assert route_kwargs["output_amount"] == Decimal("51")
+        assert route_kwargs["protocol"] == "uniswap_v3_3000"
+        assert len(v3_strategy._pool_addresses) == 2
+
     @pytest.mark.asyncio
     async def test_quote_swap_no_pools(self, v3_strategy, usdc_asset, weth_asset):
         """Test quote swap when no pools exist."""
         # Mock no pools found
-        v3_strategy.factory_contract.functions.getPool.return_value.call.return_value = "0x0000000000000000000000000000000000000000"
+        mock_v3_eth_call(v3_strategy, pools={})
 
         with pytest.raises(ValueError, match="No valid pool found"):
             await v3_strategy.quote_swap(
@@ -700,7 +1305,9 @@ class TestUniswapV3Strategy:
     ):
         """Test getting reserves approximation for V3."""
         # Mock pool address
-        v3_strategy.factory_contract.functions.getPool.return_value.call.return_value = "0x1234567890123456789012345678901234567890"
+        mock_v3_eth_call(
+            v3_strategy, pools={3000: "0x1234567890123456789012345678901234567890"}
+        )
 
         # Mock pool contract
         with (
@@ -718,9 +1325,6 @@ class TestUniswapV3Strategy:
             pool_contract.functions.slot0.return_value.call = AsyncMock(
                 return_value=(79228162514264337593543950336,)
             )  # slot0 - sqrtPriceX96
-            pool_contract.functions.token0.return_value.call = AsyncMock(
-                return_value=str(usdc_asset.address)
-            )  # token0
 
             reserves = await v3_strategy.get_reserves(usdc_asset, weth_asset)
 
@@ -729,48 +1333,210 @@ class TestUniswapV3Strategy:
             assert reserves[1] > 0  # WETH reserves approximation
 
     @pytest.mark.asyncio
-    async def test_build_swap_transaction_v3(self, v3_strategy, mock_wallet):
+    async def test_get_reserves_uses_virtual_reserves(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test the integer virtual-reserve computation from sqrtPriceX96."""
+        mock_v3_eth_call(
+            v3_strategy, pools={3000: "0x1234567890123456789012345678901234567890"}
+        )
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.EthereumSmartContract"
+            ) as mock_pool_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pool_contract = mock_pool_contract.return_value
+            pool_contract.initialize = AsyncMock()
+            pool_contract.functions.liquidity.return_value.call = AsyncMock(
+                return_value=2 * 10**18
+            )
+            # sqrt(P) = 2, so x = L / 2 and y = L * 2
+            pool_contract.functions.slot0.return_value.call = AsyncMock(
+                return_value=(2 << 96,)
+            )
+
+            reserves = await v3_strategy.get_reserves(usdc_asset, weth_asset)
+            reversed_reserves = await v3_strategy.get_reserves(weth_asset, usdc_asset)
+
+        # USDC sorts before WETH, so it is token0 of the pool
+        assert reserves == (Decimal(10**12), Decimal(4))
+        assert reversed_reserves == (Decimal(4), Decimal(10**12))
+        pool_contract.functions.token0.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_price_uses_exact_sqrt_price_ratio(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test the decimals-adjusted spot price derived from sqrtPriceX96."""
+        mock_v3_eth_call(
+            v3_strategy, pools={3000: "0x1234567890123456789012345678901234567890"}
+        )
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.EthereumSmartContract"
+            ) as mock_pool_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pool_contract = mock_pool_contract.return_value
+            pool_contract.initialize = AsyncMock()
+            pool_contract.functions.liquidity.return_value.call = AsyncMock(
+                return_value=2 * 10**18
+            )
+            # sqrt(P) = 2, so one raw USDC unit is worth 4 raw WETH units
+            pool_contract.functions.slot0.return_value.call = AsyncMock(
+                return_value=(2 << 96,)
+            )
+
+            price = await v3_strategy.get_price(usdc_asset, weth_asset)
+            reversed_price = await v3_strategy.get_price(weth_asset, usdc_asset)
+
+        assert price == Decimal(4 * 10**6) / Decimal(10**18)
+        assert reversed_price == Decimal(10**18) / Decimal(4 * 10**6)
+
+    @pytest.mark.asyncio
+    async def test_get_reserves_reuses_pool_address_and_contract(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that pool addresses and pool contracts are cached."""
+        eth_call = mock_v3_eth_call(
+            v3_strategy, pools={3000: "0x1234567890123456789012345678901234567890"}
+        )
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.EthereumSmartContract"
+            ) as mock_pool_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pool_contract = mock_pool_contract.return_value
+            pool_contract.initialize = AsyncMock()
+            pool_contract.functions.liquidity.return_value.call = AsyncMock(
+                return_value=1000000
+            )
+            pool_contract.functions.slot0.return_value.call = AsyncMock(
+                return_value=(79228162514264337593543950336,)
+            )
+
+            await v3_strategy.get_reserves(usdc_asset, weth_asset)
+            await v3_strategy.get_reserves(weth_asset, usdc_asset)
+
+        assert eth_call.await_count == 1
+        assert mock_pool_contract.call_count == 1
+        pool_contract.initialize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_reserves_with_multicall(
+        self, v3_strategy, usdc_asset, weth_asset
+    ):
+        """Test that the pool state is read in a single multicall."""
+        mock_v3_eth_call(
+            v3_strategy, pools={3000: "0x1234567890123456789012345678901234567890"}
+        )
+        multicall = MagicMock(spec=Multicall)
+        multicall.is_initialized = True
+        multicall.try_aggregate = AsyncMock(
+            return_value=[
+                1000000,
+                (79228162514264337593543950336,),
+            ]
+        )
+        v3_strategy.multicall = multicall
+
+        with (
+            patch(
+                "blockchainpype.evm.dapp.uniswap.v3.EthereumSmartContract"
+            ) as mock_pool_contract,
+            patch("financepype.operators.factory.OperatorFactory.get") as mock_factory,
+        ):
+            mock_factory.return_value = MagicMock()
+            pool_contract = mock_pool_contract.return_value
+            pool_contract.initialize = AsyncMock()
+
+            reserves = await v3_strategy.get_reserves(usdc_asset, weth_asset)
+
+        multicall.try_aggregate.assert_awaited_once()
+        pool_contract.functions.liquidity.return_value.call.assert_not_called()
+        assert reserves[0] > 0
+        assert reserves[1] > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("mode", "function_name", "amounts"),
+        [
+            (SwapMode.EXACT_INPUT, "exactInputSingle", (100 * 10**6, 49750 * 10**12)),
+            (SwapMode.EXACT_OUTPUT, "exactOutputSingle", (5 * 10**16, 1005 * 10**5)),
+        ],
+    )
+    async def test_build_swap_transaction_v3(
+        self,
+        v3_strategy,
+        mock_wallet,
+        usdc_asset,
+        weth_asset,
+        mode,
+        function_name,
+        amounts,
+    ):
         """Test building a V3 swap transaction with wallet integration."""
         # Create a mock route using MagicMock
         mock_route = MagicMock()
         mock_route.sequence = [MagicMock()]  # Single hop
-        mock_route.mode = SwapMode.EXACT_INPUT
+        mock_route.mode = mode
         mock_route.max_slippage = Decimal("0.005")
         mock_route.protocol = "uniswap_v3_3000"  # 0.3% fee tier
 
         # Mock the hop properties
         mock_hop = mock_route.sequence[0]
-        mock_hop.input_asset = MagicMock()
-        mock_hop.input_asset.data = MagicMock()
-        mock_hop.input_asset.data.decimals = 6
-        mock_hop.input_asset.address = MagicMock()
-        mock_hop.output_asset = MagicMock()
-        mock_hop.output_asset.data = MagicMock()
-        mock_hop.output_asset.data.decimals = 18
-        mock_hop.output_asset.address = MagicMock()
+        mock_hop.input_asset = usdc_asset
+        mock_hop.output_asset = weth_asset
         mock_hop.input_amount = Decimal("100")
         mock_hop.output_amount = Decimal("0.05")
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v3_strategy.router_contract.functions.exactInputSingle.return_value = (
-            mock_function
+        recipient = AsyncWeb3.to_checksum_address(
+            "0x742d35cc6634c0532925a3b8d2bc7a5fad7b6e4f"
         )
 
         # Test building swap transaction
-        result = await v3_strategy.build_swap_transaction(
-            mock_route,
-            mock_wallet,
-            recipient="0x742d35Cc6634C0532925a3b8D2bC7a5Fad7b6e4F",
-        )
+        with patch(
+            "blockchainpype.evm.dapp.uniswap.v3.time.time", return_value=1_700_000_000
+        ):
+            result = await v3_strategy.build_swap_transaction(
+                mock_route, mock_wallet, recipient=recipient
+            )
 
-        # Verify wallet.build_transaction was called with the contract function
-        mock_wallet.build_transaction.assert_called_once_with(function=mock_function)
+        # The router call is encoded locally, matching the ABI encoding
+        router_abi = await UniswapV3._ROUTER_ABI.get_abi()
+        router = AsyncWeb3().eth.contract(abi=router_abi)
+        expected_calldata = router.encode_abi(
+            function_name,
+            args=[
+                (
+                    usdc_asset.address.raw,
+                    weth_asset.address.raw,
+                    3000,
+                    recipient,
+                    1_700_000_000 + 20 * 60,
+                    *amounts,
+                    0,
+                )
+            ],
+        )
+        tx_data = mock_wallet.build_transaction.call_args.kwargs["tx_data"]
+        assert tx_data["to"] == AsyncWeb3.to_checksum_address(
+            v3_strategy.router_address
+        )
+        assert tx_data["value"] == 0
+        assert "0x" + tx_data["data"].hex() == expected_calldata
+        v3_strategy.router_contract.functions.exactInputSingle.assert_not_called()
 
         # Verify the result is the expected TxParams
-        assert result["to"] == "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
         assert result["gas"] == 200000
-        assert "data" in result
 
     @pytest.mark.asyncio
     async def test_create_swap_transaction_v3(
@@ -801,19 +1567,15 @@ class TestUniswapV3Strategy:
             "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
         )
 
-        # Mock the contract function
-        mock_function = MagicMock()
-        v3_strategy.router_contract.functions.exactInputSingle.return_value = (
-            mock_function
-        )
-
         # Test creating swap transaction
         result = await v3_strategy.create_swap_transaction(
             route=mock_route, wallet=mock_wallet, client_operation_id="test_v3_swap"
         )
 
         # Verify wallet methods were called correctly
-        mock_wallet.build_transaction.assert_called_once_with(function=mock_function)
+        mock_wallet.build_transaction.assert_called_once()
+        tx_data = mock_wallet.build_transaction.call_args.kwargs["tx_data"]
+        assert tx_data["data"][:4] == UniswapV3._EXACT_INPUT_SINGLE_SELECTOR
         mock_wallet.sign_and_send_transaction.assert_called_once()
 
         # Verify the result is an EthereumTransaction
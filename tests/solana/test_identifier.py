@@ -0,0 +1,61 @@
+import gc
+import weakref
+
+import pytest
+from financepype.operators.blockchains.models import BlockchainPlatform
+from pydantic import ValidationError
+from solders.pubkey import Pubkey
+
+from blockchainpype.solana.blockchain.blockchain import SolanaBlockchainType
+from blockchainpype.solana.blockchain.identifier import (
+    SolanaAddress,
+    SolanaPublicKey,
+)
+from blockchainpype.solana.wallet.identifier import SolanaWalletIdentifier
+
+
+def test_from_string_interns_identifiers_per_class() -> None:
+    value = str(Pubkey.new_unique())
+
+    address = SolanaAddress.from_string(value)
+
+    assert SolanaAddress.from_string(value) is address
+    assert address.raw == Pubkey.from_string(value)
+    public_key = SolanaPublicKey.from_string(value)
+    assert type(public_key) is SolanaPublicKey
+    assert public_key is not address
+    assert public_key == address
+
+
+def test_interned_identifiers_are_released_when_unused() -> None:
+    value = str(Pubkey.new_unique())
+    address_ref = weakref.ref(SolanaAddress.from_string(value))
+    gc.collect()
+
+    assert address_ref() is None
+    assert SolanaAddress.from_string(value).string == value
+
+
+def test_from_string_rejects_invalid_public_keys() -> None:
+    with pytest.raises(ValueError, match="Invalid public key: not-a-key"):
+        SolanaAddress.from_string("not-a-key")
+
+
+def test_wallet_identifiers_from_dicts() -> None:
+    platform = BlockchainPlatform(
+        identifier="solana", type=SolanaBlockchainType, chain_id=None
+    )
+    addresses = [SolanaAddress.from_string(str(Pubkey.new_unique())) for _ in range(2)]
+
+    identifiers = SolanaWalletIdentifier.from_dicts(
+        {"platform": platform, "name": f"wallet_{i}", "address": address}
+        for i, address in enumerate(addresses)
+    )
+
+    assert [identifier.address for identifier in identifiers] == addresses
+    assert [identifier.identifier for identifier in identifiers] == [
+        "solana:wallet_0",
+        "solana:wallet_1",
+    ]
+    with pytest.raises(ValidationError):
+        SolanaWalletIdentifier.from_dicts([{"platform": platform, "name": "x"}])
@@ -0,0 +1,42 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from blockchainpype.solana.blockchain.identifier import SolanaAddress
+from blockchainpype.solana.dapp.idl import SolanaLocalFileIDL
+from blockchainpype.solana.dapp.money_market import SolendProgram
+
+
+@pytest.mark.asyncio
+async def test_local_file_idl_parses_each_file_once(tmp_path) -> None:
+    idl_payload = {"version": "0.1.0", "name": "owned", "instructions": {}}
+    (tmp_path / "owned.json").write_text(json.dumps(idl_payload))
+
+    with patch("blockchainpype.solana.dapp.idl.json.load", wraps=json.load) as load:
+        first = await SolanaLocalFileIDL(
+            file_name="owned.json", folder_path=str(tmp_path)
+        ).get_idl()
+        second = await SolanaLocalFileIDL(
+            file_name="owned.json", folder_path=str(tmp_path)
+        ).get_idl()
+
+    assert first == idl_payload
+    assert second is first
+    assert load.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_solend_programs_share_the_parsed_idl() -> None:
+    first = SolendProgram(
+        SolanaAddress.from_string("So1endDq2YkqhipRh3WViPa8hdiSpxWy6z3Z6tMCpAo")
+    )
+    second = SolendProgram(
+        SolanaAddress.from_string("11111111111111111111111111111112")
+    )
+
+    await first.initialize()
+    await second.initialize()
+
+    assert first.idl is second.idl
+    assert "deposit" in first.idl["instructions"]
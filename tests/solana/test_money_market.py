@@ -276,6 +276,65 @@ class TestSolend:
         assert isinstance(transaction, SolanaTransaction)
         assert transaction.client_operation_id == "test-operation"
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("amount", "raw_amount"),
+        [
+            (Decimal("1000"), 1_000_000_000),
+            (Decimal("0.000001"), 1),
+            (Decimal("1.2345678"), 1_234_567),
+        ],
+    )
+    async def test_build_supply_transaction_raw_amount(
+        self, solend, usdc_asset, amount, raw_amount
+    ):
+        """Test that supplied amounts are truncated to raw token units."""
+        solend.program._idl = {"instructions": {"deposit": {}}}
+        solend.program.create_instruction = MagicMock(
+            return_value=Instruction(
+                program_id=Pubkey.from_string(
+                    "So1endDq2YkqhipRh3WViPa8hdiSpxWy6z3Z6tMCpAo"
+                ),
+                accounts=[],
+                data=b"\x00" * 8,
+            )
+        )
+
+        await solend.build_supply_transaction(
+            usdc_asset, amount, "11111111111111111111111111111112"
+        )
+
+        data = solend.program.create_instruction.call_args.kwargs["data"]
+        assert data == raw_amount.to_bytes(8, "little")
+
+    @pytest.mark.asyncio
+    async def test_builders_share_the_owner_identifier(self, solend, usdc_asset):
+        """Test that built transactions reuse the owner identifier of a user."""
+        solend.program._idl = {"instructions": {"deposit": {}, "withdraw": {}}}
+        solend.program.create_instruction = MagicMock(
+            return_value=Instruction(
+                program_id=Pubkey.from_string(
+                    "So1endDq2YkqhipRh3WViPa8hdiSpxWy6z3Z6tMCpAo"
+                ),
+                accounts=[],
+                data=b"\x00" * 8,
+            )
+        )
+        user_address = "11111111111111111111111111111112"
+
+        supply = await solend.build_supply_transaction(
+            usdc_asset, Decimal("1"), user_address
+        )
+        withdraw = await solend.build_withdraw_transaction(
+            usdc_asset, Decimal("1"), user_address
+        )
+
+        assert supply.owner_identifier.platform is Solend._SOLANA_PLATFORM
+        assert withdraw.owner_identifier.platform is Solend._SOLANA_PLATFORM
+        assert supply.owner_identifier.name == user_address
+        assert supply.owner_identifier is withdraw.owner_identifier
+        assert supply.other_data is not withdraw.other_data
+
     @pytest.mark.asyncio
     async def test_build_withdraw_transaction(self, solend, usdc_asset):
         """Test building withdraw transaction."""
@@ -367,6 +426,8 @@ class TestSolend:
 
         assert isinstance(transaction, SolanaTransaction)
         assert transaction.client_operation_id == "test-operation"
+        data = solend.program.create_instruction.call_args.kwargs["data"]
+        assert data == b"\xff" * 8
 
     @pytest.mark.asyncio
     async def test_build_collateral_transaction_enable(self, solend, usdc_asset):
@@ -525,6 +586,25 @@ class TestSolendErrorHandling:
         market_data = await solend_no_init.get_market_data(usdc_asset)
         assert market_data.protocol == "Solend"
 
+    @pytest.mark.asyncio
+    async def test_failed_initialization_is_retried(self, solend_no_init, usdc_asset):
+        """Test that a failed initialization does not stick for later calls."""
+        program = solend_no_init.program
+
+        async def initialize():
+            if program.initialize.await_count == 1:
+                raise ValueError("IDL unavailable")
+            program._idl = {"instructions": {}}
+
+        program.initialize = AsyncMock(side_effect=initialize)
+
+        with pytest.raises(ValueError, match="IDL unavailable"):
+            await solend_no_init.get_market_data(usdc_asset)
+
+        market_data = await solend_no_init.get_market_data(usdc_asset)
+        assert market_data.protocol == "Solend"
+        assert program.initialize.await_count == 2
+
     @pytest.mark.asyncio
     async def test_instruction_creation_with_accounts(
         self, solend_protocol, mock_blockchain, test_platform
@@ -0,0 +1,262 @@
+from unittest.mock import MagicMock
+
+import pytest
+from eth_account import Account
+from financepype.platforms.blockchain import BlockchainPlatform
+from pydantic import SecretStr
+from web3 import AsyncWeb3
+
+from blockchainpype.evm.blockchain.blockchain import (
+    EthereumBlockchain,
+    EthereumBlockchainType,
+)
+from blockchainpype.evm.blockchain.configuration import (
+    EthereumBlockchainConfiguration,
+    EthereumConnectivityConfiguration,
+    EthereumNativeAssetConfiguration,
+)
+from blockchainpype.evm.blockchain.gas import GasConfiguration
+from blockchainpype.evm.blockchain.identifier import EthereumAddress
+from blockchainpype.evm.wallet.identifier import EthereumWalletIdentifier
+from blockchainpype.evm.wallet.signer import EthereumSignerConfiguration
+from blockchainpype.evm.wallet.wallet import EthereumWalletConfiguration
+from blockchainpype.factory import BlockchainFactory, WalletFactory, WalletRegistry
+from blockchainpype.solana.blockchain.blockchain import (
+    SolanaBlockchain,
+    SolanaBlockchainType,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test its own wallet registry and factory caches."""
+    monkeypatch.setattr(WalletRegistry, "_entries", {})
+    monkeypatch.setattr(WalletFactory, "_wallet_classes", {})
+    monkeypatch.setattr(WalletFactory, "_wallet_instances", {})
+    monkeypatch.setattr(BlockchainFactory, "_blockchain_classes", {})
+    monkeypatch.setattr(BlockchainFactory, "_platform_class_mapping", {})
+    monkeypatch.setattr(BlockchainFactory, "_configurations", {})
+    monkeypatch.setattr(BlockchainFactory, "_cache", {})
+
+
+def make_wallet_configuration(name: str) -> EthereumWalletConfiguration:
+    account = Account.create()
+    return EthereumWalletConfiguration(
+        identifier=EthereumWalletIdentifier(
+            platform=BlockchainPlatform(
+                identifier="ethereum",
+                type=EthereumBlockchainType,
+                chain_id=1,
+            ),
+            name=name,
+            address=EthereumAddress.from_string(account.address),
+        ),
+        signer=EthereumSignerConfiguration(private_key=SecretStr(account.key.hex())),
+        gas_configuration=GasConfiguration(),
+    )
+
+
+def test_register_many_registers_all_configurations() -> None:
+    configs = [make_wallet_configuration(f"wallet_{i}") for i in range(3)]
+
+    WalletRegistry.register_many(configs)
+
+    for config in configs:
+        identifier = config.identifier.identifier
+        assert WalletRegistry.get(identifier) is config
+        assert WalletRegistry.get_platform_type(identifier) == EthereumBlockchainType
+        assert WalletRegistry.get_entry(identifier) == (
+            config,
+            EthereumBlockchainType,
+        )
+
+
+def test_register_many_rejects_duplicates_without_partial_registration() -> None:
+    existing = make_wallet_configuration("existing")
+    WalletRegistry.register(existing)
+
+    with pytest.raises(ValueError, match="already exists"):
+        WalletRegistry.register_many([make_wallet_configuration("new"), existing])
+
+    assert list(WalletRegistry.list()) == [existing.identifier.identifier]
+
+
+def test_wallet_factory_create_reuses_cached_instance() -> None:
+    config = make_wallet_configuration("cached")
+    WalletRegistry.register(config)
+    wallet_class = MagicMock()
+    WalletFactory.register_wallet_class(EthereumBlockchainType, wallet_class)
+
+    first = WalletFactory.create(config.identifier)
+    second = WalletFactory.create(config.identifier.identifier)
+
+    assert first is second
+    wallet_class.assert_called_once_with(configuration=config)
+
+
+def test_register_configuration_registers_blockchain_class_for_type() -> None:
+    BlockchainFactory.register_blockchain_class_for_type(
+        EthereumBlockchain, EthereumBlockchainType
+    )
+    configuration = EthereumBlockchainConfiguration(
+        platform=BlockchainPlatform(
+            identifier="testchain",
+            type=EthereumBlockchainType,
+            chain_id=1337,
+        ),
+        native_asset=EthereumNativeAssetConfiguration(),
+        connectivity=EthereumConnectivityConfiguration(
+            rpc_provider=AsyncWeb3.AsyncHTTPProvider("http://127.0.0.1:8545/"),
+        ),
+        explorer=None,
+    )
+
+    BlockchainFactory.register_configuration(configuration)
+
+    assert (
+        BlockchainFactory._platform_class_mapping[configuration.platform]
+        is EthereumBlockchain
+    )
+    assert BlockchainFactory.get_configuration(configuration.platform) is (
+        configuration
+    )
+
+
+def test_get_by_identifier_uses_the_platform_index() -> None:
+    BlockchainFactory.register_blockchain_class_for_type(
+        EthereumBlockchain, EthereumBlockchainType
+    )
+    configuration = EthereumBlockchainConfiguration(
+        platform=BlockchainPlatform(
+            identifier="indexed",
+            type=EthereumBlockchainType,
+            chain_id=1337,
+        ),
+        native_asset=EthereumNativeAssetConfiguration(),
+        connectivity=EthereumConnectivityConfiguration(
+            rpc_provider=AsyncWeb3.AsyncHTTPProvider("http://127.0.0.1:8545/"),
+        ),
+        explorer=None,
+    )
+    BlockchainFactory.register_configuration(configuration)
+
+    blockchain = BlockchainFactory.get_evm_blockchain_by_identifier("indexed")
+
+    assert isinstance(blockchain, EthereumBlockchain)
+    assert BlockchainFactory.get_by_identifier("indexed") is blockchain
+    with pytest.raises(ValueError, match="No operator class found"):
+        BlockchainFactory.get_by_identifier("unknown")
+
+    # Registering another platform with the same identifier refreshes the index
+    BlockchainFactory.register_operator_class(
+        BlockchainPlatform(
+            identifier="indexed", type=EthereumBlockchainType, chain_id=1
+        ),
+        EthereumBlockchain,
+    )
+    with pytest.raises(ValueError, match="Multiple operator classes found"):
+        BlockchainFactory.get_by_identifier("indexed")
+
+
+def test_get_by_identifier_sees_direct_changes_to_the_platform_mapping() -> None:
+    BlockchainFactory.register_blockchain_class_for_type(
+        EthereumBlockchain, EthereumBlockchainType
+    )
+    platform = BlockchainPlatform(
+        identifier="direct", type=EthereumBlockchainType, chain_id=1337
+    )
+    configuration = EthereumBlockchainConfiguration(
+        platform=platform,
+        native_asset=EthereumNativeAssetConfiguration(),
+        connectivity=EthereumConnectivityConfiguration(
+            rpc_provider=AsyncWeb3.AsyncHTTPProvider("http://127.0.0.1:8545/"),
+        ),
+        explorer=None,
+    )
+    BlockchainFactory.register_configuration(configuration)
+    with pytest.raises(ValueError, match="No operator class found"):
+        BlockchainFactory.get_by_identifier("other")
+
+    # Swap a platform without changing the number of registered platforms
+    other = BlockchainPlatform(
+        identifier="other", type=EthereumBlockchainType, chain_id=1338
+    )
+    del BlockchainFactory._platform_class_mapping[platform]
+    BlockchainFactory._platform_class_mapping[other] = EthereumBlockchain
+    with pytest.raises(ValueError, match="No configuration registered"):
+        BlockchainFactory.get_by_identifier("other")
+    with pytest.raises(ValueError, match="No operator class found"):
+        BlockchainFactory.get_by_identifier("direct")
+
+    BlockchainFactory.reset()
+    with pytest.raises(ValueError, match="No operator class found"):
+        BlockchainFactory.get_by_identifier("other")
+
+
+def test_get_blockchain_types_is_refreshed_on_registration() -> None:
+    BlockchainFactory.register_blockchain_class_for_type(
+        EthereumBlockchain, EthereumBlockchainType
+    )
+    blockchain_types = BlockchainFactory.get_blockchain_types()
+
+    assert blockchain_types == (EthereumBlockchainType,)
+    assert BlockchainFactory.get_blockchain_types() is blockchain_types
+
+    BlockchainFactory.register_blockchain_class_for_type(
+        SolanaBlockchain, SolanaBlockchainType
+    )
+
+    assert BlockchainFactory.get_blockchain_types() == (
+        EthereumBlockchainType,
+        SolanaBlockchainType,
+    )
+
+
+def test_create_from_config_shares_the_instance_cache() -> None:
+    config = make_wallet_configuration("shared")
+    WalletRegistry.register(config)
+    wallet_class = MagicMock()
+    WalletFactory.register_wallet_class(EthereumBlockchainType, wallet_class)
+
+    from_config = WalletFactory.create_from_config(config)
+
+    assert WalletFactory.create(config.identifier.identifier) is from_config
+    assert WalletFactory.get_instance(config.identifier.identifier) is from_config
+    wallet_class.assert_called_once_with(configuration=config)
+
+
+def test_create_raises_for_unknown_wallet_class() -> None:
+    config = make_wallet_configuration("unsupported")
+    WalletRegistry.register(config)
+
+    with pytest.raises(ValueError, match="Wallet class not found"):
+        WalletFactory.create(config.identifier)
+
+
+def test_list_returns_a_copy_refreshed_on_registration() -> None:
+    first = make_wallet_configuration("first")
+    WalletRegistry.register(first)
+    configurations = WalletRegistry.list()
+
+    assert configurations == {first.identifier.identifier: first}
+    configurations.clear()
+    assert WalletRegistry.get(first.identifier.identifier) is first
+
+    second = make_wallet_configuration("second")
+    WalletRegistry.register(second)
+
+    assert set(WalletRegistry.list()) == {
+        first.identifier.identifier,
+        second.identifier.identifier,
+    }
+
+
+def test_register_rejects_duplicates_and_keeps_the_first_configuration() -> None:
+    config = make_wallet_configuration("duplicate")
+    WalletRegistry.register(config)
+    duplicate = config.model_copy()
+
+    with pytest.raises(ValueError, match="already exists"):
+        WalletRegistry.register(duplicate)
+
+    assert WalletRegistry.get(config.identifier.identifier) is config
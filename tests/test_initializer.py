@@ -0,0 +1,97 @@
+import pytest
+
+from blockchainpype.evm.blockchain.blockchain import (
+    EthereumBlockchain,
+    EthereumBlockchainType,
+)
+from blockchainpype.factory import BlockchainFactory
+from blockchainpype.initializer import BlockchainConfigurations, BlockchainsInitializer
+
+
+class ExtendedBlockchainConfigurations(BlockchainConfigurations):
+    @classmethod
+    def testnet_configuration(cls) -> None:
+        return None
+
+
+def test_configurations_methods_are_discovered_per_class() -> None:
+    assert BlockchainConfigurations.configurations_methods() == [
+        "ethereum_configuration",
+        "hardhat_configuration",
+        "solana_configuration",
+    ]
+    assert ExtendedBlockchainConfigurations.configurations_methods() == [
+        "ethereum_configuration",
+        "hardhat_configuration",
+        "solana_configuration",
+        "testnet_configuration",
+    ]
+
+
+def test_configurations_methods_returns_a_copy() -> None:
+    methods = ExtendedBlockchainConfigurations.configurations_methods()
+    methods.clear()
+
+    assert "testnet_configuration" in (
+        ExtendedBlockchainConfigurations.configurations_methods()
+    )
+    assert ExtendedBlockchainConfigurations.get_configurations()["testnet"] is None
+
+
+def test_configure_prewarms_registered_blockchains(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(BlockchainFactory, "_blockchain_classes", {})
+    monkeypatch.setattr(BlockchainFactory, "_platform_class_mapping", {})
+    monkeypatch.setattr(BlockchainFactory, "_configurations", {})
+    monkeypatch.setattr(BlockchainFactory, "_cache", {})
+
+    BlockchainsInitializer.configure(
+        blockchain_types=[EthereumBlockchainType], prewarm=True
+    )
+
+    cached_platforms = {platform for _, platform in BlockchainFactory._cache}
+    assert {platform.identifier for platform in cached_platforms} == {
+        "ethereum",
+        "hardhat",
+    }
+    ethereum = BlockchainFactory.get_evm_blockchain_by_identifier("ethereum")
+    assert isinstance(ethereum, EthereumBlockchain)
+    assert BlockchainFactory.get_cache_info()["cache_size"] == 2
+
+
+def test_configurations_are_built_once_per_class() -> None:
+    first = BlockchainConfigurations.get_configurations()
+    second = BlockchainConfigurations.get_configurations()
+
+    assert isinstance(first, dict)
+    assert first is not second
+    assert first == second
+    assert first["ethereum"] is BlockchainConfigurations.ethereum_configuration()
+
+    second["ethereum"] = None
+    assert BlockchainConfigurations.get_configurations()["ethereum"] is not None
+
+    BlockchainConfigurations.clear_cache()
+
+    rebuilt = BlockchainConfigurations.ethereum_configuration()
+    assert rebuilt is not first["ethereum"]
+    assert rebuilt.platform == first["ethereum"].platform
+
+
+def test_ethereum_configuration_follows_the_etherscan_api_key(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("ETHERSCAN_API_KEY", "first-key")
+    first = BlockchainConfigurations.ethereum_configuration()
+    assert first is BlockchainConfigurations.ethereum_configuration()
+
+    monkeypatch.setenv("ETHERSCAN_API_KEY", "second-key")
+    second = BlockchainConfigurations.ethereum_configuration()
+
+    assert second is not first
+    assert second.explorer.api_key.get_secret_value() == "second-key"
+    assert first.explorer.api_key.get_secret_value() == "first-key"
+    assert BlockchainConfigurations.hardhat_configuration() is (
+        BlockchainConfigurations.hardhat_configuration()
+    )